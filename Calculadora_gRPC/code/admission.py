@@ -0,0 +1,309 @@
+import math
+import threading
+import time
+
+import grpc
+
+from interceptors import replace_behavior
+
+
+# Mensagem enviada ao cliente quando a chamada é rejeitada
+OVERLOAD_MESSAGE = "Servidor sobrecarregado: limite de concorrência de {method} atingido ({limit})"
+QUEUE_TIMEOUT_MESSAGE = "Servidor sobrecarregado: requisição aguardou {waited_ms:.1f} ms na fila"
+
+
+def method_short_name(method):
+    """
+    Nome curto de um método gRPC ('/calculator.Calculator/Add' -> 'Add')
+    """
+    return method.rsplit('/', 1)[-1]
+
+
+class ConcurrencyLimit:
+    """
+    Limite fixo de chamadas simultâneas de um método
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """
+        Reserva uma vaga para a chamada
+
+        Returns:
+            True se a chamada foi admitida, False se o limite foi atingido
+        """
+        with self._lock:
+            if self.in_flight >= self.current_limit():
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency):
+        """
+        Libera a vaga de uma chamada admitida
+
+        Args:
+            latency: Duração da chamada desde a chegada, em segundos
+        """
+        with self._lock:
+            self.in_flight -= 1
+
+    def current_limit(self):
+        """Limite em vigor (inteiro)"""
+        return self.limit
+
+    def snapshot(self):
+        """
+        Returns:
+            Dicionário com limit, in_flight e rejected
+        """
+        with self._lock:
+            return {'limit': self.current_limit(), 'in_flight': self.in_flight, 'rejected': self.rejected}
+
+
+class AdaptiveConcurrencyLimit(ConcurrencyLimit):
+    """
+    Limite de concorrência ajustado pela latência observada (gradiente)
+    Compara a latência recente (média curta) com a de referência (média longa):
+    se a recente sobe além da tolerância, o limite diminui na mesma proporção;
+    caso contrário cresce em ~sqrt(limite) por ajuste. Sem carga suficiente para
+    usar metade do limite, o limite não cresce
+    """
+
+    def __init__(self, initial_limit=20, min_limit=1, max_limit=1000,
+                 tolerance=1.5, smoothing=0.2, long_window=600):
+        """
+        Args:
+            initial_limit: Limite inicial
+            min_limit: Menor limite permitido
+            max_limit: Maior limite permitido
+            tolerance: Aumento aceito da latência recente sobre a de referência
+            smoothing: Peso de cada novo ajuste (0 a 1)
+            long_window: Número aproximado de amostras da média de referência
+        """
+        super().__init__(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._long_alpha = 1.0 / long_window
+        self._short_alpha = 0.1
+        self._short = None
+        self._long = None
+
+    def release(self, latency):
+        with self._lock:
+            in_flight = self.in_flight
+            self.in_flight -= 1
+            if self._short is None:
+                self._short = self._long = latency
+                return
+            self._short += self._short_alpha * (latency - self._short)
+            self._long += self._long_alpha * (latency - self._long)
+
+            # Referência muito acima do atual (a carga caiu): acelera a convergência
+            if self._long > 2 * self._short:
+                self._long *= 0.95
+
+            if in_flight < self.limit / 2:
+                return
+            gradient = max(0.5, min(1.0, self.tolerance * self._long / max(self._short, 1e-9)))
+            target = gradient * self.limit + math.sqrt(self.limit)
+            limit = self.limit * (1 - self.smoothing) + target * self.smoothing
+            self.limit = max(self.min_limit, min(self.max_limit, limit))
+
+    def current_limit(self):
+        return int(self.limit)
+
+
+class AdmissionController:
+    """
+    Limites de concorrência por método e descarte de requisições antigas
+    Métodos sem limite configurado (e sem default_limit) não são controlados
+    """
+
+    def __init__(self, method_limits=None, default_limit=None, adaptive=False,
+                 max_queue_time=None, min_limit=1, max_limit=1000):
+        """
+        Args:
+            method_limits: Dicionário nome curto do método -> limite (ex.: {'Evaluate': 4})
+            default_limit: Limite dos métodos não listados (None: sem limite)
+            adaptive: Se True, os limites são iniciais e passam a ser ajustados
+                      pela latência (AdaptiveConcurrencyLimit)
+            max_queue_time: Rejeita chamadas que esperaram mais que isso (segundos)
+                            entre a chegada e o início do handler
+            min_limit: Menor limite do modo adaptativo
+            max_limit: Maior limite do modo adaptativo
+        """
+        self.method_limits = dict(method_limits or {})
+        self.default_limit = default_limit
+        self.adaptive = adaptive
+        self.max_queue_time = max_queue_time
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, method):
+        """
+        Limite do método (criado no primeiro uso), ou None se não houver
+        """
+        if method in self._limits:
+            return self._limits[method]
+        limit = self.method_limits.get(method_short_name(method), self.default_limit)
+        if limit is not None:
+            if self.adaptive:
+                limit = AdaptiveConcurrencyLimit(limit, self.min_limit, self.max_limit)
+            else:
+                limit = ConcurrencyLimit(limit)
+        with self._lock:
+            return self._limits.setdefault(method, limit)
+
+    def admit(self, method, arrival):
+        """
+        Decide se uma chamada pode executar
+
+        Args:
+            method: Nome completo do método
+            arrival: Instante de chegada (time.perf_counter)
+        Returns:
+            None se admitida, ou a mensagem de rejeição
+        """
+        if self.max_queue_time is not None:
+            waited = time.perf_counter() - arrival
+            if waited > self.max_queue_time:
+                return QUEUE_TIMEOUT_MESSAGE.format(waited_ms=waited * 1000)
+        limit = self.limit_for(method)
+        if limit is not None and not limit.try_acquire():
+            return OVERLOAD_MESSAGE.format(method=method_short_name(method), limit=limit.current_limit())
+        return None
+
+    def release(self, method, arrival):
+        """
+        Libera a vaga de uma chamada admitida
+        """
+        limit = self._limits.get(method)
+        if limit is not None:
+            limit.release(time.perf_counter() - arrival)
+
+    def snapshot(self):
+        """
+        Returns:
+            Dicionário método -> {limit, in_flight, rejected}
+        """
+        with self._lock:
+            limits = sorted(self._limits.items())
+        return {method: limit.snapshot() for method, limit in limits if limit is not None}
+
+
+def parse_method_limits(values):
+    """
+    Converte opções "Metodo=N" da linha de comando em dicionário
+
+    Args:
+        values: Lista de strings, ex.: ['Evaluate=4', 'DivBatch=2']
+    Returns:
+        Dicionário nome do método -> limite
+    """
+    limits = {}
+    for value in values or []:
+        method, _, limit = value.partition('=')
+        if not method or not limit.isdigit():
+            raise ValueError(f"Limite inválido: {value!r} (use Metodo=N)")
+        limits[method] = int(limit)
+    return limits
+
+
+class AdmissionInterceptor(grpc.ServerInterceptor):
+    """
+    Interceptor de controle de admissão (servidor síncrono)
+    O instante de chegada é registrado quando a chamada é recebida, antes da
+    fila do executor; a vaga é reservada apenas quando o handler começa, para
+    que chamadas canceladas na fila não deixem vagas presas.
+    Chamadas rejeitadas terminam com RESOURCE_EXHAUSTED sem executar o handler
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        controller = self.controller
+        method = handler_call_details.method
+        arrival = time.perf_counter()
+
+        if handler.response_streaming:
+            def wrap(behavior):
+                def wrapper(request, context):
+                    rejection = controller.admit(method, arrival)
+                    if rejection is not None:
+                        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, rejection)
+                    try:
+                        yield from behavior(request, context)
+                    finally:
+                        controller.release(method, arrival)
+                return wrapper
+        else:
+            def wrap(behavior):
+                def wrapper(request, context):
+                    rejection = controller.admit(method, arrival)
+                    if rejection is not None:
+                        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, rejection)
+                    try:
+                        return behavior(request, context)
+                    finally:
+                        controller.release(method, arrival)
+                return wrapper
+
+        return replace_behavior(handler, wrap)
+
+
+class AsyncAdmissionInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Versão asyncio do AdmissionInterceptor
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        controller = self.controller
+        method = handler_call_details.method
+        arrival = time.perf_counter()
+
+        if handler.response_streaming:
+            def wrap(behavior):
+                async def wrapper(request, context):
+                    rejection = controller.admit(method, arrival)
+                    if rejection is not None:
+                        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, rejection)
+                    try:
+                        async for response in behavior(request, context):
+                            yield response
+                    finally:
+                        controller.release(method, arrival)
+                return wrapper
+        else:
+            def wrap(behavior):
+                async def wrapper(request, context):
+                    rejection = controller.admit(method, arrival)
+                    if rejection is not None:
+                        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, rejection)
+                    try:
+                        return await behavior(request, context)
+                    finally:
+                        controller.release(method, arrival)
+                return wrapper
+
+        return replace_behavior(handler, wrap)
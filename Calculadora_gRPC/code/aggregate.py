@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+
+
+class RunningStats:
+    """
+    Agregados de um stream de números em memória constante:
+    contagem, soma, média, mínimo, máximo e variância
+    Cada bloco é resumido com NumPy (média e soma dos quadrados dos desvios em
+    duas passadas) e combinado ao acumulado pela fórmula de Chan et al., que
+    não sofre o cancelamento catastrófico de sum(x²) - sum(x)²/n
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values):
+        """
+        Acrescenta um bloco de valores
+
+        Args:
+            values: Array NumPy float64 (ou sequência de números)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        count = values.size
+        if count == 0:
+            return
+        mean = float(values.mean())
+        m2 = float(np.square(values - mean).sum())
+        self._combine(count, float(values.sum()), mean, m2,
+                      float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        """
+        Combina os agregados de outro RunningStats (ex.: de outro shard)
+        """
+        if other.count:
+            self._combine(other.count, other.sum, other.mean, other.m2, other.min, other.max)
+
+    def _combine(self, count, total, mean, m2, minimum, maximum):
+        """
+        Combina um resumo (n, soma, média, M2, mín, máx) ao acumulado
+        """
+        if self.count == 0:
+            self.count, self.sum, self.mean, self.m2 = count, total, mean, m2
+            self.min, self.max = minimum, maximum
+            return
+        combined = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined
+        self.m2 += m2 + delta * delta * self.count * count / combined
+        self.count = combined
+        self.sum += total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    def variance(self, ddof=0):
+        """
+        Variância populacional (ddof=0) ou amostral (ddof=1)
+
+        Returns:
+            Variância, ou NaN se não houver valores suficientes
+        """
+        if self.count <= ddof:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def to_dict(self):
+        """
+        Returns:
+            Dicionário com count, sum, mean, min, max, variance e
+            sample_variance (NaN nos campos indefinidos para stream vazio)
+        """
+        empty = self.count == 0
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': math.nan if empty else self.mean,
+            'min': math.nan if empty else self.min,
+            'max': math.nan if empty else self.max,
+            'variance': self.variance(0),
+            'sample_variance': self.variance(1),
+        }
@@ -0,0 +1,168 @@
+import itertools
+import threading
+import time
+
+import grpc
+
+
+# Políticas de balanceamento disponíveis
+LB_POLICIES = ('round_robin', 'least_outstanding')
+
+# Códigos que indicam problema no backend (e não na requisição)
+BACKEND_FAILURE_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+})
+
+# Falhas consecutivas que causam a ejeção de um backend
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Tempo base de ejeção, em segundos (multiplicado a cada ejeção seguida)
+DEFAULT_EJECTION_TIME = 5.0
+
+# Tempo máximo de ejeção, em segundos
+MAX_EJECTION_TIME = 60.0
+
+
+class Backend:
+    """
+    Um servidor (canal + stub) com contadores de carga e de saúde
+    """
+
+    def __init__(self, target, channel, stub):
+        self.target = target
+        self.channel = channel
+        self.stub = stub
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    def is_available(self, now):
+        """True se o backend não está ejetado"""
+        return now >= self.ejected_until
+
+
+class LoadBalancer:
+    """
+    Balanceamento de carga no cliente entre uma lista estática de backends
+    Políticas: round_robin (rodízio) e least_outstanding (menos requisições
+    pendentes). Backends com falhas consecutivas são ejetados por um tempo
+    crescente; se todos estiverem ejetados, todos voltam a ser usados
+    """
+
+    def __init__(self, backends, policy='round_robin',
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 ejection_time=DEFAULT_EJECTION_TIME):
+        """
+        Args:
+            backends: Lista de Backend
+            policy: 'round_robin' ou 'least_outstanding'
+            failure_threshold: Falhas consecutivas até a ejeção (0 desativa)
+            ejection_time: Tempo base de ejeção, em segundos
+        """
+        if policy not in LB_POLICIES:
+            raise ValueError(f"Política inválida: {policy} (use {', '.join(LB_POLICIES)})")
+        if not backends:
+            raise ValueError("Informe ao menos um backend")
+        self.backends = backends
+        self.policy = policy
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def acquire(self, exclude=()):
+        """
+        Escolhe o backend da próxima chamada e a marca como pendente nele
+
+        Args:
+            exclude: Targets a evitar (ex.: onde a chamada já falhou); são
+                     usados apenas se não houver outro backend disponível
+        Returns:
+            Backend escolhido (devolver com release)
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [backend for backend in self.backends if backend.is_available(now)]
+            if not candidates:
+                candidates = self.backends
+            if exclude:
+                candidates = [backend for backend in candidates if backend.target not in exclude] or candidates
+            start = next(self._counter) % len(candidates)
+            if self.policy == 'least_outstanding':
+                # Empates são desfeitos em rodízio a partir de `start`
+                rotated = candidates[start:] + candidates[:start]
+                backend = min(rotated, key=lambda candidate: candidate.outstanding)
+            else:
+                backend = candidates[start]
+            backend.outstanding += 1
+            backend.requests += 1
+        return backend
+
+    def release(self, backend, code):
+        """
+        Registra o fim de uma chamada e atualiza a saúde do backend
+        Chamadas canceladas (CANCELLED) são neutras: não zeram nem somam falhas
+
+        Args:
+            backend: Backend retornado por acquire
+            code: grpc.StatusCode final da chamada
+        """
+        with self._lock:
+            backend.outstanding -= 1
+            if code == grpc.StatusCode.CANCELLED:
+                # Cancelada pelo próprio cliente (ex.: cópia de hedging que perdeu):
+                # não diz nada sobre a saúde do backend
+                return
+            if code not in BACKEND_FAILURE_CODES:
+                backend.consecutive_failures = 0
+                backend.ejections = 0
+                return
+            backend.failures += 1
+            backend.consecutive_failures += 1
+            if self.failure_threshold and backend.consecutive_failures >= self.failure_threshold:
+                backend.ejections += 1
+                duration = min(self.ejection_time * backend.ejections, MAX_EJECTION_TIME)
+                backend.ejected_until = time.monotonic() + duration
+                backend.consecutive_failures = 0
+
+    def next_backend(self):
+        """
+        Escolhe um backend sem contabilizar a chamada (streams longos)
+        """
+        backend = self.acquire()
+        with self._lock:
+            backend.outstanding -= 1
+        return backend
+
+    def snapshot(self):
+        """
+        Returns:
+            Lista de dicionários por backend: target, outstanding, requests,
+            failures e ejected (segundos restantes de ejeção, 0 se ativo)
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'target': backend.target,
+                    'outstanding': backend.outstanding,
+                    'requests': backend.requests,
+                    'failures': backend.failures,
+                    'ejected': max(0.0, backend.ejected_until - now),
+                }
+                for backend in self.backends
+            ]
+
+
+def call_code(call):
+    """
+    Código de status final de uma chamada concluída (grpc.Future/grpc.Call)
+    """
+    if call.cancelled():
+        return grpc.StatusCode.CANCELLED
+    return call.code()
@@ -0,0 +1,195 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import grpc
+
+import calculator_pb2
+
+
+# Tamanho máximo padrão de um lote automático
+DEFAULT_MAX_BATCH_SIZE = 128
+
+# Espera máxima padrão antes de enviar um lote incompleto, em segundos
+DEFAULT_MAX_DELAY = 0.002
+
+# Método em lote correspondente a cada operação do cliente
+BATCH_METHODS = {
+    'add': 'AddBatch',
+    'sub': 'SubBatch',
+    'mul': 'MulBatch',
+    'div': 'DivBatch',
+}
+
+# Mensagem dos elementos com erro em um lote (apenas divisão por zero)
+ELEMENT_ERROR = "Erro: Divisão por zero não permitida"
+
+
+class BatchDeadlineError(grpc.RpcError):
+    """
+    Prazo do chamador esgotado antes da resposta do lote
+    Mesma interface de um grpc.RpcError com DEADLINE_EXCEEDED
+    """
+
+    def code(self):
+        return grpc.StatusCode.DEADLINE_EXCEEDED
+
+    def details(self):
+        return "Deadline Exceeded"
+
+
+class MicroBatcher:
+    """
+    Agrupa chamadas unárias concorrentes em RPCs de lote (AddBatch, ...)
+    Cada operação tem seu lote pendente; o lote é enviado quando atinge
+    max_batch_size ou quando o primeiro elemento espera max_delay, o que
+    ocorrer primeiro. Cada chamador recebe a sua própria resposta.
+    O prazo da RPC de lote é o mais curto entre os prazos dos seus elementos
+    """
+
+    def __init__(self, send, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_delay=DEFAULT_MAX_DELAY):
+        """
+        Args:
+            send: Função send(method_name, request, timeout) -> grpc.Future que
+                  dispara a chamada de lote (ex.: CalculatorClient._submit)
+            max_batch_size: Número de operações que dispara o envio imediato
+            max_delay: Espera máxima de um lote incompleto, em segundos
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size deve ser >= 1")
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._send_call = send
+        # operação -> (instante limite, lista de (num1, num2, Future, prazo))
+        self._pending = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="micro-batcher", daemon=True)
+        self._flusher.start()
+
+    def submit(self, operation, num1, num2, timeout=None):
+        """
+        Enfileira uma operação no lote pendente
+
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            num1: Primeiro operando
+            num2: Segundo operando
+            timeout: Prazo da operação, em segundos (None: sem prazo próprio)
+        Returns:
+            concurrent.futures.Future com a OperationResponse do elemento;
+            falhas do lote inteiro são propagadas como grpc.RpcError
+        """
+        future = Future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        full = None
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MicroBatcher encerrado")
+            batch = self._pending.get(operation)
+            if batch is None:
+                batch = (time.monotonic() + self.max_delay, [])
+                self._pending[operation] = batch
+                self._condition.notify()
+            batch[1].append((num1, num2, future, deadline))
+            if len(batch[1]) >= self.max_batch_size:
+                full = self._pending.pop(operation)[1]
+        if full is not None:
+            self._dispatch(operation, full)
+        return future
+
+    def call(self, operation, num1, num2, timeout=None):
+        """
+        Versão bloqueante de submit
+
+        Args:
+            timeout: Prazo da operação, em segundos (None: sem prazo próprio)
+        Returns:
+            OperationResponse do elemento
+        Raises:
+            grpc.RpcError: Se o lote falhar ou o prazo esgotar (DEADLINE_EXCEEDED)
+        """
+        try:
+            return self.submit(operation, num1, num2, timeout).result(timeout)
+        except FutureTimeoutError:
+            raise BatchDeadlineError() from None
+
+    def _flush_loop(self):
+        """
+        Thread que envia os lotes cujo prazo expirou
+        """
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    expired = [operation for operation, (deadline, _) in self._pending.items()
+                               if deadline <= now]
+                    if expired:
+                        break
+                    if self._pending:
+                        earliest = min(deadline for deadline, _ in self._pending.values())
+                        self._condition.wait(earliest - now)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    expired = list(self._pending)
+                batches = [(operation, self._pending.pop(operation)[1]) for operation in expired]
+            for operation, items in batches:
+                self._dispatch(operation, items)
+            if self._closed:
+                return
+
+    def _dispatch(self, operation, items):
+        """
+        Envia um lote sem bloquear; as respostas são distribuídas no callback
+        O prazo da RPC é o do elemento com o prazo mais curto
+        """
+        request = calculator_pb2.BatchRequest(
+            num1=[num1 for num1, _, _, _ in items],
+            num2=[num2 for _, num2, _, _ in items]
+        )
+        deadlines = [deadline for _, _, _, deadline in items if deadline is not None]
+        timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        try:
+            call = self._send_call(BATCH_METHODS[operation], request, timeout)
+        except Exception as e:
+            for _, _, future, _ in items:
+                future.set_exception(e)
+            return
+        call.add_done_callback(lambda call: self._distribute(call, items))
+
+    @staticmethod
+    def _distribute(call, items):
+        """
+        Entrega a cada chamador o resultado da sua posição no lote
+        """
+        try:
+            response = call.result()
+        except (grpc.FutureCancelledError, grpc.RpcError) as e:
+            for _, _, future, _ in items:
+                future.set_exception(e)
+            return
+
+        if not response.success:
+            for _, _, future, _ in items:
+                future.set_result(calculator_pb2.OperationResponse(success=False, error=response.error))
+            return
+
+        failed = set(response.error_indices)
+        for index, (_, _, future, _) in enumerate(items):
+            if index in failed:
+                future.set_result(calculator_pb2.OperationResponse(success=False, error=ELEMENT_ERROR))
+            else:
+                future.set_result(calculator_pb2.OperationResponse(
+                    result=response.results[index], success=True))
+
+    def close(self):
+        """
+        Envia os lotes pendentes e encerra a thread de envio
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._flusher.join()
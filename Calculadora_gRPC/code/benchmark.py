@@ -0,0 +1,385 @@
+import grpc
+import argparse
+import csv
+import itertools
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+
+import calculator_pb2
+import calculator_pb2_grpc
+from metrics import PERCENTILES, LatencyHistogram
+
+
+# Métodos unários e em lote de cada operação
+UNARY_METHODS = {'add': 'Add', 'sub': 'Sub', 'mul': 'Mul', 'div': 'Div'}
+BATCH_METHODS = {'add': 'AddBatch', 'sub': 'SubBatch', 'mul': 'MulBatch', 'div': 'DivBatch'}
+STREAM_OPERATIONS = {
+    'add': calculator_pb2.ADD,
+    'sub': calculator_pb2.SUB,
+    'mul': calculator_pb2.MUL,
+    'div': calculator_pb2.DIV,
+}
+
+# Limite de requisições pendentes por worker no modo open loop
+MAX_OUTSTANDING = 10000
+
+
+class Recorder:
+    """
+    Acumula latências, erros e contagens de um benchmark (thread-safe)
+    Resultados de requisições iniciadas durante o aquecimento são descartados
+    """
+
+    def __init__(self, measure_from, operations_per_request=1):
+        self.measure_from = measure_from
+        self.operations_per_request = operations_per_request
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def record(self, start, code=None):
+        """
+        Registra uma requisição concluída
+
+        Args:
+            start: Instante (perf_counter) em que a requisição foi iniciada ou agendada
+            code: grpc.StatusCode em caso de erro, None se sucesso
+        """
+        if start < self.measure_from:
+            return
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        with self._lock:
+            self.requests += 1
+            self.histogram.record(elapsed_us)
+            if code is not None:
+                self.errors[code.name] = self.errors.get(code.name, 0) + 1
+
+    def report(self, duration, **labels):
+        """
+        Consolida os resultados
+
+        Args:
+            duration: Duração da medição, em segundos
+            labels: Campos adicionais (método, modo, concorrência...)
+        Returns:
+            Dicionário com vazão, percentis de latência (ms) e erros
+        """
+        with self._lock:
+            failed = sum(self.errors.values())
+            report = dict(labels)
+            report.update({
+                'duration_s': round(duration, 3),
+                'requests': self.requests,
+                'operations': self.requests * self.operations_per_request,
+                'errors': dict(self.errors),
+                'error_rate': failed / self.requests if self.requests else 0.0,
+                'throughput_rps': self.requests / duration if duration else 0.0,
+                'ops_per_s': self.requests * self.operations_per_request / duration if duration else 0.0,
+                'latency_mean_ms': self.histogram.mean() / 1000,
+            })
+            for name, quantile in PERCENTILES:
+                report[f'latency_{name}_ms'] = self.histogram.percentile(quantile) / 1000
+            report['latency_max_ms'] = self.histogram.max / 1000
+        return report
+
+
+def create_channels(target, count):
+    """
+    Cria canais independentes (cada um com sua própria conexão TCP)
+
+    Args:
+        target: Endereço do servidor, ex.: localhost:50051
+        count: Número de canais
+    """
+    # Sem o pool local, canais com os mesmos argumentos compartilham a conexão
+    options = [('grpc.use_local_subchannel_pool', 1)]
+    return [grpc.insecure_channel(target, options=options) for _ in range(count)]
+
+
+def make_operands(rng):
+    """Par de operandos aleatório (num2 nunca é zero)"""
+    return rng.uniform(-1000, 1000), rng.uniform(1, 1000)
+
+
+def make_request(method, op, batch_size, rng):
+    """
+    Monta a requisição do método escolhido
+
+    Returns:
+        OperationRequest ou BatchRequest
+    """
+    if method == 'batch':
+        num1 = [rng.uniform(-1000, 1000) for _ in range(batch_size)]
+        num2 = [rng.uniform(1, 1000) for _ in range(batch_size)]
+        return calculator_pb2.BatchRequest(num1=num1, num2=num2)
+    num1, num2 = make_operands(rng)
+    return calculator_pb2.OperationRequest(num1=num1, num2=num2)
+
+
+def unary_closed_loop(stub, args, recorder, deadline, seed):
+    """
+    Worker closed loop para métodos unários e em lote: uma requisição por vez
+    """
+    rng = random.Random(seed)
+    call = getattr(stub, BATCH_METHODS[args.op] if args.method == 'batch' else UNARY_METHODS[args.op])
+    request = make_request(args.method, args.op, args.batch_size, rng)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            call(request, timeout=args.timeout)
+            recorder.record(start)
+        except grpc.RpcError as e:
+            recorder.record(start, e.code())
+
+
+def unary_open_loop(stub, args, recorder, deadline, seed, rate):
+    """
+    Worker open loop para métodos unários e em lote: envia na taxa fixa,
+    sem esperar respostas; a latência conta a partir do instante agendado
+    """
+    rng = random.Random(seed)
+    call = getattr(stub, BATCH_METHODS[args.op] if args.method == 'batch' else UNARY_METHODS[args.op])
+    request = make_request(args.method, args.op, args.batch_size, rng)
+    outstanding = threading.Semaphore(MAX_OUTSTANDING)
+
+    def on_done(future, scheduled):
+        outstanding.release()
+        error = future.exception()
+        recorder.record(scheduled, error.code() if error is not None else None)
+
+    interval = 1.0 / rate
+    scheduled = time.perf_counter()
+    while scheduled < deadline:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        if not outstanding.acquire(timeout=max(0.0, deadline - time.perf_counter())):
+            break
+        future = call.future(request, timeout=args.timeout)
+        future.add_done_callback(lambda f, s=scheduled: on_done(f, s))
+        scheduled += interval
+
+    # Aguarda as requisições pendentes
+    for _ in range(MAX_OUTSTANDING):
+        outstanding.acquire()
+
+
+def stream_worker(stub, args, recorder, deadline, seed, rate=None):
+    """
+    Worker do stream Compute
+    Closed loop (rate None): uma operação pendente por vez no stream
+    Open loop: operações enviadas na taxa fixa, pareadas pela tag
+    """
+    rng = random.Random(seed)
+    operation = STREAM_OPERATIONS[args.op]
+    outgoing = queue.Queue()
+    sent_at = {}
+    done = threading.Event()
+    tags = itertools.count()
+
+    def send(scheduled):
+        tag = next(tags)
+        num1, num2 = make_operands(rng)
+        sent_at[tag] = scheduled
+        outgoing.put(calculator_pb2.ComputeRequest(tag=tag, operation=operation, num1=num1, num2=num2))
+
+    def requests():
+        while True:
+            request = outgoing.get()
+            if request is None:
+                return
+            yield request
+
+    def receive(responses):
+        try:
+            for response in responses:
+                start = sent_at.pop(response.tag)
+                recorder.record(start, None if response.success else grpc.StatusCode.INVALID_ARGUMENT)
+                if rate is None:
+                    if time.perf_counter() < deadline:
+                        send(time.perf_counter())
+                    else:
+                        outgoing.put(None)
+        except grpc.RpcError as e:
+            for start in list(sent_at.values()):
+                recorder.record(start, e.code())
+        finally:
+            done.set()
+
+    responses = stub.Compute(requests(), timeout=(deadline - time.perf_counter()) + args.timeout)
+    receiver = threading.Thread(target=receive, args=(responses,), daemon=True)
+    receiver.start()
+
+    if rate is None:
+        send(time.perf_counter())
+    else:
+        interval = 1.0 / rate
+        scheduled = time.perf_counter()
+        while scheduled < deadline:
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            send(scheduled)
+            scheduled += interval
+        outgoing.put(None)
+
+    done.wait()
+
+
+def run_benchmark(args):
+    """
+    Executa o benchmark descrito pelos argumentos
+
+    Returns:
+        Dicionário com os resultados
+    """
+    channels = create_channels(args.target, args.channels)
+    for channel in channels:
+        grpc.channel_ready_future(channel).result(timeout=10)
+    stubs = [calculator_pb2_grpc.CalculatorStub(channel) for channel in channels]
+
+    start = time.perf_counter()
+    measure_from = start + args.warmup
+    deadline = measure_from + args.duration
+    recorder = Recorder(measure_from, args.batch_size if args.method == 'batch' else 1)
+
+    threads = []
+    for worker in range(args.concurrency):
+        stub = stubs[worker % len(stubs)]
+        seed = args.seed + worker
+        if args.mode == 'open':
+            rate = args.qps / args.concurrency
+            if args.method == 'stream':
+                target, worker_args = stream_worker, (stub, args, recorder, deadline, seed, rate)
+            else:
+                target, worker_args = unary_open_loop, (stub, args, recorder, deadline, seed, rate)
+        elif args.method == 'stream':
+            target, worker_args = stream_worker, (stub, args, recorder, deadline, seed)
+        else:
+            target, worker_args = unary_closed_loop, (stub, args, recorder, deadline, seed)
+        threads.append(threading.Thread(target=target, args=worker_args, daemon=True))
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for channel in channels:
+        channel.close()
+
+    return recorder.report(
+        args.duration,
+        label=args.label,
+        target=args.target,
+        method=args.method,
+        op=args.op,
+        mode=args.mode,
+        concurrency=args.concurrency,
+        channels=args.channels,
+        target_qps=args.qps if args.mode == 'open' else None,
+        batch_size=args.batch_size if args.method == 'batch' else None,
+    )
+
+
+def write_report(report, output_format, output=None, first=True):
+    """
+    Escreve o relatório em JSON (uma linha) ou CSV
+    Em CSV, o cabeçalho só é escrito no primeiro relatório da execução e se o
+    arquivo de saída for novo, para que vários --target formem um único CSV
+
+    Args:
+        report: Dicionário de resultados
+        output_format: 'json' ou 'csv'
+        output: Caminho do arquivo (acrescenta ao final); None para stdout
+        first: False nos relatórios seguintes da mesma execução
+    """
+    is_new = first and (output is None or not os.path.exists(output) or os.path.getsize(output) == 0)
+    stream = open(output, 'a', newline='') if output else sys.stdout
+    try:
+        if output_format == 'json':
+            stream.write(json.dumps(report, ensure_ascii=False) + "\n")
+        else:
+            row = dict(report)
+            row['errors'] = ";".join(f"{code}:{count}" for code, count in sorted(report['errors'].items()))
+            writer = csv.DictWriter(stream, fieldnames=list(row))
+            if is_new:
+                writer.writeheader()
+            writer.writerow(row)
+    finally:
+        if output:
+            stream.close()
+
+
+def parse_args(argv=None):
+    """
+    Lê as opções de linha de comando do benchmark
+    """
+    parser = argparse.ArgumentParser(description="Gerador de carga da Calculadora Distribuída gRPC")
+    parser.add_argument('--target', action='append', default=None, metavar='ENDERECO',
+                        help="Endereço do servidor, ex.: localhost:50051 ou unix:/tmp/calculator.sock; "
+                             "repetível para comparar endereços na mesma execução")
+    parser.add_argument('--method', choices=['unary', 'batch', 'stream'], default='unary',
+                        help="unary: Add/Sub/Mul/Div; batch: *Batch; stream: Compute")
+    parser.add_argument('--op', choices=sorted(UNARY_METHODS), default='add', help="Operação")
+    parser.add_argument('--mode', choices=['closed', 'open'], default='closed',
+                        help="closed: N workers com uma requisição pendente cada; open: taxa fixa (--qps)")
+    parser.add_argument('--concurrency', type=int, default=8, help="Número de workers (padrão: 8)")
+    parser.add_argument('--qps', type=float, default=1000.0, help="Taxa total no modo open (padrão: 1000)")
+    parser.add_argument('--channels', type=int, default=1,
+                        help="Conexões independentes, divididas entre os workers (padrão: 1)")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Operações por lote (padrão: 1000)")
+    parser.add_argument('--duration', type=float, default=10.0, help="Duração da medição, em segundos")
+    parser.add_argument('--warmup', type=float, default=2.0, help="Aquecimento descartado, em segundos")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Deadline de cada chamada, em segundos")
+    parser.add_argument('--seed', type=int, default=42, help="Semente dos operandos aleatórios")
+    parser.add_argument('--label', default='', help="Rótulo livre para comparar execuções (ex.: modo do servidor)")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help="Formato do relatório")
+    parser.add_argument('--output', default=None, help="Arquivo onde o relatório é acrescentado (padrão: stdout)")
+    args = parser.parse_args(argv)
+    args.targets = args.target or ['localhost:50051']
+    args.target = args.targets[0]
+    return args
+
+
+def print_comparison(reports):
+    """
+    Imprime uma tabela comparando as latências de vários endereços
+    (ex.: socket Unix contra TCP em loopback)
+    """
+    print(f"\n{'Endereço':<36} {'req/s':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}", file=sys.stderr)
+    for report in reports:
+        print(f"{report['target']:<36} {report['throughput_rps']:>10.1f} {report['latency_p50_ms']:>9.3f} "
+              f"{report['latency_p90_ms']:>9.3f} {report['latency_p99_ms']:>9.3f}", file=sys.stderr)
+
+
+def main():
+    """
+    Função principal - executa o benchmark e escreve o relatório
+    """
+    args = parse_args()
+    reports = []
+    for target in args.targets:
+        args.target = target
+        print(f"🏁 Benchmark {args.method}/{args.op} ({args.mode} loop, {args.concurrency} workers) "
+              f"em {args.target} por {args.duration}s", file=sys.stderr)
+        try:
+            report = run_benchmark(args)
+        except grpc.FutureTimeoutError:
+            print(f"❌ Erro ao conectar ao servidor {args.target}", file=sys.stderr)
+            print("💡 Certifique-se de que o servidor está rodando!", file=sys.stderr)
+            sys.exit(1)
+        print(f"📊 {report['throughput_rps']:.1f} req/s, {report['ops_per_s']:.1f} ops/s, "
+              f"p99 {report['latency_p99_ms']:.3f}ms, taxa de erro {report['error_rate']:.2%}", file=sys.stderr)
+        write_report(report, args.format, args.output, first=not reports)
+        reports.append(report)
+    if len(reports) > 1:
+        print_comparison(reports)
+
+
+if __name__ == '__main__':
+    main()
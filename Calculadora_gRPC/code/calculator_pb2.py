@@ -14,17 +14,83 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x63\x61lculator.proto\x12\ncalculator\".\n\x10OperationRequest\x12\x0c\n\x04num1\x18\x01 \x01(\x01\x12\x0c\n\x04num2\x18\x02 \x01(\x01\"C\n\x11OperationResponse\x12\x0e\n\x06result\x18\x01 \x01(\x01\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\x32\x9c\x02\n\nCalculator\x12\x42\n\x03\x41\x64\x64\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12\x42\n\x03Sub\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12\x42\n\x03Mul\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12\x42\n\x03\x44iv\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x63\x61lculator.proto\x12\ncalculator\".\n\x10OperationRequest\x12\x0c\n\x04num1\x18\x01 \x01(\x01\x12\x0c\n\x04num2\x18\x02 \x01(\x01\"C\n\x11OperationResponse\x12\x0e\n\x06result\x18\x01 \x01(\x01\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\"*\n\x0c\x42\x61tchRequest\x12\x0c\n\x04num1\x18\x01 \x03(\x01\x12\x0c\n\x04num2\x18\x02 \x03(\x01\"W\n\rBatchResponse\x12\x0f\n\x07results\x18\x01 \x03(\x01\x12\x15\n\rerror_indices\x18\x02 \x03(\r\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\x08\"\xb3\x01\n\rVectorRequest\x12(\n\toperation\x18\x01 \x01(\x0e\x32\x15.calculator.Operation\x12\x0c\n\x04num1\x18\x02 \x01(\x0c\x12\x0c\n\x04num2\x18\x03 \x01(\x0c\x12\x13\n\x0bnum1_handle\x18\x04 \x01(\t\x12\x13\n\x0bnum2_handle\x18\x05 \x01(\t\x12\x0e\n\x06offset\x18\x06 \x01(\x04\x12\r\n\x05limit\x18\x07 \x01(\x04\x12\x13\n\x0bkeep_result\x18\x08 \x01(\x08\"~\n\x0eVectorResponse\x12\x0f\n\x07results\x18\x01 \x01(\x0c\x12\x15\n\rerror_indices\x18\x02 \x01(\x0c\x12\r\n\x05\x63ount\x18\x03 \x01(\x04\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\x12\x15\n\rresult_handle\x18\x06 \x01(\t\"=\n\x0e\x41ggregateChunk\x12\x0e\n\x06values\x18\x01 \x03(\x01\x12\x0b\n\x03raw\x18\x02 \x01(\x0c\x12\x0e\n\x06handle\x18\x03 \x01(\t\"\xa2\x01\n\x11\x41ggregateResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\x12\x0b\n\x03sum\x18\x02 \x01(\x01\x12\x0c\n\x04mean\x18\x03 \x01(\x01\x12\x0b\n\x03min\x18\x04 \x01(\x01\x12\x0b\n\x03max\x18\x05 \x01(\x01\x12\x10\n\x08variance\x18\x06 \x01(\x01\x12\x17\n\x0fsample_variance\x18\x07 \x01(\x01\x12\r\n\x05\x65rror\x18\x08 \x01(\t\x12\x0f\n\x07success\x18\t \x01(\x08\"+\n\x0c\x44\x61tasetChunk\x12\x0e\n\x06values\x18\x01 \x03(\x01\x12\x0b\n\x03raw\x18\x02 \x01(\x0c\" \n\x0e\x44\x61tasetRequest\x12\x0e\n\x06handle\x18\x01 \x01(\t\"m\n\x0b\x44\x61tasetInfo\x12\x0e\n\x06handle\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\x12\x0e\n\x06nbytes\x18\x03 \x01(\x04\x12\x0f\n\x07spilled\x18\x04 \x01(\x08\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x12\x0f\n\x07success\x18\x06 \x01(\x08\"\x1a\n\x18\x44\x61tasetStoreStatsRequest\"\xd8\x01\n\x19\x44\x61tasetStoreStatsResponse\x12\x10\n\x08\x64\x61tasets\x18\x01 \x01(\r\x12\x14\n\x0cmemory_bytes\x18\x02 \x01(\x04\x12\x11\n\tmax_bytes\x18\x03 \x01(\x04\x12\x0f\n\x07spilled\x18\x04 \x01(\r\x12\x15\n\rspilled_bytes\x18\x05 \x01(\x04\x12\x17\n\x0fmax_spill_bytes\x18\x06 \x01(\x04\x12\x0c\n\x04hits\x18\x07 \x01(\x04\x12\x0e\n\x06misses\x18\x08 \x01(\x04\x12\x11\n\tevictions\x18\t \x01(\x04\x12\x0e\n\x06spills\x18\n \x01(\x04\"Q\n\x0bMatrixBlock\x12\x0b\n\x03row\x18\x01 \x01(\x04\x12\x0b\n\x03\x63ol\x18\x02 \x01(\x04\x12\x0c\n\x04rows\x18\x03 \x01(\r\x12\x0c\n\x04\x63ols\x18\x04 \x01(\r\x12\x0c\n\x04\x64\x61ta\x18\x05 \x01(\x0c\"X\n\x0eMatrixAddChunk\x12\"\n\x01\x61\x18\x01 \x01(\x0b\x32\x17.calculator.MatrixBlock\x12\"\n\x01\x62\x18\x02 \x01(\x0b\x32\x17.calculator.MatrixBlock\"s\n\x13MatrixMultiplyChunk\x12(\n\x05right\x18\x01 \x01(\x0b\x32\x17.calculator.MatrixBlockH\x00\x12\'\n\x04left\x18\x02 \x01(\x0b\x32\x17.calculator.MatrixBlockH\x00\x42\t\n\x07operand\"c\n\x0e\x43omputeRequest\x12\x0b\n\x03tag\x18\x01 \x01(\x04\x12(\n\toperation\x18\x02 \x01(\x0e\x32\x15.calculator.Operation\x12\x0c\n\x04num1\x18\x03 \x01(\x01\x12\x0c\n\x04num2\x18\x04 \x01(\x01\"N\n\x0f\x43omputeResponse\x12\x0b\n\x03tag\x18\x01 \x01(\x04\x12\x0e\n\x06result\x18\x02 \x01(\x01\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\x08\"\x96\x01\n\x0f\x45valuateRequest\x12\x12\n\nexpression\x18\x01 \x01(\t\x12=\n\tvariables\x18\x02 \x03(\x0b\x32*.calculator.EvaluateRequest.VariablesEntry\x1a\x30\n\x0eVariablesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"U\n\x10\x45valuateResponse\x12\x0e\n\x06result\x18\x01 \x01(\x01\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\x12\x11\n\tcache_hit\x18\x04 \x01(\x08\"\x17\n\x15PlanCacheStatsRequest\"i\n\x16PlanCacheStatsResponse\x12\x0c\n\x04hits\x18\x01 \x01(\x04\x12\x0e\n\x06misses\x18\x02 \x01(\x04\x12\x11\n\tevictions\x18\x03 \x01(\x04\x12\x0c\n\x04size\x18\x04 \x01(\r\x12\x10\n\x08\x63\x61pacity\x18\x05 \x01(\r\"$\n\x0cStatsRequest\x12\x14\n\x0cinclude_text\x18\x01 \x01(\x08\"\x88\x02\n\x0bMethodStats\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\x10\n\x08requests\x18\x02 \x01(\x04\x12\x33\n\x06\x65rrors\x18\x03 \x03(\x0b\x32#.calculator.MethodStats.ErrorsEntry\x12\x11\n\tin_flight\x18\x04 \x01(\x03\x12\x0f\n\x07mean_us\x18\x05 \x01(\x01\x12\x0e\n\x06p50_us\x18\x06 \x01(\x04\x12\x0e\n\x06p90_us\x18\x07 \x01(\x04\x12\x0e\n\x06p99_us\x18\x08 \x01(\x04\x12\x0f\n\x07p999_us\x18\t \x01(\x04\x12\x0e\n\x06max_us\x18\n \x01(\x04\x1a-\n\x0b\x45rrorsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\xe4\x01\n\x0b\x43lientStats\x12\x0e\n\x06\x63lient\x18\x01 \x01(\t\x12\x0e\n\x06weight\x18\x02 \x01(\x01\x12\x12\n\nrate_limit\x18\x03 \x01(\x01\x12\x10\n\x08requests\x18\x04 \x01(\x04\x12\x0e\n\x06served\x18\x05 \x01(\x04\x12\x11\n\tthrottled\x18\x06 \x01(\x04\x12\x10\n\x08rejected\x18\x07 \x01(\x04\x12\x0e\n\x06queued\x18\x08 \x01(\r\x12\x0f\n\x07running\x18\t \x01(\r\x12\x0f\n\x07\x63ost_us\x18\n \x01(\x01\x12\x13\n\x0bwait_p50_us\x18\x0b \x01(\x04\x12\x13\n\x0bwait_p99_us\x18\x0c \x01(\x04\"\x89\x01\n\rStatsResponse\x12(\n\x07methods\x18\x01 \x03(\x0b\x32\x17.calculator.MethodStats\x12\x16\n\x0euptime_seconds\x18\x02 \x01(\x01\x12\x0c\n\x04text\x18\x03 \x01(\t\x12(\n\x07\x63lients\x18\x04 \x03(\x0b\x32\x17.calculator.ClientStats\"\xa7\x01\n\x0eProfileRequest\x12)\n\x06\x61\x63tion\x18\x01 \x01(\x0e\x32\x19.calculator.ProfileAction\x12%\n\x04mode\x18\x02 \x01(\x0e\x32\x17.calculator.ProfileMode\x12\x18\n\x10\x64uration_seconds\x18\x03 \x01(\x01\x12\x13\n\x0binterval_ms\x18\x04 \x01(\x01\x12\x14\n\x0csample_every\x18\x05 \x01(\r\"w\n\x0fProfileResponse\x12\x0e\n\x06\x61\x63tive\x18\x01 \x01(\x08\x12\x0c\n\x04mode\x18\x02 \x01(\t\x12\x17\n\x0f\x65lapsed_seconds\x18\x03 \x01(\x01\x12\r\n\x05\x66iles\x18\x04 \x03(\t\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x12\x0f\n\x07success\x18\x06 \x01(\x08*/\n\tOperation\x12\x07\n\x03\x41\x44\x44\x10\x00\x12\x07\n\x03SUB\x10\x01\x12\x07\n\x03MUL\x10\x02\x12\x07\n\x03\x44IV\x10\x03*H\n\rProfileAction\x12\x12\n\x0ePROFILE_STATUS\x10\x00\x12\x11\n\rPROFILE_START\x10\x01\x12\x10\n\x0cPROFILE_STOP\x10\x02*8\n\x0bProfileMode\x12\x13\n\x0fPROFILE_SAMPLER\x10\x00\x12\x14\n\x10PROFILE_CPROFILE\x10\x01\x32\xfd\x0c\n\nCalculator\x12\x42\n\x03\x41\x64\x64\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12\x42\n\x03Sub\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12\x42\n\x03Mul\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12\x42\n\x03\x44iv\x12\x1c.calculator.OperationRequest\x1a\x1d.calculator.OperationResponse\x12?\n\x08\x41\x64\x64\x42\x61tch\x12\x18.calculator.BatchRequest\x1a\x19.calculator.BatchResponse\x12?\n\x08SubBatch\x12\x18.calculator.BatchRequest\x1a\x19.calculator.BatchResponse\x12?\n\x08MulBatch\x12\x18.calculator.BatchRequest\x1a\x19.calculator.BatchResponse\x12?\n\x08\x44ivBatch\x12\x18.calculator.BatchRequest\x1a\x19.calculator.BatchResponse\x12\x46\n\rComputeVector\x12\x19.calculator.VectorRequest\x1a\x1a.calculator.VectorResponse\x12\x44\n\rUploadDataset\x12\x18.calculator.DatasetChunk\x1a\x17.calculator.DatasetInfo(\x01\x12I\n\x0f\x44ownloadDataset\x12\x1a.calculator.DatasetRequest\x1a\x18.calculator.DatasetChunk0\x01\x12\x41\n\nGetDataset\x12\x1a.calculator.DatasetRequest\x1a\x17.calculator.DatasetInfo\x12\x44\n\rDeleteDataset\x12\x1a.calculator.DatasetRequest\x1a\x17.calculator.DatasetInfo\x12\x63\n\x14GetDatasetStoreStats\x12$.calculator.DatasetStoreStatsRequest\x1a%.calculator.DatasetStoreStatsResponse\x12H\n\tAggregate\x12\x1a.calculator.AggregateChunk\x1a\x1d.calculator.AggregateResponse(\x01\x12\x44\n\tMatrixAdd\x12\x1a.calculator.MatrixAddChunk\x1a\x17.calculator.MatrixBlock(\x01\x30\x01\x12N\n\x0eMatrixMultiply\x12\x1f.calculator.MatrixMultiplyChunk\x1a\x17.calculator.MatrixBlock(\x01\x30\x01\x12G\n\x0fMatrixTranspose\x12\x17.calculator.MatrixBlock\x1a\x17.calculator.MatrixBlock(\x01\x30\x01\x12\x46\n\x07\x43ompute\x12\x1a.calculator.ComputeRequest\x1a\x1b.calculator.ComputeResponse(\x01\x30\x01\x12\x45\n\x08\x45valuate\x12\x1b.calculator.EvaluateRequest\x1a\x1c.calculator.EvaluateResponse\x12Z\n\x11GetPlanCacheStats\x12!.calculator.PlanCacheStatsRequest\x1a\".calculator.PlanCacheStatsResponse\x12<\n\x05Stats\x12\x18.calculator.StatsRequest\x1a\x19.calculator.StatsResponse\x12\x42\n\x07Profile\x12\x1a.calculator.ProfileRequest\x1a\x1b.calculator.ProfileResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'calculator_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
+  _globals['_EVALUATEREQUEST_VARIABLESENTRY']._options = None
+  _globals['_EVALUATEREQUEST_VARIABLESENTRY']._serialized_options = b'8\001'
+  _globals['_METHODSTATS_ERRORSENTRY']._options = None
+  _globals['_METHODSTATS_ERRORSENTRY']._serialized_options = b'8\001'
+  _globals['_OPERATION']._serialized_start=3067
+  _globals['_OPERATION']._serialized_end=3114
+  _globals['_PROFILEACTION']._serialized_start=3116
+  _globals['_PROFILEACTION']._serialized_end=3188
+  _globals['_PROFILEMODE']._serialized_start=3190
+  _globals['_PROFILEMODE']._serialized_end=3246
   _globals['_OPERATIONREQUEST']._serialized_start=32
   _globals['_OPERATIONREQUEST']._serialized_end=78
   _globals['_OPERATIONRESPONSE']._serialized_start=80
   _globals['_OPERATIONRESPONSE']._serialized_end=147
-  _globals['_CALCULATOR']._serialized_start=150
-  _globals['_CALCULATOR']._serialized_end=434
+  _globals['_BATCHREQUEST']._serialized_start=149
+  _globals['_BATCHREQUEST']._serialized_end=191
+  _globals['_BATCHRESPONSE']._serialized_start=193
+  _globals['_BATCHRESPONSE']._serialized_end=280
+  _globals['_VECTORREQUEST']._serialized_start=283
+  _globals['_VECTORREQUEST']._serialized_end=462
+  _globals['_VECTORRESPONSE']._serialized_start=464
+  _globals['_VECTORRESPONSE']._serialized_end=590
+  _globals['_AGGREGATECHUNK']._serialized_start=592
+  _globals['_AGGREGATECHUNK']._serialized_end=653
+  _globals['_AGGREGATERESPONSE']._serialized_start=656
+  _globals['_AGGREGATERESPONSE']._serialized_end=818
+  _globals['_DATASETCHUNK']._serialized_start=820
+  _globals['_DATASETCHUNK']._serialized_end=863
+  _globals['_DATASETREQUEST']._serialized_start=865
+  _globals['_DATASETREQUEST']._serialized_end=897
+  _globals['_DATASETINFO']._serialized_start=899
+  _globals['_DATASETINFO']._serialized_end=1008
+  _globals['_DATASETSTORESTATSREQUEST']._serialized_start=1010
+  _globals['_DATASETSTORESTATSREQUEST']._serialized_end=1036
+  _globals['_DATASETSTORESTATSRESPONSE']._serialized_start=1039
+  _globals['_DATASETSTORESTATSRESPONSE']._serialized_end=1255
+  _globals['_MATRIXBLOCK']._serialized_start=1257
+  _globals['_MATRIXBLOCK']._serialized_end=1338
+  _globals['_MATRIXADDCHUNK']._serialized_start=1340
+  _globals['_MATRIXADDCHUNK']._serialized_end=1428
+  _globals['_MATRIXMULTIPLYCHUNK']._serialized_start=1430
+  _globals['_MATRIXMULTIPLYCHUNK']._serialized_end=1545
+  _globals['_COMPUTEREQUEST']._serialized_start=1547
+  _globals['_COMPUTEREQUEST']._serialized_end=1646
+  _globals['_COMPUTERESPONSE']._serialized_start=1648
+  _globals['_COMPUTERESPONSE']._serialized_end=1726
+  _globals['_EVALUATEREQUEST']._serialized_start=1729
+  _globals['_EVALUATEREQUEST']._serialized_end=1879
+  _globals['_EVALUATEREQUEST_VARIABLESENTRY']._serialized_start=1831
+  _globals['_EVALUATEREQUEST_VARIABLESENTRY']._serialized_end=1879
+  _globals['_EVALUATERESPONSE']._serialized_start=1881
+  _globals['_EVALUATERESPONSE']._serialized_end=1966
+  _globals['_PLANCACHESTATSREQUEST']._serialized_start=1968
+  _globals['_PLANCACHESTATSREQUEST']._serialized_end=1991
+  _globals['_PLANCACHESTATSRESPONSE']._serialized_start=1993
+  _globals['_PLANCACHESTATSRESPONSE']._serialized_end=2098
+  _globals['_STATSREQUEST']._serialized_start=2100
+  _globals['_STATSREQUEST']._serialized_end=2136
+  _globals['_METHODSTATS']._serialized_start=2139
+  _globals['_METHODSTATS']._serialized_end=2403
+  _globals['_METHODSTATS_ERRORSENTRY']._serialized_start=2358
+  _globals['_METHODSTATS_ERRORSENTRY']._serialized_end=2403
+  _globals['_CLIENTSTATS']._serialized_start=2406
+  _globals['_CLIENTSTATS']._serialized_end=2634
+  _globals['_STATSRESPONSE']._serialized_start=2637
+  _globals['_STATSRESPONSE']._serialized_end=2774
+  _globals['_PROFILEREQUEST']._serialized_start=2777
+  _globals['_PROFILEREQUEST']._serialized_end=2944
+  _globals['_PROFILERESPONSE']._serialized_start=2946
+  _globals['_PROFILERESPONSE']._serialized_end=3065
+  _globals['_CALCULATOR']._serialized_start=3249
+  _globals['_CALCULATOR']._serialized_end=4910
 # @@protoc_insertion_point(module_scope)
@@ -35,6 +35,101 @@ class CalculatorStub(object):
                 request_serializer=calculator__pb2.OperationRequest.SerializeToString,
                 response_deserializer=calculator__pb2.OperationResponse.FromString,
                 )
+        self.AddBatch = channel.unary_unary(
+                '/calculator.Calculator/AddBatch',
+                request_serializer=calculator__pb2.BatchRequest.SerializeToString,
+                response_deserializer=calculator__pb2.BatchResponse.FromString,
+                )
+        self.SubBatch = channel.unary_unary(
+                '/calculator.Calculator/SubBatch',
+                request_serializer=calculator__pb2.BatchRequest.SerializeToString,
+                response_deserializer=calculator__pb2.BatchResponse.FromString,
+                )
+        self.MulBatch = channel.unary_unary(
+                '/calculator.Calculator/MulBatch',
+                request_serializer=calculator__pb2.BatchRequest.SerializeToString,
+                response_deserializer=calculator__pb2.BatchResponse.FromString,
+                )
+        self.DivBatch = channel.unary_unary(
+                '/calculator.Calculator/DivBatch',
+                request_serializer=calculator__pb2.BatchRequest.SerializeToString,
+                response_deserializer=calculator__pb2.BatchResponse.FromString,
+                )
+        self.ComputeVector = channel.unary_unary(
+                '/calculator.Calculator/ComputeVector',
+                request_serializer=calculator__pb2.VectorRequest.SerializeToString,
+                response_deserializer=calculator__pb2.VectorResponse.FromString,
+                )
+        self.UploadDataset = channel.stream_unary(
+                '/calculator.Calculator/UploadDataset',
+                request_serializer=calculator__pb2.DatasetChunk.SerializeToString,
+                response_deserializer=calculator__pb2.DatasetInfo.FromString,
+                )
+        self.DownloadDataset = channel.unary_stream(
+                '/calculator.Calculator/DownloadDataset',
+                request_serializer=calculator__pb2.DatasetRequest.SerializeToString,
+                response_deserializer=calculator__pb2.DatasetChunk.FromString,
+                )
+        self.GetDataset = channel.unary_unary(
+                '/calculator.Calculator/GetDataset',
+                request_serializer=calculator__pb2.DatasetRequest.SerializeToString,
+                response_deserializer=calculator__pb2.DatasetInfo.FromString,
+                )
+        self.DeleteDataset = channel.unary_unary(
+                '/calculator.Calculator/DeleteDataset',
+                request_serializer=calculator__pb2.DatasetRequest.SerializeToString,
+                response_deserializer=calculator__pb2.DatasetInfo.FromString,
+                )
+        self.GetDatasetStoreStats = channel.unary_unary(
+                '/calculator.Calculator/GetDatasetStoreStats',
+                request_serializer=calculator__pb2.DatasetStoreStatsRequest.SerializeToString,
+                response_deserializer=calculator__pb2.DatasetStoreStatsResponse.FromString,
+                )
+        self.Aggregate = channel.stream_unary(
+                '/calculator.Calculator/Aggregate',
+                request_serializer=calculator__pb2.AggregateChunk.SerializeToString,
+                response_deserializer=calculator__pb2.AggregateResponse.FromString,
+                )
+        self.MatrixAdd = channel.stream_stream(
+                '/calculator.Calculator/MatrixAdd',
+                request_serializer=calculator__pb2.MatrixAddChunk.SerializeToString,
+                response_deserializer=calculator__pb2.MatrixBlock.FromString,
+                )
+        self.MatrixMultiply = channel.stream_stream(
+                '/calculator.Calculator/MatrixMultiply',
+                request_serializer=calculator__pb2.MatrixMultiplyChunk.SerializeToString,
+                response_deserializer=calculator__pb2.MatrixBlock.FromString,
+                )
+        self.MatrixTranspose = channel.stream_stream(
+                '/calculator.Calculator/MatrixTranspose',
+                request_serializer=calculator__pb2.MatrixBlock.SerializeToString,
+                response_deserializer=calculator__pb2.MatrixBlock.FromString,
+                )
+        self.Compute = channel.stream_stream(
+                '/calculator.Calculator/Compute',
+                request_serializer=calculator__pb2.ComputeRequest.SerializeToString,
+                response_deserializer=calculator__pb2.ComputeResponse.FromString,
+                )
+        self.Evaluate = channel.unary_unary(
+                '/calculator.Calculator/Evaluate',
+                request_serializer=calculator__pb2.EvaluateRequest.SerializeToString,
+                response_deserializer=calculator__pb2.EvaluateResponse.FromString,
+                )
+        self.GetPlanCacheStats = channel.unary_unary(
+                '/calculator.Calculator/GetPlanCacheStats',
+                request_serializer=calculator__pb2.PlanCacheStatsRequest.SerializeToString,
+                response_deserializer=calculator__pb2.PlanCacheStatsResponse.FromString,
+                )
+        self.Stats = channel.unary_unary(
+                '/calculator.Calculator/Stats',
+                request_serializer=calculator__pb2.StatsRequest.SerializeToString,
+                response_deserializer=calculator__pb2.StatsResponse.FromString,
+                )
+        self.Profile = channel.unary_unary(
+                '/calculator.Calculator/Profile',
+                request_serializer=calculator__pb2.ProfileRequest.SerializeToString,
+                response_deserializer=calculator__pb2.ProfileResponse.FromString,
+                )
 
 
 class CalculatorServicer(object):
@@ -69,6 +164,140 @@ class CalculatorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def AddBatch(self, request, context):
+        """Operações vetoriais em lote (avaliadas com NumPy em uma única chamada)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MulBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DivBatch(self, request, context):
+        """Divisão em lote: divisão por zero é reportada por elemento
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ComputeVector(self, request, context):
+        """Operação vetorial com operandos em bytes (float64 little-endian), para
+        vetores muito grandes: o servidor não cria um objeto Python por elemento
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UploadDataset(self, request_iterator, context):
+        """Conjuntos de dados guardados no servidor: enviados uma vez, em blocos, e
+        referenciados por handle em ComputeVector e Aggregate
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DownloadDataset(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDataset(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteDataset(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDatasetStoreStats(self, request, context):
+        """Ocupação e contadores do armazenamento de conjuntos de dados
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Aggregate(self, request_iterator, context):
+        """Stream do cliente: agregados (soma, média, mínimo, máximo e variância) de um
+        stream de números de tamanho ilimitado, com memória constante no servidor
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MatrixAdd(self, request_iterator, context):
+        """Operações com matrizes em streaming: as matrizes são enviadas em blocos de
+        linhas e o resultado volta em blocos, posicionados por (row, col)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MatrixMultiply(self, request_iterator, context):
+        """Produto A @ B: todos os blocos de B primeiro, depois os blocos de A;
+        cada bloco de linhas de A gera o bloco de linhas correspondente do resultado
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MatrixTranspose(self, request_iterator, context):
+        """Transposta: cada bloco de linhas de A volta como um bloco de colunas do resultado
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Compute(self, request_iterator, context):
+        """Stream bidirecional: o cliente envia operações identificadas por tag e
+        o servidor devolve os resultados com a mesma tag (a ordem não é garantida)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Evaluate(self, request, context):
+        """Avaliação de expressão aritmética com variáveis, ex.: (a+b)*c/d
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPlanCacheStats(self, request, context):
+        """Contadores do cache de expressões compiladas
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Stats(self, request, context):
+        """Métricas do servidor por método (contagens, erros, concorrência e latência)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Profile(self, request, context):
+        """Liga/desliga o profiling do servidor em execução (requer --profile-dir)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_CalculatorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -92,6 +321,101 @@ def add_CalculatorServicer_to_server(servicer, server):
                     request_deserializer=calculator__pb2.OperationRequest.FromString,
                     response_serializer=calculator__pb2.OperationResponse.SerializeToString,
             ),
+            'AddBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddBatch,
+                    request_deserializer=calculator__pb2.BatchRequest.FromString,
+                    response_serializer=calculator__pb2.BatchResponse.SerializeToString,
+            ),
+            'SubBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.SubBatch,
+                    request_deserializer=calculator__pb2.BatchRequest.FromString,
+                    response_serializer=calculator__pb2.BatchResponse.SerializeToString,
+            ),
+            'MulBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.MulBatch,
+                    request_deserializer=calculator__pb2.BatchRequest.FromString,
+                    response_serializer=calculator__pb2.BatchResponse.SerializeToString,
+            ),
+            'DivBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.DivBatch,
+                    request_deserializer=calculator__pb2.BatchRequest.FromString,
+                    response_serializer=calculator__pb2.BatchResponse.SerializeToString,
+            ),
+            'ComputeVector': grpc.unary_unary_rpc_method_handler(
+                    servicer.ComputeVector,
+                    request_deserializer=calculator__pb2.VectorRequest.FromString,
+                    response_serializer=calculator__pb2.VectorResponse.SerializeToString,
+            ),
+            'UploadDataset': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadDataset,
+                    request_deserializer=calculator__pb2.DatasetChunk.FromString,
+                    response_serializer=calculator__pb2.DatasetInfo.SerializeToString,
+            ),
+            'DownloadDataset': grpc.unary_stream_rpc_method_handler(
+                    servicer.DownloadDataset,
+                    request_deserializer=calculator__pb2.DatasetRequest.FromString,
+                    response_serializer=calculator__pb2.DatasetChunk.SerializeToString,
+            ),
+            'GetDataset': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDataset,
+                    request_deserializer=calculator__pb2.DatasetRequest.FromString,
+                    response_serializer=calculator__pb2.DatasetInfo.SerializeToString,
+            ),
+            'DeleteDataset': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteDataset,
+                    request_deserializer=calculator__pb2.DatasetRequest.FromString,
+                    response_serializer=calculator__pb2.DatasetInfo.SerializeToString,
+            ),
+            'GetDatasetStoreStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDatasetStoreStats,
+                    request_deserializer=calculator__pb2.DatasetStoreStatsRequest.FromString,
+                    response_serializer=calculator__pb2.DatasetStoreStatsResponse.SerializeToString,
+            ),
+            'Aggregate': grpc.stream_unary_rpc_method_handler(
+                    servicer.Aggregate,
+                    request_deserializer=calculator__pb2.AggregateChunk.FromString,
+                    response_serializer=calculator__pb2.AggregateResponse.SerializeToString,
+            ),
+            'MatrixAdd': grpc.stream_stream_rpc_method_handler(
+                    servicer.MatrixAdd,
+                    request_deserializer=calculator__pb2.MatrixAddChunk.FromString,
+                    response_serializer=calculator__pb2.MatrixBlock.SerializeToString,
+            ),
+            'MatrixMultiply': grpc.stream_stream_rpc_method_handler(
+                    servicer.MatrixMultiply,
+                    request_deserializer=calculator__pb2.MatrixMultiplyChunk.FromString,
+                    response_serializer=calculator__pb2.MatrixBlock.SerializeToString,
+            ),
+            'MatrixTranspose': grpc.stream_stream_rpc_method_handler(
+                    servicer.MatrixTranspose,
+                    request_deserializer=calculator__pb2.MatrixBlock.FromString,
+                    response_serializer=calculator__pb2.MatrixBlock.SerializeToString,
+            ),
+            'Compute': grpc.stream_stream_rpc_method_handler(
+                    servicer.Compute,
+                    request_deserializer=calculator__pb2.ComputeRequest.FromString,
+                    response_serializer=calculator__pb2.ComputeResponse.SerializeToString,
+            ),
+            'Evaluate': grpc.unary_unary_rpc_method_handler(
+                    servicer.Evaluate,
+                    request_deserializer=calculator__pb2.EvaluateRequest.FromString,
+                    response_serializer=calculator__pb2.EvaluateResponse.SerializeToString,
+            ),
+            'GetPlanCacheStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPlanCacheStats,
+                    request_deserializer=calculator__pb2.PlanCacheStatsRequest.FromString,
+                    response_serializer=calculator__pb2.PlanCacheStatsResponse.SerializeToString,
+            ),
+            'Stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.Stats,
+                    request_deserializer=calculator__pb2.StatsRequest.FromString,
+                    response_serializer=calculator__pb2.StatsResponse.SerializeToString,
+            ),
+            'Profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.Profile,
+                    request_deserializer=calculator__pb2.ProfileRequest.FromString,
+                    response_serializer=calculator__pb2.ProfileResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'calculator.Calculator', rpc_method_handlers)
@@ -170,3 +494,326 @@ class Calculator(object):
             calculator__pb2.OperationResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def AddBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/AddBatch',
+            calculator__pb2.BatchRequest.SerializeToString,
+            calculator__pb2.BatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SubBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/SubBatch',
+            calculator__pb2.BatchRequest.SerializeToString,
+            calculator__pb2.BatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MulBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/MulBatch',
+            calculator__pb2.BatchRequest.SerializeToString,
+            calculator__pb2.BatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def DivBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/DivBatch',
+            calculator__pb2.BatchRequest.SerializeToString,
+            calculator__pb2.BatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ComputeVector(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/ComputeVector',
+            calculator__pb2.VectorRequest.SerializeToString,
+            calculator__pb2.VectorResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UploadDataset(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/calculator.Calculator/UploadDataset',
+            calculator__pb2.DatasetChunk.SerializeToString,
+            calculator__pb2.DatasetInfo.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def DownloadDataset(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/calculator.Calculator/DownloadDataset',
+            calculator__pb2.DatasetRequest.SerializeToString,
+            calculator__pb2.DatasetChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetDataset(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/GetDataset',
+            calculator__pb2.DatasetRequest.SerializeToString,
+            calculator__pb2.DatasetInfo.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def DeleteDataset(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/DeleteDataset',
+            calculator__pb2.DatasetRequest.SerializeToString,
+            calculator__pb2.DatasetInfo.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetDatasetStoreStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/GetDatasetStoreStats',
+            calculator__pb2.DatasetStoreStatsRequest.SerializeToString,
+            calculator__pb2.DatasetStoreStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Aggregate(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/calculator.Calculator/Aggregate',
+            calculator__pb2.AggregateChunk.SerializeToString,
+            calculator__pb2.AggregateResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MatrixAdd(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/calculator.Calculator/MatrixAdd',
+            calculator__pb2.MatrixAddChunk.SerializeToString,
+            calculator__pb2.MatrixBlock.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MatrixMultiply(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/calculator.Calculator/MatrixMultiply',
+            calculator__pb2.MatrixMultiplyChunk.SerializeToString,
+            calculator__pb2.MatrixBlock.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MatrixTranspose(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/calculator.Calculator/MatrixTranspose',
+            calculator__pb2.MatrixBlock.SerializeToString,
+            calculator__pb2.MatrixBlock.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Compute(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/calculator.Calculator/Compute',
+            calculator__pb2.ComputeRequest.SerializeToString,
+            calculator__pb2.ComputeResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Evaluate(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/Evaluate',
+            calculator__pb2.EvaluateRequest.SerializeToString,
+            calculator__pb2.EvaluateResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetPlanCacheStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/GetPlanCacheStats',
+            calculator__pb2.PlanCacheStatsRequest.SerializeToString,
+            calculator__pb2.PlanCacheStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/Stats',
+            calculator__pb2.StatsRequest.SerializeToString,
+            calculator__pb2.StatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/calculator.Calculator/Profile',
+            calculator__pb2.ProfileRequest.SerializeToString,
+            calculator__pb2.ProfileResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -1,76 +1,1249 @@
 import grpc
 import calculator_pb2
 import calculator_pb2_grpc
+import argparse
+import asyncio
+import contextlib
+import csv
+import itertools
+import json
+import math
+import queue
 import sys
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+from balancer import (
+    DEFAULT_EJECTION_TIME,
+    DEFAULT_FAILURE_THRESHOLD,
+    Backend,
+    LoadBalancer,
+    call_code,
+)
+from batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_DELAY, ELEMENT_ERROR, MicroBatcher
+from fairness import CLIENT_ID_METADATA
+from matrix import MATRIX_DTYPE, array_to_block, block_rows_for, block_to_array, iter_row_blocks
+from metrics import LatencyHistogram
+
+
+# Códigos do enum Operation indexados pelo nome usado no cliente
+OPERATION_CODES = {
+    'add': calculator_pb2.ADD,
+    'sub': calculator_pb2.SUB,
+    'mul': calculator_pb2.MUL,
+    'div': calculator_pb2.DIV,
+}
+
+# Ações e modos da RPC Profile indexados pelo nome usado no cliente
+PROFILE_ACTIONS = {
+    'status': calculator_pb2.PROFILE_STATUS,
+    'start': calculator_pb2.PROFILE_START,
+    'stop': calculator_pb2.PROFILE_STOP,
+}
+PROFILE_MODES = {
+    'sampler': calculator_pb2.PROFILE_SAMPLER,
+    'cprofile': calculator_pb2.PROFILE_CPROFILE,
+}
+
+# Métodos unários do serviço indexados pelo nome usado no cliente
+OPERATION_METHODS = {
+    'add': 'Add',
+    'sub': 'Sub',
+    'mul': 'Mul',
+    'div': 'Div',
+}
+
+# Formato dos buffers de ComputeVector: float64 e uint32 little-endian
+VECTOR_DTYPE = np.dtype('<f8')
+VECTOR_INDEX_DTYPE = np.dtype('<u4')
+
+# Elementos por chamada de ComputeVector (2 x 1 MB, abaixo do limite padrão de 4 MB)
+DEFAULT_VECTOR_CHUNK = 1 << 17
+
+# Concorrência padrão do map (requisições pendentes ao mesmo tempo)
+DEFAULT_MAP_CONCURRENCY = 64
+
+# Resultado estruturado das APIs não bloqueantes (não imprimem nada)
+#   success: True se a operação foi realizada
+#   result: Valor calculado (None se erro)
+#   error: Mensagem de erro ("" se sucesso)
+#   code: grpc.StatusCode da chamada
+OperationResult = namedtuple('OperationResult', ['success', 'result', 'error', 'code'])
+
+
+def response_result(response):
+    """
+    Converte uma resposta do servidor (OperationResponse ou EvaluateResponse)
+    em OperationResult
+    """
+    if response.success:
+        return OperationResult(True, response.result, "", grpc.StatusCode.OK)
+    return OperationResult(False, None, response.error, grpc.StatusCode.OK)
+
+
+def rpc_error_result(error):
+    """
+    Converte um grpc.RpcError em OperationResult
+    """
+    return OperationResult(False, None, error.details() or "", error.code())
+
+
+def future_result(future, timeout=None):
+    """
+    Aguarda um future retornado pelos métodos *_future e converte o desfecho
+    (resposta, erro RPC ou cancelamento) em OperationResult
+    
+    Args:
+        future: grpc.Future de uma chamada unária
+        timeout: Tempo máximo de espera, em segundos (None: sem limite)
+    Returns:
+        OperationResult
+    """
+    try:
+        return response_result(future.result(timeout=timeout))
+    except grpc.FutureCancelledError:
+        return OperationResult(False, None, "Chamada cancelada", grpc.StatusCode.CANCELLED)
+    except grpc.RpcError as e:
+        return rpc_error_result(e)
+
+
+def build_channel_options(keepalive_time_ms=None, keepalive_timeout_ms=None,
+                          max_message_length=None, flow_control_window=None,
+                          dedicated_connection=True):
+    """
+    Monta as opções de transporte de um canal gRPC
+    
+    Args:
+        keepalive_time_ms: Intervalo entre pings de keepalive (None: padrão do gRPC)
+        keepalive_timeout_ms: Tempo de espera pela resposta do ping
+        max_message_length: Tamanho máximo das mensagens enviadas e recebidas, em bytes
+        flow_control_window: Janela inicial de controle de fluxo HTTP/2, em bytes
+                             (desativa o ajuste automático por BDP)
+        dedicated_connection: Se True, o canal não compartilha a conexão TCP com
+                              outros canais de mesmo destino (necessário para o pool)
+    Returns:
+        Lista de tuplas (opção, valor)
+    """
+    options = []
+    if dedicated_connection:
+        options.append(('grpc.use_local_subchannel_pool', 1))
+    if keepalive_time_ms is not None:
+        options.append(('grpc.keepalive_time_ms', keepalive_time_ms))
+        options.append(('grpc.keepalive_permit_without_calls', 1))
+        options.append(('grpc.http2.max_pings_without_data', 0))
+    if keepalive_timeout_ms is not None:
+        options.append(('grpc.keepalive_timeout_ms', keepalive_timeout_ms))
+    if max_message_length is not None:
+        options.append(('grpc.max_send_message_length', max_message_length))
+        options.append(('grpc.max_receive_message_length', max_message_length))
+    if flow_control_window is not None:
+        options.append(('grpc.http2.lookahead_bytes', flow_control_window))
+        options.append(('grpc.http2.bdp_probe', 0))
+    return options
+
+
+class _CallDetails(namedtuple('_CallDetails', ['method', 'timeout', 'metadata', 'credentials',
+                                               'wait_for_ready', 'compression']),
+                   grpc.ClientCallDetails):
+    """ClientCallDetails com metadados alterados"""
+
+
+class ClientIdInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor,
+                          grpc.StreamUnaryClientInterceptor, grpc.StreamStreamClientInterceptor):
+    """
+    Acrescenta o metadado x-client-id a todas as chamadas de um canal, para
+    o escalonamento justo por cliente do servidor (--fair-scheduling)
+    """
+
+    def __init__(self, client_id):
+        self.metadata = ((CLIENT_ID_METADATA, client_id),)
+
+    def _details(self, details):
+        return _CallDetails(details.method, details.timeout, tuple(details.metadata or ()) + self.metadata,
+                            details.credentials, details.wait_for_ready, details.compression)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self._details(client_call_details), request)
+
+    intercept_unary_stream = intercept_unary_unary
+    intercept_stream_unary = intercept_unary_unary
+    intercept_stream_stream = intercept_unary_unary
+
+
+class _AsyncClientIdInterceptor:
+    """
+    Versão asyncio do ClientIdInterceptor (o grpc.aio aceita um único tipo
+    de chamada por interceptor; ver async_client_id_interceptors)
+    """
+
+    def __init__(self, client_id):
+        self.metadata = ((CLIENT_ID_METADATA, client_id),)
+
+    async def _intercept(self, continuation, client_call_details, request):
+        details = grpc.aio.ClientCallDetails(
+            client_call_details.method, client_call_details.timeout,
+            grpc.aio.Metadata(*(client_call_details.metadata or ()), *self.metadata),
+            client_call_details.credentials, client_call_details.wait_for_ready)
+        return await continuation(details, request)
+
+
+class _AsyncUnaryUnaryClientId(_AsyncClientIdInterceptor, grpc.aio.UnaryUnaryClientInterceptor):
+    intercept_unary_unary = _AsyncClientIdInterceptor._intercept
+
+
+class _AsyncUnaryStreamClientId(_AsyncClientIdInterceptor, grpc.aio.UnaryStreamClientInterceptor):
+    intercept_unary_stream = _AsyncClientIdInterceptor._intercept
+
+
+class _AsyncStreamUnaryClientId(_AsyncClientIdInterceptor, grpc.aio.StreamUnaryClientInterceptor):
+    intercept_stream_unary = _AsyncClientIdInterceptor._intercept
+
+
+class _AsyncStreamStreamClientId(_AsyncClientIdInterceptor, grpc.aio.StreamStreamClientInterceptor):
+    intercept_stream_stream = _AsyncClientIdInterceptor._intercept
+
+
+def async_client_id_interceptors(client_id):
+    """
+    Interceptors de canal grpc.aio que acrescentam x-client-id a todas as chamadas
+    """
+    return [interceptor(client_id) for interceptor in (
+        _AsyncUnaryUnaryClientId, _AsyncUnaryStreamClientId,
+        _AsyncStreamUnaryClientId, _AsyncStreamStreamClientId,
+    )]
+
+
+def remaining(deadline):
+    """
+    Segundos até o prazo absoluto (time.monotonic), ou None se não houver prazo
+    """
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def unique_budgets(*policies):
+    """
+    Orçamentos de reenvio distintos das políticas informadas (None é ignorado)
+    """
+    budgets = []
+    for policy in policies:
+        if policy is not None and all(policy.budget is not budget for budget in budgets):
+            budgets.append(policy.budget)
+    return budgets
 
 
 class CalculatorClient:
     """
     Cliente para comunicação com o serviço Calculator
-    Implementa chamadas unárias
+    Implementa chamadas unárias, em lote e o stream bidirecional Compute
     """
     
-    def __init__(self, host='localhost', port='50051'):
+    def __init__(self, host='localhost', port='50051', channels=1,
+                 keepalive_time_ms=None, keepalive_timeout_ms=None,
+                 max_message_length=None, flow_control_window=None,
+                 wait_for_ready=None, connect_timeout=None, auto_batch=False,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_batch_delay=DEFAULT_MAX_DELAY,
+                 target=None, targets=None, lb_policy='round_robin',
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, ejection_time=DEFAULT_EJECTION_TIME,
+                 default_timeout=None, retry_policy=None, hedging_policy=None, client_id=None):
         """
         Inicializa o cliente gRPC
         
         Args:
             host: Endereço do servidor
             port: Porta do servidor
+            channels: Número de canais (conexões HTTP/2) por servidor; as
+                      chamadas são distribuídas entre eles conforme lb_policy
+            keepalive_time_ms: Intervalo entre pings de keepalive
+            keepalive_timeout_ms: Tempo de espera pela resposta do ping
+            max_message_length: Tamanho máximo das mensagens, em bytes
+            flow_control_window: Janela inicial de controle de fluxo HTTP/2, em bytes
+            wait_for_ready: Se True, as chamadas aguardam a conexão ficar pronta
+                            em vez de falhar imediatamente
+            connect_timeout: Se informado, conecta todos os canais antes de
+                             retornar (ver connect)
+            auto_batch: Se True, chamadas add/sub/mul/div concorrentes (de várias
+                        threads) são agrupadas em RPCs de lote
+            max_batch_size: Tamanho que dispara o envio imediato do lote
+            max_batch_delay: Espera máxima de um lote incompleto, em segundos
+            target: Endereço completo do servidor, no lugar de host/port, ex.:
+                    'unix:/tmp/calculator.sock' (socket Unix, sem a pilha TCP/IP)
+            targets: Lista de servidores para balanceamento de carga no cliente,
+                     ex.: ['localhost:50051', 'localhost:50052']
+            lb_policy: 'round_robin' ou 'least_outstanding' (menos chamadas pendentes)
+            failure_threshold: Falhas consecutivas (UNAVAILABLE, DEADLINE_EXCEEDED,
+                               RESOURCE_EXHAUSTED) até ejetar um servidor
+            ejection_time: Tempo base de ejeção de um servidor, em segundos
+            default_timeout: Prazo padrão das chamadas, em segundos (None: sem prazo);
+                             cada método aceita um `timeout` próprio
+            retry_policy: RetryPolicy para reenviar chamadas unárias bloqueantes
+            hedging_policy: HedgingPolicy para enviar cópias de chamadas unárias
+                            bloqueantes lentas a outro canal/servidor
+            client_id: Identificação enviada no metadado x-client-id, usada pelo
+                       escalonamento justo do servidor (padrão: o servidor usa
+                       o endereço do host, sem a porta)
+        """
+        options = build_channel_options(
+            keepalive_time_ms, keepalive_timeout_ms,
+            max_message_length, flow_control_window,
+            dedicated_connection=channels > 1
+        )
+        targets = list(targets or [target or f'{host}:{port}'])
+        backends = []
+        for backend_target in targets:
+            for _ in range(channels):
+                channel = grpc.insecure_channel(backend_target, options=options)
+                if client_id is not None:
+                    channel = grpc.intercept_channel(channel, ClientIdInterceptor(client_id))
+                backends.append(Backend(backend_target, channel, calculator_pb2_grpc.CalculatorStub(channel)))
+        self.balancer = LoadBalancer(backends, lb_policy, failure_threshold, ejection_time)
+        self.channels = [backend.channel for backend in backends]
+        self.stubs = [backend.stub for backend in backends]
+        self.wait_for_ready = wait_for_ready
+        self.default_timeout = default_timeout
+        self.retry_policy = retry_policy
+        self.hedging_policy = hedging_policy
+        self._budgets = unique_budgets(retry_policy, hedging_policy)
+        
+        # Canal e stub principais (chamadas administrativas)
+        self.channel = self.channels[0]
+        self.stub = self.stubs[0]
+        
+        self._batcher = None
+        if auto_batch:
+            self._batcher = MicroBatcher(self._submit, max_batch_size, max_batch_delay)
+        
+        if connect_timeout is not None:
+            self.connect(connect_timeout)
+        pool = f" ({channels} canais)" if channels > 1 else ""
+        if len(targets) > 1:
+            print(f"🔌 Conectado aos servidores {', '.join(targets)} ({lb_policy}){pool}")
+        else:
+            print(f"🔌 Conectado ao servidor {targets[0]}{pool}")
+    
+    def connect(self, timeout=10):
         """
-        self.channel = grpc.insecure_channel(f'{host}:{port}')
-        self.stub = calculator_pb2_grpc.CalculatorStub(self.channel)
-        print(f"🔌 Conectado ao servidor {host}:{port}")
+        Estabelece (aquece) a conexão de todos os canais do pool
+        
+        Args:
+            timeout: Tempo máximo de espera por canal, em segundos
+        Raises:
+            grpc.FutureTimeoutError: Se algum canal não conectar a tempo
+        """
+        for channel in self.channels:
+            grpc.channel_ready_future(channel).result(timeout=timeout)
     
-    def add(self, num1, num2):
+    def _next_stub(self):
         """
-        Chamada RPC para operação de adição
+        Stub do próximo servidor/canal escolhido pelo balanceador
+        Usado pelos streams, que não entram na contagem de chamadas pendentes
         """
+        return self.balancer.next_backend().stub
+    
+    def _timeout(self, timeout):
+        """
+        Prazo efetivo de uma chamada: o informado ou o default_timeout
+        """
+        return self.default_timeout if timeout is None else timeout
+    
+    def _invoke(self, method_name, request, timeout=None):
+        """
+        Executa uma chamada unária no servidor/canal escolhido pelo balanceador
+        O prazo vale para a chamada inteira, incluindo reenvios e cópias
+        
+        Args:
+            method_name: Nome do método do serviço (ex.: 'Add')
+            request: Mensagem de requisição
+            timeout: Prazo da chamada, em segundos (padrão: default_timeout)
+        Returns:
+            Mensagem de resposta
+        """
+        timeout = self._timeout(timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for budget in self._budgets:
+            budget.record_request()
+        
+        attempt = 1
+        while True:
+            try:
+                return self._attempt(method_name, request, deadline)
+            except grpc.RpcError as e:
+                policy = self.retry_policy
+                if policy is None:
+                    raise
+                backoff = policy.backoff(attempt)
+                if deadline is not None and time.monotonic() + backoff >= deadline:
+                    raise
+                if not policy.should_retry(e.code(), attempt):
+                    raise
+                time.sleep(backoff)
+                attempt += 1
+    
+    def _attempt(self, method_name, request, deadline):
+        """
+        Uma tentativa de chamada unária
+        Com hedging_policy, se a resposta não chega dentro do atraso de cópia,
+        envia a mesma requisição a outro canal/servidor e usa a primeira
+        resposta bem-sucedida; a chamada que sobrar é cancelada
+        """
+        hedging = self.hedging_policy
+        delay = hedging.hedge_delay(method_name) if hedging is not None else None
+        started = time.perf_counter()
+        
+        if delay is None:
+            backend = self.balancer.acquire()
+            code = grpc.StatusCode.OK
+            try:
+                response = getattr(backend.stub, method_name)(
+                    request, timeout=remaining(deadline), wait_for_ready=self.wait_for_ready)
+            except grpc.RpcError as e:
+                code = e.code()
+                raise
+            finally:
+                self.balancer.release(backend, code)
+            if hedging is not None:
+                hedging.record(method_name, time.perf_counter() - started)
+            return response
+        
+        completions = queue.Queue()
+        first = self.balancer.acquire()
+        calls = [self._submit_to(first, method_name, request, remaining(deadline))]
+        calls[0].add_done_callback(completions.put)
+        try:
+            try:
+                call = completions.get(timeout=delay)
+            except queue.Empty:
+                if hedging.try_hedge():
+                    backend = self.balancer.acquire(exclude={first.target})
+                    calls.append(self._submit_to(backend, method_name, request, remaining(deadline)))
+                    calls[-1].add_done_callback(completions.put)
+                call = completions.get()
+            received = 1
+            while True:
+                try:
+                    response = call.result()
+                except grpc.RpcError:
+                    if received == len(calls):
+                        raise
+                    call = completions.get()
+                    received += 1
+                    continue
+                if call is not calls[0]:
+                    hedging.record_win()
+                hedging.record(method_name, time.perf_counter() - started)
+                return response
+        finally:
+            for call in calls:
+                call.cancel()
+    
+    def _call_operation(self, operation, num1, num2, timeout=None):
+        """
+        Executa uma operação unária, agrupada em lote se auto_batch estiver ativo
+        (com auto_batch, o lote usa o prazo mais curto entre os seus elementos)
+        
+        Returns:
+            OperationResponse
+        """
+        if self._batcher is not None:
+            return self._batcher.call(operation, num1, num2, self._timeout(timeout))
         request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+        return self._invoke(OPERATION_METHODS[operation], request, timeout)
+    
+    def add(self, num1, num2, timeout=None):
+        """
+        Chamada RPC para operação de adição
+        """
         try:
-            response = self.stub.Add(request)
+            response = self._call_operation('add', num1, num2, timeout)
             return self._handle_response(response, "Adição")
         except grpc.RpcError as e:
             print(f"❌ Erro RPC: {e.details()}")
             return None
     
-    def sub(self, num1, num2):
+    def sub(self, num1, num2, timeout=None):
         """
         Chamada RPC para operação de subtração
         """
-        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
         try:
-            response = self.stub.Sub(request)
+            response = self._call_operation('sub', num1, num2, timeout)
             return self._handle_response(response, "Subtração")
         except grpc.RpcError as e:
             print(f"❌ Erro RPC: {e.details()}")
             return None
     
-    def mul(self, num1, num2):
+    def mul(self, num1, num2, timeout=None):
         """
         Chamada RPC para operação de multiplicação
         """
-        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
         try:
-            response = self.stub.Mul(request)
+            response = self._call_operation('mul', num1, num2, timeout)
             return self._handle_response(response, "Multiplicação")
         except grpc.RpcError as e:
             print(f"❌ Erro RPC: {e.details()}")
             return None
     
-    def div(self, num1, num2):
+    def div(self, num1, num2, timeout=None):
         """
         Chamada RPC para operação de divisão
         Inclui validação de divisão por zero
         """
-        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
         try:
-            response = self.stub.Div(request)
+            response = self._call_operation('div', num1, num2, timeout)
             return self._handle_response(response, "Divisão")
         except grpc.RpcError as e:
             print(f"❌ Erro RPC: {e.details()}")
             return None
     
+    def _submit(self, method_name, request, timeout=None):
+        """
+        Dispara uma chamada unária sem bloquear, no servidor/canal escolhido
+        pelo balanceador
+        
+        Args:
+            method_name: Nome do método do serviço (ex.: 'Add')
+            request: Mensagem de requisição
+            timeout: Prazo da chamada, em segundos (padrão: default_timeout)
+        Returns:
+            grpc.Future com a mensagem de resposta
+        """
+        return self._submit_to(self.balancer.acquire(), method_name, request, self._timeout(timeout))
+    
+    def _submit_to(self, backend, method_name, request, timeout=None):
+        """
+        Dispara uma chamada unária sem bloquear em um backend já reservado
+        com balancer.acquire; a reserva é liberada quando a chamada termina
+        
+        Args:
+            backend: Backend retornado por balancer.acquire
+            method_name: Nome do método do serviço (ex.: 'Add')
+            request: Mensagem de requisição
+            timeout: Prazo da chamada, em segundos
+        Returns:
+            grpc.Future com a mensagem de resposta
+        """
+        try:
+            future = getattr(backend.stub, method_name).future(
+                request, timeout=timeout, wait_for_ready=self.wait_for_ready)
+        except Exception:
+            self.balancer.release(backend, grpc.StatusCode.UNKNOWN)
+            raise
+        future.add_done_callback(lambda call: self.balancer.release(backend, call_code(call)))
+        return future
+    
+    def submit(self, operation, num1, num2, timeout=None):
+        """
+        Dispara uma operação sem bloquear e sem imprimir
+        
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            num1: Primeiro operando
+            num2: Segundo operando
+            timeout: Prazo da chamada, em segundos
+        Returns:
+            grpc.Future com a OperationResponse (ver future_result)
+        """
+        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+        return self._submit(OPERATION_METHODS[operation], request, timeout)
+    
+    def add_future(self, num1, num2, timeout=None):
+        """
+        Adição não bloqueante; retorna um grpc.Future
+        """
+        return self.submit('add', num1, num2, timeout)
+    
+    def sub_future(self, num1, num2, timeout=None):
+        """
+        Subtração não bloqueante; retorna um grpc.Future
+        """
+        return self.submit('sub', num1, num2, timeout)
+    
+    def mul_future(self, num1, num2, timeout=None):
+        """
+        Multiplicação não bloqueante; retorna um grpc.Future
+        """
+        return self.submit('mul', num1, num2, timeout)
+    
+    def div_future(self, num1, num2, timeout=None):
+        """
+        Divisão não bloqueante; retorna um grpc.Future
+        Divisão por zero termina com INVALID_ARGUMENT (ver future_result)
+        """
+        return self.submit('div', num1, num2, timeout)
+    
+    def evaluate_future(self, expression, variables=None, timeout=None):
+        """
+        Avaliação de expressão não bloqueante; retorna um grpc.Future
+        """
+        request = calculator_pb2.EvaluateRequest(expression=expression, variables=variables or {})
+        return self._submit('Evaluate', request, timeout)
+    
+    def map(self, operation, pairs, concurrency=DEFAULT_MAP_CONCURRENCY, timeout=None):
+        """
+        Executa a mesma operação sobre muitos pares de operandos, mantendo até
+        `concurrency` chamadas pendentes ao mesmo tempo (pipelining) a partir
+        de uma única thread
+        
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            pairs: Iterável de tuplas (num1, num2), consumido sob demanda
+            concurrency: Máximo de chamadas pendentes
+            timeout: Prazo de cada chamada, em segundos
+        Yields:
+            OperationResult de cada par, na ordem de entrada
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser >= 1")
+        method_name = OPERATION_METHODS[operation]
+        window = deque()
+        for num1, num2 in pairs:
+            if len(window) >= concurrency:
+                yield future_result(window.popleft())
+            request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+            window.append(self._submit(method_name, request, timeout))
+        while window:
+            yield future_result(window.popleft())
+    
+    def add_batch(self, nums1, nums2, timeout=None):
+        """
+        Chamada RPC para adição em lote
+        """
+        return self._call_batch('AddBatch', nums1, nums2, "Adição em lote", timeout)
+    
+    def sub_batch(self, nums1, nums2, timeout=None):
+        """
+        Chamada RPC para subtração em lote
+        """
+        return self._call_batch('SubBatch', nums1, nums2, "Subtração em lote", timeout)
+    
+    def mul_batch(self, nums1, nums2, timeout=None):
+        """
+        Chamada RPC para multiplicação em lote
+        """
+        return self._call_batch('MulBatch', nums1, nums2, "Multiplicação em lote", timeout)
+    
+    def div_batch(self, nums1, nums2, timeout=None):
+        """
+        Chamada RPC para divisão em lote
+        Elementos com divisão por zero retornam None
+        """
+        return self._call_batch('DivBatch', nums1, nums2, "Divisão em lote", timeout)
+    
+    def _call_batch(self, method_name, nums1, nums2, operation_name, timeout=None):
+        """
+        Envia um lote de operações em uma única chamada RPC
+        
+        Args:
+            method_name: Nome do método (AddBatch, SubBatch, MulBatch ou DivBatch)
+            nums1: Sequência com os primeiros operandos
+            nums2: Sequência com os segundos operandos
+            operation_name: Nome da operação para log
+            timeout: Prazo da chamada, em segundos
+        Returns:
+            Lista de resultados (None nos elementos com erro), ou None se o lote falhar
+        """
+        request = calculator_pb2.BatchRequest(num1=nums1, num2=nums2)
+        try:
+            response = self._invoke(method_name, request, timeout)
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        
+        if not response.success:
+            print(f"❌ Erro na {operation_name}: {response.error}")
+            return None
+        
+        results = list(response.results)
+        for index in response.error_indices:
+            results[index] = None
+        
+        print(f"✅ {operation_name} realizada: {len(results)} operações")
+        if response.error:
+            print(f"⚠️  {response.error} (índices: {list(response.error_indices)})")
+        return results
+    
+    def compute_vector(self, operation, nums1, nums2, chunk_size=DEFAULT_VECTOR_CHUNK, concurrency=4,
+                       timeout=None):
+        """
+        Operação vetorial sobre arrays grandes com operandos em bytes (ComputeVector)
+        O vetor é dividido em blocos de chunk_size elementos, enviados com até
+        `concurrency` chamadas pendentes; os resultados são copiados direto do
+        buffer da resposta para o array de saída
+        
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            nums1: Array (ou sequência) com os primeiros operandos
+            nums2: Array (ou sequência) com os segundos operandos
+            chunk_size: Elementos por chamada (limitado pelo tamanho máximo de mensagem)
+            concurrency: Máximo de chamadas pendentes
+            timeout: Prazo de cada bloco, em segundos
+        Returns:
+            Tupla (array de resultados, array de índices com erro), ou None se falhar
+        """
+        nums1 = np.ascontiguousarray(nums1, dtype=VECTOR_DTYPE)
+        nums2 = np.ascontiguousarray(nums2, dtype=VECTOR_DTYPE)
+        if nums1.shape != nums2.shape or nums1.ndim != 1:
+            print(f"❌ Erro: vetores devem ter uma dimensão e o mesmo tamanho "
+                  f"({nums1.shape} e {nums2.shape})")
+            return None
+        
+        size = len(nums1)
+        results = np.empty(size, dtype=VECTOR_DTYPE)
+        error_indices = []
+        window = deque()
+        
+        def collect():
+            start, future = window.popleft()
+            response = future.result()
+            if not response.success:
+                raise ValueError(response.error)
+            results[start:start + response.count] = np.frombuffer(response.results, dtype=VECTOR_DTYPE)
+            if response.error_indices:
+                error_indices.append(np.frombuffer(response.error_indices, dtype=VECTOR_INDEX_DTYPE) + start)
+        
+        try:
+            for start in range(0, size, chunk_size):
+                if len(window) >= concurrency:
+                    collect()
+                request = calculator_pb2.VectorRequest(
+                    operation=OPERATION_CODES[operation],
+                    num1=nums1[start:start + chunk_size].tobytes(),
+                    num2=nums2[start:start + chunk_size].tobytes()
+                )
+                window.append((start, self._submit('ComputeVector', request, timeout)))
+            while window:
+                collect()
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        except ValueError as e:
+            print(f"❌ Erro na operação vetorial: {e}")
+            return None
+        
+        errors = np.concatenate(error_indices) if error_indices else np.empty(0, dtype=np.int64)
+        print(f"✅ Operação vetorial realizada: {size} operações")
+        if len(errors):
+            print(f"⚠️  Divisão por zero em {len(errors)} elemento(s)")
+        return results, errors
+    
+    def aggregate(self, values, chunk_size=DEFAULT_VECTOR_CHUNK, timeout=None):
+        """
+        Agregados de um conjunto de números por um único stream (Aggregate)
+        Os valores são enviados em blocos de bytes float64; aceita arrays
+        NumPy ou qualquer iterável de números, inclusive geradores ilimitados.
+        Um handle de upload_dataset agrega o conjunto guardado no servidor,
+        sem reenviar os valores
+        
+        Args:
+            values: Array NumPy, iterável de números ou handle (str)
+            chunk_size: Valores por mensagem do stream
+            timeout: Prazo do stream inteiro, em segundos
+        Returns:
+            Dicionário com count, sum, mean, min, max, variance e
+            sample_variance, ou None se erro
+        """
+        def chunks():
+            if isinstance(values, str):
+                yield calculator_pb2.AggregateChunk(handle=values)
+                return
+            if isinstance(values, np.ndarray):
+                flat = np.ascontiguousarray(values, dtype=VECTOR_DTYPE).ravel()
+                for start in range(0, len(flat), chunk_size):
+                    yield calculator_pb2.AggregateChunk(raw=flat[start:start + chunk_size].tobytes())
+                return
+            iterator = iter(values)
+            while True:
+                block = np.fromiter(itertools.islice(iterator, chunk_size), dtype=VECTOR_DTYPE)
+                if not len(block):
+                    return
+                yield calculator_pb2.AggregateChunk(raw=block.tobytes())
+        
+        # Handles pertencem ao servidor que recebeu o upload: canal principal
+        stub = self.stub if isinstance(values, str) else self._next_stub()
+        try:
+            response = stub.Aggregate(chunks(), timeout=self._timeout(timeout),
+                                      wait_for_ready=self.wait_for_ready)
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {
+            'count': response.count,
+            'sum': response.sum,
+            'mean': response.mean,
+            'min': response.min,
+            'max': response.max,
+            'variance': response.variance,
+            'sample_variance': response.sample_variance,
+        }
+    
+    def upload_dataset(self, values, chunk_size=DEFAULT_VECTOR_CHUNK, timeout=None):
+        """
+        Envia um conjunto de números uma única vez (UploadDataset), em blocos
+        de bytes float64; o handle devolvido substitui os valores em
+        compute_datasets e aggregate
+        Os conjuntos ficam no servidor do canal principal (self.stub), que é
+        usado por todas as chamadas com handles
+        
+        Args:
+            values: Array NumPy ou sequência de números
+            chunk_size: Valores por mensagem do stream
+            timeout: Prazo do stream inteiro, em segundos
+        Returns:
+            Handle (str) do conjunto, ou None se erro
+        """
+        flat = np.ascontiguousarray(values, dtype=VECTOR_DTYPE).ravel()
+        chunks = (
+            calculator_pb2.DatasetChunk(raw=flat[start:start + chunk_size].tobytes())
+            for start in range(0, len(flat), chunk_size)
+        )
+        try:
+            response = self.stub.UploadDataset(chunks, timeout=self._timeout(timeout),
+                                               wait_for_ready=self.wait_for_ready)
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        location = " (em disco)" if response.spilled else ""
+        print(f"✅ Conjunto enviado: {response.count} valores{location}, handle {response.handle}")
+        return response.handle
+    
+    def download_dataset(self, handle, timeout=None):
+        """
+        Lê os valores de um conjunto guardado no servidor (DownloadDataset),
+        ex.: um resultado de compute_datasets com keep_result
+        
+        Returns:
+            Array NumPy float64, ou None se erro
+        """
+        try:
+            chunks = self.stub.DownloadDataset(calculator_pb2.DatasetRequest(handle=handle),
+                                               timeout=self._timeout(timeout))
+            blocks = [np.frombuffer(chunk.raw, dtype=VECTOR_DTYPE) for chunk in chunks]
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return np.concatenate(blocks) if blocks else np.empty(0, dtype=VECTOR_DTYPE)
+    
+    def dataset_info(self, handle, timeout=None):
+        """
+        Consulta um conjunto guardado no servidor
+        
+        Returns:
+            Dicionário com handle, count, nbytes e spilled, ou None se erro
+        """
+        try:
+            response = self.stub.GetDataset(calculator_pb2.DatasetRequest(handle=handle),
+                                            timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {
+            'handle': response.handle,
+            'count': response.count,
+            'nbytes': response.nbytes,
+            'spilled': response.spilled,
+        }
+    
+    def delete_dataset(self, handle, timeout=None):
+        """
+        Remove um conjunto guardado no servidor
+        
+        Returns:
+            True se o conjunto foi removido
+        """
+        try:
+            self.stub.DeleteDataset(calculator_pb2.DatasetRequest(handle=handle),
+                                    timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return False
+        return True
+    
+    def compute_datasets(self, operation, operand1, operand2, keep_result=False,
+                         chunk_size=DEFAULT_VECTOR_CHUNK, concurrency=4, timeout=None):
+        """
+        Operação vetorial com operandos guardados no servidor (ComputeVector
+        com num1_handle/num2_handle); cada operando é um handle de
+        upload_dataset ou um array enviado a cada chamada
+        Sem keep_result, o resultado volta em blocos de chunk_size elementos
+        (recortes offset/limit dos conjuntos), com até `concurrency` chamadas
+        pendentes; com keep_result, o resultado fica no servidor e volta
+        apenas o seu handle, para ser usado em outras operações
+        
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            operand1: Handle (str) ou array com os primeiros operandos
+            operand2: Handle (str) ou array com os segundos operandos
+            keep_result: Guarda o resultado no servidor
+            chunk_size: Elementos por chamada (sem keep_result)
+            concurrency: Máximo de chamadas pendentes
+            timeout: Prazo de cada chamada, em segundos
+        Returns:
+            Tupla (array de resultados, ou handle do resultado com keep_result,
+            array de índices com erro), ou None se falhar
+        """
+        operands = [
+            operand if isinstance(operand, str) else np.ascontiguousarray(operand, dtype=VECTOR_DTYPE)
+            for operand in (operand1, operand2)
+        ]
+        
+        def build_request(start=0, stop=None):
+            request = calculator_pb2.VectorRequest(
+                operation=OPERATION_CODES[operation],
+                offset=start,
+                limit=0 if stop is None else stop - start,
+                keep_result=keep_result
+            )
+            for name, operand in zip(('num1', 'num2'), operands):
+                if isinstance(operand, str):
+                    setattr(request, f'{name}_handle', operand)
+                else:
+                    setattr(request, name, operand[start:stop].tobytes())
+            return request
+        
+        try:
+            if keep_result:
+                response = self.stub.ComputeVector(build_request(), timeout=self._timeout(timeout))
+                errors = np.frombuffer(response.error_indices, dtype=VECTOR_INDEX_DTYPE)
+                print(f"✅ Operação vetorial realizada: {response.count} operações, "
+                      f"resultado no handle {response.result_handle}")
+                return response.result_handle, errors
+            
+            handle = next((operand for operand in operands if isinstance(operand, str)), None)
+            if handle is not None:
+                size = self.stub.GetDataset(calculator_pb2.DatasetRequest(handle=handle),
+                                            timeout=self._timeout(timeout)).count
+            else:
+                size = len(operands[0])
+            results = np.empty(size, dtype=VECTOR_DTYPE)
+            error_indices = []
+            window = deque()
+            
+            def collect():
+                start, future = window.popleft()
+                response = future.result()
+                results[start:start + response.count] = np.frombuffer(response.results, dtype=VECTOR_DTYPE)
+                if response.error_indices:
+                    error_indices.append(np.frombuffer(response.error_indices, dtype=VECTOR_INDEX_DTYPE) + start)
+            
+            for start in range(0, size, chunk_size):
+                if len(window) >= concurrency:
+                    collect()
+                window.append((start, self.stub.ComputeVector.future(
+                    build_request(start, min(start + chunk_size, size)), timeout=self._timeout(timeout))))
+            while window:
+                collect()
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        
+        errors = np.concatenate(error_indices) if error_indices else np.empty(0, dtype=np.int64)
+        print(f"✅ Operação vetorial realizada: {size} operações")
+        if len(errors):
+            print(f"⚠️  Divisão por zero em {len(errors)} elemento(s)")
+        return results, errors
+    
+    def dataset_store_stats(self, timeout=None):
+        """
+        Consulta a ocupação e os contadores do armazenamento de conjuntos do servidor
+        
+        Returns:
+            Dicionário com datasets, memory_bytes, max_bytes, spilled, spilled_bytes,
+            max_spill_bytes, hits, misses, evictions e spills, ou None se erro
+        """
+        try:
+            response = self.stub.GetDatasetStoreStats(calculator_pb2.DatasetStoreStatsRequest(),
+                                                      timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {field.name: getattr(response, field.name) for field in response.DESCRIPTOR.fields}
+    
+    def matrix_add(self, a, b, block_rows=None, timeout=None):
+        """
+        Soma de matrizes em streaming (MatrixAdd)
+        
+        Args:
+            a: Matriz 2D (array NumPy ou lista de listas)
+            b: Matriz com a mesma forma de a
+            block_rows: Linhas por bloco (padrão: blocos de ~1 MB)
+            timeout: Prazo do stream inteiro, em segundos
+        Returns:
+            Array NumPy com a + b, ou None se erro
+        """
+        a = np.asarray(a, dtype=MATRIX_DTYPE)
+        b = np.asarray(b, dtype=MATRIX_DTYPE)
+        if a.ndim != 2 or a.shape != b.shape:
+            print(f"❌ Erro: matrizes devem ter a mesma forma ({a.shape} e {b.shape})")
+            return None
+        block_rows = block_rows or block_rows_for(a.shape[1])
+        requests = (
+            calculator_pb2.MatrixAddChunk(
+                a=array_to_block(a[start:start + block_rows], row=start),
+                b=array_to_block(b[start:start + block_rows], row=start)
+            )
+            for start in range(0, a.shape[0], block_rows)
+        )
+        return self._matrix_call('MatrixAdd', requests, a.shape, "Soma de matrizes", timeout)
+    
+    def matrix_multiply(self, a, b, block_rows=None, timeout=None):
+        """
+        Produto de matrizes em streaming (MatrixMultiply)
+        B é enviada primeiro; A segue em blocos de linhas
+        
+        Args:
+            a: Matriz m x k
+            b: Matriz k x n
+            block_rows: Linhas por bloco (padrão: blocos de ~1 MB)
+            timeout: Prazo do stream inteiro, em segundos
+        Returns:
+            Array NumPy m x n com a @ b, ou None se erro
+        """
+        a = np.asarray(a, dtype=MATRIX_DTYPE)
+        b = np.asarray(b, dtype=MATRIX_DTYPE)
+        if a.ndim != 2 or b.ndim != 2 or a.shape[1] != b.shape[0]:
+            print(f"❌ Erro: formas incompatíveis para o produto ({a.shape} e {b.shape})")
+            return None
+        
+        def requests():
+            for block in iter_row_blocks(b, block_rows or block_rows_for(b.shape[1])):
+                yield calculator_pb2.MatrixMultiplyChunk(right=block)
+            for block in iter_row_blocks(a, block_rows or block_rows_for(a.shape[1])):
+                yield calculator_pb2.MatrixMultiplyChunk(left=block)
+        
+        return self._matrix_call('MatrixMultiply', requests(), (a.shape[0], b.shape[1]),
+                                 "Produto de matrizes", timeout)
+    
+    def matrix_transpose(self, a, block_rows=None, timeout=None):
+        """
+        Transposta em streaming (MatrixTranspose)
+        
+        Args:
+            a: Matriz 2D
+            block_rows: Linhas por bloco (padrão: blocos de ~1 MB)
+            timeout: Prazo do stream inteiro, em segundos
+        Returns:
+            Array NumPy com a transposta, ou None se erro
+        """
+        a = np.asarray(a, dtype=MATRIX_DTYPE)
+        if a.ndim != 2:
+            print(f"❌ Erro: esperada uma matriz 2D (forma {a.shape})")
+            return None
+        requests = iter_row_blocks(a, block_rows or block_rows_for(a.shape[1]))
+        return self._matrix_call('MatrixTranspose', requests, (a.shape[1], a.shape[0]), "Transposta", timeout)
+    
+    def _matrix_call(self, method_name, requests, shape, operation_name, timeout=None):
+        """
+        Executa um stream de matriz e monta o resultado a partir dos blocos
+        recebidos, cada um copiado direto para a sua posição
+        
+        Args:
+            method_name: MatrixAdd, MatrixMultiply ou MatrixTranspose
+            requests: Iterável com as mensagens do stream
+            shape: Forma do resultado
+            operation_name: Nome da operação para log
+            timeout: Prazo do stream inteiro, em segundos
+        Returns:
+            Array NumPy com o resultado, ou None se erro
+        """
+        result = np.empty(shape, dtype=MATRIX_DTYPE)
+        method = getattr(self._next_stub(), method_name)
+        try:
+            for block in method(requests, timeout=self._timeout(timeout), wait_for_ready=self.wait_for_ready):
+                result[block.row:block.row + block.rows, block.col:block.col + block.cols] = block_to_array(block)
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        print(f"✅ {operation_name}: resultado {shape[0]}x{shape[1]}")
+        return result
+    
+    def compute(self, operations, timeout=None):
+        """
+        Envia operações por um único stream bidirecional (Compute)
+        A tag de cada operação é a sua posição na sequência de entrada;
+        os resultados podem chegar fora de ordem
+        
+        Args:
+            operations: Iterável de tuplas (operação, num1, num2), com a
+                        operação em 'add', 'sub', 'mul' ou 'div'
+            timeout: Prazo do stream inteiro, em segundos
+        Yields:
+            Tuplas (tag, resultado), com resultado None se a operação falhar
+        """
+        requests = (
+            calculator_pb2.ComputeRequest(
+                tag=tag,
+                operation=OPERATION_CODES[operation],
+                num1=num1,
+                num2=num2
+            )
+            for tag, (operation, num1, num2) in enumerate(operations)
+        )
+        try:
+            responses = self._next_stub().Compute(requests, timeout=self._timeout(timeout),
+                                                  wait_for_ready=self.wait_for_ready)
+            for response in responses:
+                yield response.tag, (response.result if response.success else None)
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+    
+    def evaluate(self, expression, variables=None, timeout=None):
+        """
+        Chamada RPC para avaliação de expressão, ex.: "(a+b)*c/d"
+        
+        Args:
+            expression: Expressão aritmética
+            variables: Dicionário com os valores das variáveis
+            timeout: Prazo da chamada, em segundos
+        """
+        request = calculator_pb2.EvaluateRequest(expression=expression, variables=variables or {})
+        try:
+            response = self._invoke('Evaluate', request, timeout)
+            return self._handle_response(response, "Avaliação")
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+    
+    def plan_cache_stats(self, timeout=None):
+        """
+        Consulta os contadores do cache de expressões do servidor
+        
+        Returns:
+            Dicionário com hits, misses, evictions, size e capacity, ou None se erro
+        """
+        try:
+            response = self.stub.GetPlanCacheStats(calculator_pb2.PlanCacheStatsRequest(),
+                                                   timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {
+            'hits': response.hits,
+            'misses': response.misses,
+            'evictions': response.evictions,
+            'size': response.size,
+            'capacity': response.capacity,
+        }
+    
+    def stats(self, timeout=None):
+        """
+        Consulta as métricas do servidor por método
+        
+        Returns:
+            Dicionário método -> métricas (requests, errors, in_flight e
+            latências em microssegundos), ou None se erro
+        """
+        try:
+            response = self.stub.Stats(calculator_pb2.StatsRequest(), timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {
+            method.method: {
+                'requests': method.requests,
+                'errors': dict(method.errors),
+                'in_flight': method.in_flight,
+                'mean_us': method.mean_us,
+                'p50_us': method.p50_us,
+                'p90_us': method.p90_us,
+                'p99_us': method.p99_us,
+                'p999_us': method.p999_us,
+                'max_us': method.max_us,
+            }
+            for method in response.methods
+        }
+    
+    def client_stats(self, timeout=None):
+        """
+        Consulta os contadores por cliente do escalonamento justo do servidor
+        
+        Returns:
+            Dicionário cliente -> contadores (weight, rate_limit, requests, served,
+            throttled, rejected, queued, running, cost_us, wait_p50_us e
+            wait_p99_us); vazio se o servidor não usa --fair-scheduling;
+            None se erro
+        """
+        try:
+            response = self.stub.Stats(calculator_pb2.StatsRequest(), timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {
+            client.client: {
+                'weight': client.weight,
+                'rate_limit': client.rate_limit,
+                'requests': client.requests,
+                'served': client.served,
+                'throttled': client.throttled,
+                'rejected': client.rejected,
+                'queued': client.queued,
+                'running': client.running,
+                'cost_us': client.cost_us,
+                'wait_p50_us': client.wait_p50_us,
+                'wait_p99_us': client.wait_p99_us,
+            }
+            for client in response.clients
+        }
+    
+    def profile(self, action='status', mode='sampler', duration=0, interval_ms=0, sample_every=0,
+                timeout=None):
+        """
+        Controla o profiling do servidor em execução (RPC Profile; requer --profile-dir)
+        
+        Args:
+            action: 'status', 'start' ou 'stop'
+            mode: 'sampler' (pilhas de todas as threads) ou 'cprofile' (handlers)
+            duration: Encerra sozinho após N segundos (0: até action='stop')
+            interval_ms: Intervalo entre amostras do sampler (0: padrão do servidor)
+            sample_every: Modo cprofile: perfila 1 a cada N chamadas (0: padrão)
+            timeout: Prazo da chamada, em segundos
+        Returns:
+            Dicionário com active, mode, elapsed_seconds e files (arquivos
+            gravados no servidor), ou None se erro
+        """
+        request = calculator_pb2.ProfileRequest(
+            action=PROFILE_ACTIONS[action],
+            mode=PROFILE_MODES[mode],
+            duration_seconds=duration,
+            interval_ms=interval_ms,
+            sample_every=sample_every
+        )
+        try:
+            response = self.stub.Profile(request, timeout=self._timeout(timeout))
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.details()}")
+            return None
+        return {
+            'active': response.active,
+            'mode': response.mode,
+            'elapsed_seconds': response.elapsed_seconds,
+            'files': list(response.files),
+        }
+    
+    def backend_stats(self):
+        """
+        Estado do balanceamento de carga por servidor/canal
+        
+        Returns:
+            Lista de dicionários com target, outstanding, requests, failures
+            e ejected (segundos restantes de ejeção)
+        """
+        return self.balancer.snapshot()
+    
+    def resilience_stats(self):
+        """
+        Contadores de reenvios e cópias
+        
+        Returns:
+            Dicionário com 'retry' (orçamento da retry_policy) e 'hedging'
+            (HedgingPolicy.snapshot), None para políticas desativadas
+        """
+        return {
+            'retry': self.retry_policy.budget.snapshot() if self.retry_policy else None,
+            'hedging': self.hedging_policy.snapshot() if self.hedging_policy else None,
+        }
+    
     def _handle_response(self, response, operation_name):
         """
         Processa a resposta do servidor
@@ -91,12 +1264,560 @@ class CalculatorClient:
     
     def close(self):
         """
-        Fecha a conexão com o servidor
+        Fecha a conexão com o servidor (todos os canais do pool)
         """
-        self.channel.close()
+        if self._batcher is not None:
+            self._batcher.close()
+        for channel in self.channels:
+            channel.close()
         print("🔌 Conexão encerrada")
 
 
+class AsyncCalculatorClient:
+    """
+    Cliente asyncio (grpc.aio) do serviço Calculator
+    Todos os métodos são corrotinas que retornam OperationResult, sem imprimir;
+    deve ser criado e usado dentro de um event loop em execução
+    """
+    
+    def __init__(self, host='localhost', port='50051', channels=1,
+                 keepalive_time_ms=None, keepalive_timeout_ms=None,
+                 max_message_length=None, flow_control_window=None,
+                 wait_for_ready=None, target=None, targets=None, lb_policy='round_robin',
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, ejection_time=DEFAULT_EJECTION_TIME,
+                 default_timeout=None, retry_policy=None, hedging_policy=None, client_id=None):
+        """
+        Inicializa o cliente (mesmas opções do CalculatorClient)
+        
+        Args:
+            host: Endereço do servidor
+            port: Porta do servidor
+            channels: Número de canais por servidor
+            keepalive_time_ms: Intervalo entre pings de keepalive
+            keepalive_timeout_ms: Tempo de espera pela resposta do ping
+            max_message_length: Tamanho máximo das mensagens, em bytes
+            flow_control_window: Janela inicial de controle de fluxo HTTP/2, em bytes
+            wait_for_ready: Se True, as chamadas aguardam a conexão ficar pronta
+            target: Endereço completo do servidor (ex.: 'unix:/tmp/calculator.sock')
+            targets: Lista de servidores para balanceamento de carga no cliente
+            lb_policy: 'round_robin' ou 'least_outstanding'
+            failure_threshold: Falhas consecutivas até ejetar um servidor
+            ejection_time: Tempo base de ejeção de um servidor, em segundos
+            default_timeout: Prazo padrão das chamadas, em segundos
+            retry_policy: RetryPolicy para reenviar chamadas unárias
+            hedging_policy: HedgingPolicy para enviar cópias de chamadas lentas
+            client_id: Identificação enviada no metadado x-client-id
+        """
+        options = build_channel_options(
+            keepalive_time_ms, keepalive_timeout_ms,
+            max_message_length, flow_control_window,
+            dedicated_connection=channels > 1
+        )
+        backends = []
+        for backend_target in targets or [target or f'{host}:{port}']:
+            for _ in range(channels):
+                channel = grpc.aio.insecure_channel(
+                    backend_target, options=options,
+                    interceptors=async_client_id_interceptors(client_id) if client_id is not None else None)
+                backends.append(Backend(backend_target, channel, calculator_pb2_grpc.CalculatorStub(channel)))
+        self.balancer = LoadBalancer(backends, lb_policy, failure_threshold, ejection_time)
+        self.channels = [backend.channel for backend in backends]
+        self.wait_for_ready = wait_for_ready
+        self.default_timeout = default_timeout
+        self.retry_policy = retry_policy
+        self.hedging_policy = hedging_policy
+        self._budgets = unique_budgets(retry_policy, hedging_policy)
+    
+    async def connect(self, timeout=10):
+        """
+        Estabelece a conexão de todos os canais do pool
+        
+        Args:
+            timeout: Tempo máximo de espera por canal, em segundos
+        Raises:
+            asyncio.TimeoutError: Se algum canal não conectar a tempo
+        """
+        for channel in self.channels:
+            await asyncio.wait_for(channel.channel_ready(), timeout)
+    
+    async def _call(self, method_name, request, timeout=None):
+        """
+        Executa uma chamada unária no servidor/canal escolhido pelo balanceador,
+        com prazo, reenvios (retry_policy) e cópias (hedging_policy)
+        
+        Returns:
+            OperationResult
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for budget in self._budgets:
+            budget.record_request()
+        
+        attempt = 1
+        while True:
+            try:
+                response = await self._attempt(method_name, request, deadline)
+            except grpc.RpcError as e:
+                policy = self.retry_policy
+                if policy is None:
+                    return rpc_error_result(e)
+                backoff = policy.backoff(attempt)
+                if deadline is not None and time.monotonic() + backoff >= deadline:
+                    return rpc_error_result(e)
+                if not policy.should_retry(e.code(), attempt):
+                    return rpc_error_result(e)
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+            return response_result(response)
+    
+    async def _send(self, backend, method_name, request, deadline):
+        """
+        Envia a chamada a um backend reservado e libera a reserva ao terminar
+        """
+        code = grpc.StatusCode.OK
+        try:
+            return await getattr(backend.stub, method_name)(
+                request, timeout=remaining(deadline), wait_for_ready=self.wait_for_ready)
+        except grpc.RpcError as e:
+            code = e.code()
+            raise
+        except asyncio.CancelledError:
+            code = grpc.StatusCode.CANCELLED
+            raise
+        finally:
+            self.balancer.release(backend, code)
+    
+    async def _attempt(self, method_name, request, deadline):
+        """
+        Uma tentativa de chamada unária, com cópia após o atraso de hedging
+        (mesmo comportamento de CalculatorClient._attempt)
+        """
+        hedging = self.hedging_policy
+        delay = hedging.hedge_delay(method_name) if hedging is not None else None
+        started = time.perf_counter()
+        
+        if delay is None:
+            response = await self._send(self.balancer.acquire(), method_name, request, deadline)
+            if hedging is not None:
+                hedging.record(method_name, time.perf_counter() - started)
+            return response
+        
+        first = self.balancer.acquire()
+        tasks = [asyncio.ensure_future(self._send(first, method_name, request, deadline))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and hedging.try_hedge():
+                backend = self.balancer.acquire(exclude={first.target})
+                tasks.append(asyncio.ensure_future(self._send(backend, method_name, request, deadline)))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            hedging.record_win()
+                        hedging.record(method_name, time.perf_counter() - started)
+                        return task.result()
+                if not pending:
+                    raise done.pop().exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def calculate(self, operation, num1, num2, timeout=None):
+        """
+        Executa uma operação ('add', 'sub', 'mul' ou 'div')
+        
+        Returns:
+            OperationResult
+        """
+        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+        return await self._call(OPERATION_METHODS[operation], request, timeout)
+    
+    async def add(self, num1, num2, timeout=None):
+        """Adição"""
+        return await self.calculate('add', num1, num2, timeout)
+    
+    async def sub(self, num1, num2, timeout=None):
+        """Subtração"""
+        return await self.calculate('sub', num1, num2, timeout)
+    
+    async def mul(self, num1, num2, timeout=None):
+        """Multiplicação"""
+        return await self.calculate('mul', num1, num2, timeout)
+    
+    async def div(self, num1, num2, timeout=None):
+        """Divisão (divisão por zero retorna INVALID_ARGUMENT)"""
+        return await self.calculate('div', num1, num2, timeout)
+    
+    async def evaluate(self, expression, variables=None, timeout=None):
+        """Avaliação de expressão"""
+        request = calculator_pb2.EvaluateRequest(expression=expression, variables=variables or {})
+        return await self._call('Evaluate', request, timeout)
+    
+    async def map(self, operation, pairs, concurrency=DEFAULT_MAP_CONCURRENCY, timeout=None):
+        """
+        Executa a mesma operação sobre muitos pares com até `concurrency`
+        chamadas pendentes (cada worker consome o próximo par disponível)
+        
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            pairs: Iterável de tuplas (num1, num2)
+            concurrency: Máximo de chamadas pendentes
+            timeout: Prazo de cada chamada, em segundos
+        Returns:
+            Lista de OperationResult, na ordem de entrada
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser >= 1")
+        method_name = OPERATION_METHODS[operation]
+        pending = enumerate(pairs)
+        results = {}
+        
+        async def worker():
+            # O iterador é compartilhado: no event loop não há concorrência entre os next()
+            for index, (num1, num2) in pending:
+                request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+                results[index] = await self._call(method_name, request, timeout)
+        
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return [results[index] for index in range(len(results))]
+    
+    async def close(self):
+        """
+        Fecha todos os canais do pool
+        """
+        for channel in self.channels:
+            await channel.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+
+# Modo bulk: linhas por lote (cada operação do lote vira uma chamada ComputeVector)
+DEFAULT_BULK_BATCH_SIZE = 10000
+
+# Modo bulk: lotes pendentes ao mesmo tempo
+DEFAULT_BULK_CONCURRENCY = 4
+
+# Formatos de saída e colunas do modo bulk
+BULK_OUTPUT_FORMATS = ('csv', 'jsonl')
+BULK_COLUMNS = ('line', 'op', 'num1', 'num2', 'result', 'error')
+
+# Resultados infinitos ou NaN viram erro da linha (result vazio no CSV, null no JSONL)
+NON_FINITE_ERROR = "Erro: resultado não finito"
+
+
+def split_bulk_csv(text):
+    """
+    Campos de uma linha CSV do modo bulk (aceita aspas e espaços em volta)
+    
+    Returns:
+        Lista de campos sem espaços nas pontas
+    """
+    return [field.strip() for field in next(csv.reader([text], skipinitialspace=True), [])]
+
+
+def parse_bulk_line(text):
+    """
+    Lê uma operação do modo bulk, em CSV (add,10,5) ou JSONL
+    ({"op": "add", "num1": 10, "num2": 5} ou ["add", 10, 5])
+    
+    Args:
+        text: Linha sem espaços nas pontas
+    Returns:
+        Tupla (operação em minúsculas, num1, num2)
+    Raises:
+        ValueError: Se a linha for inválida, a operação desconhecida ou um
+                    número não finito
+    """
+    if text[0] in '{[':
+        item = json.loads(text)
+        fields = [item.get('op'), item.get('num1'), item.get('num2')] if isinstance(item, dict) else item
+    else:
+        fields = split_bulk_csv(text)
+    if not isinstance(fields, list) or len(fields) != 3:
+        raise ValueError("esperado op,num1,num2")
+    op = str(fields[0]).strip().lower()
+    if op not in OPERATION_CODES:
+        raise ValueError(f"Operação desconhecida ({fields[0]})")
+    try:
+        num1, num2 = float(fields[1]), float(fields[2])
+    except (TypeError, ValueError):
+        num1 = num2 = math.nan
+    if not (math.isfinite(num1) and math.isfinite(num2)):
+        raise ValueError(f"números inválidos ({fields[1]}, {fields[2]})")
+    return op, num1, num2
+
+
+def bulk_lines(source):
+    """
+    Linhas de operações de um arquivo do modo bulk, numeradas a partir de 1
+    Ignora linhas vazias, comentários (#) e o cabeçalho CSV (op,num1,num2)
+    
+    Yields:
+        Tuplas (número da linha, texto sem espaços nas pontas)
+    """
+    header = True
+    for number, line in enumerate(source, 1):
+        text = line.strip()
+        if not text or text[0] == '#':
+            continue
+        if header:
+            header = False
+            if split_bulk_csv(text.lower())[:1] == ['op']:
+                continue
+        yield number, text
+
+
+class BulkBatch:
+    """
+    Lote de linhas do modo bulk
+    As operações válidas são agrupadas por tipo e cada grupo vai em uma
+    chamada ComputeVector (operandos em bytes); os resultados voltam para
+    as posições das linhas. Linhas inválidas não são enviadas
+    """
+    
+    def __init__(self, lines):
+        """
+        Args:
+            lines: Lista de tuplas (número da linha, texto) de bulk_lines
+        """
+        self.rows = []
+        self.errors = {}
+        # Listas convertidas em arrays de uma vez (atribuir elemento a elemento
+        # em um array NumPy é mais lento)
+        codes, nums1, nums2 = [], [], []
+        for position, (number, text) in enumerate(lines):
+            try:
+                op, num1, num2 = parse_bulk_line(text)
+            except ValueError as e:
+                self.errors[position] = f"Erro: linha inválida: {e}"
+                self.rows.append((number, None, None, None))
+                op, num1, num2 = None, 0.0, 0.0
+            else:
+                self.rows.append((number, op, num1, num2))
+            codes.append(OPERATION_CODES.get(op, -1))
+            nums1.append(num1)
+            nums2.append(num2)
+        self.codes = np.array(codes, dtype=np.int8)
+        self.nums1 = np.array(nums1, dtype=VECTOR_DTYPE)
+        self.nums2 = np.array(nums2, dtype=VECTOR_DTYPE)
+        self.results = np.zeros(len(lines), dtype=VECTOR_DTYPE)
+        self.calls = []
+        self.started = None
+        self.finished = None
+        self.elapsed = 0.0
+    
+    def submit(self, client, timeout=None):
+        """
+        Dispara uma chamada ComputeVector por operação presente no lote
+        """
+        self.started = time.perf_counter()
+        for code in np.unique(self.codes[self.codes >= 0]):
+            indices = np.flatnonzero(self.codes == code)
+            request = calculator_pb2.VectorRequest(
+                operation=int(code),
+                num1=self.nums1[indices].tobytes(),
+                num2=self.nums2[indices].tobytes()
+            )
+            future = client._submit('ComputeVector', request, timeout)
+            future.add_done_callback(self._call_done)
+            self.calls.append((indices, future))
+    
+    def _call_done(self, call):
+        # Instante em que a última chamada terminou (não inclui a espera na janela)
+        self.finished = time.perf_counter()
+    
+    def collect(self):
+        """
+        Aguarda as chamadas do lote
+        
+        Returns:
+            True se nenhuma chamada falhou (erros por linha não contam)
+        """
+        success = True
+        for indices, future in self.calls:
+            try:
+                response = future.result()
+            except grpc.RpcError as e:
+                success = False
+                error_msg = f"Erro RPC: {e.code().name} - {e.details()}"
+                self.errors.update(dict.fromkeys(indices.tolist(), error_msg))
+                continue
+            results = np.frombuffer(response.results, dtype=VECTOR_DTYPE)
+            self.results[indices] = results
+            self.errors.update(dict.fromkeys(indices[~np.isfinite(results)].tolist(), NON_FINITE_ERROR))
+            zero = indices[np.frombuffer(response.error_indices, dtype=VECTOR_INDEX_DTYPE)]
+            self.errors.update(dict.fromkeys(zero.tolist(), ELEMENT_ERROR))
+        self.elapsed = (self.finished or time.perf_counter()) - self.started
+        return success
+    
+    def output_rows(self):
+        """
+        Yields:
+            Tuplas com as colunas BULK_COLUMNS, na ordem das linhas de entrada
+            (result None nas linhas com erro)
+        """
+        results = self.results.tolist()
+        for position, (number, op, num1, num2) in enumerate(self.rows):
+            error_msg = self.errors.get(position)
+            if error_msg:
+                yield number, op, num1, num2, None, error_msg
+            else:
+                yield number, op, num1, num2, results[position], ""
+
+
+def run_bulk(client, source, output, output_format='csv', batch_size=DEFAULT_BULK_BATCH_SIZE,
+             concurrency=DEFAULT_BULK_CONCURRENCY, timeout=None):
+    """
+    Executa as operações de um arquivo (ou stdin) em lotes, sem interação
+    Enquanto até `concurrency` lotes aguardam o servidor, o próximo lote é
+    lido e convertido; os resultados são gravados na ordem de entrada, à
+    medida que o lote mais antigo termina, sem carregar o arquivo inteiro
+    
+    Args:
+        client: CalculatorClient
+        source: Iterável de linhas (CSV op,num1,num2 ou JSONL)
+        output: Arquivo de texto de saída
+        output_format: 'csv' (com cabeçalho) ou 'jsonl'
+        batch_size: Linhas por lote
+        concurrency: Máximo de lotes pendentes
+        timeout: Prazo de cada chamada, em segundos
+    Returns:
+        Dicionário com lines, succeeded, failed (linhas com erro), batches,
+        failed_batches, elapsed (segundos) e latency (LatencyHistogram dos
+        lotes do envio à resposta, em microssegundos)
+    """
+    if output_format == 'csv':
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(BULK_COLUMNS)
+        write_rows = writer.writerows
+    else:
+        def write_rows(rows):
+            # Linhas com erro (inclusive resultados não finitos) têm result null;
+            # allow_nan=False garante que nenhum NaN/Infinity saia como JSON inválido
+            output.writelines(json.dumps(dict(zip(BULK_COLUMNS, row)), ensure_ascii=False, allow_nan=False) + "\n"
+                              for row in rows)
+    
+    summary = {'lines': 0, 'succeeded': 0, 'failed': 0, 'batches': 0, 'failed_batches': 0}
+    latency = LatencyHistogram()
+    window = deque()
+    
+    def drain():
+        batch = window.popleft()
+        if not batch.collect():
+            summary['failed_batches'] += 1
+        latency.record(batch.elapsed * 1e6)
+        write_rows(batch.output_rows())
+        summary['lines'] += len(batch.rows)
+        summary['failed'] += len(batch.errors)
+        summary['succeeded'] += len(batch.rows) - len(batch.errors)
+    
+    started = time.perf_counter()
+    lines = bulk_lines(source)
+    while True:
+        chunk = list(itertools.islice(lines, batch_size))
+        if not chunk:
+            break
+        batch = BulkBatch(chunk)
+        if len(window) >= concurrency:
+            drain()
+        batch.submit(client, timeout)
+        window.append(batch)
+        summary['batches'] += 1
+    while window:
+        drain()
+    output.flush()
+    summary['elapsed'] = time.perf_counter() - started
+    summary['latency'] = latency
+    return summary
+
+
+def print_bulk_summary(summary):
+    """
+    Imprime o resumo do modo bulk (em stderr quando a saída é stdout)
+    """
+    elapsed = summary['elapsed']
+    rate = summary['lines'] / elapsed if elapsed else 0.0
+    latency = summary['latency']
+    print(f"📊 Bulk: {summary['lines']:,} operações em {elapsed:.2f}s ({rate:,.0f} ops/s)")
+    print(f"   ✅ {summary['succeeded']:,} com sucesso | ❌ {summary['failed']:,} com erro")
+    print(f"   📦 {summary['batches']:,} lote(s), latência p50 {latency.percentile(0.5) / 1000:.1f} ms, "
+          f"p99 {latency.percentile(0.99) / 1000:.1f} ms")
+    if summary['failed_batches']:
+        print(f"   ⚠️  {summary['failed_batches']} lote(s) com falha de RPC")
+
+
+def run_bulk_cli(args):
+    """
+    Modo bulk pela linha de comando; as mensagens do cliente vão para stderr,
+    para não misturar com os resultados quando a saída é stdout
+    
+    Returns:
+        Código de saída: 0, ou 1 se algum lote falhou por erro de RPC
+    """
+    source = sys.stdin if args.bulk == '-' else open(args.bulk, newline='')
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            max_message_length = args.max_message_mb * 1024 * 1024 if args.max_message_mb else None
+            client = CalculatorClient(targets=args.targets, channels=args.channels,
+                                      max_message_length=max_message_length,
+                                      wait_for_ready=True, client_id=args.client_id)
+            try:
+                summary = run_bulk(client, source, output, args.output_format, args.batch_size,
+                                   args.concurrency, args.timeout)
+            finally:
+                client.close()
+            print_bulk_summary(summary)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if summary['failed_batches'] else 0
+
+
+def parse_args():
+    """
+    Lê as opções de linha de comando do cliente (sem --bulk: menu interativo)
+    """
+    parser = argparse.ArgumentParser(
+        description="Cliente da Calculadora Distribuída gRPC (menu interativo ou modo bulk)"
+    )
+    parser.add_argument('--target', action='append', dest='targets',
+                        help="Servidor (host:porta ou unix:caminho); repita para vários (padrão: localhost:50051)")
+    parser.add_argument('--client-id', default=None,
+                        help="Identificação enviada no metadado x-client-id (escalonamento justo)")
+    parser.add_argument('--bulk', metavar='ARQUIVO', default=None,
+                        help="Modo bulk: lê operações (CSV op,num1,num2 ou JSONL) do arquivo, ou de stdin com '-'")
+    parser.add_argument('--output', metavar='ARQUIVO', default='-',
+                        help="Modo bulk: arquivo de resultados (padrão: stdout)")
+    parser.add_argument('--output-format', choices=BULK_OUTPUT_FORMATS, default='csv',
+                        help="Modo bulk: formato dos resultados (padrão: csv)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BULK_BATCH_SIZE,
+                        help=f"Modo bulk: linhas por lote (padrão: {DEFAULT_BULK_BATCH_SIZE})")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_BULK_CONCURRENCY,
+                        help=f"Modo bulk: lotes pendentes ao mesmo tempo (padrão: {DEFAULT_BULK_CONCURRENCY})")
+    parser.add_argument('--channels', type=int, default=1,
+                        help="Modo bulk: canais (conexões HTTP/2) por servidor (padrão: 1)")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Modo bulk: prazo de cada chamada, em segundos")
+    parser.add_argument('--max-message-mb', type=int, default=None,
+                        help="Modo bulk: tamanho máximo das mensagens em MB (padrão do gRPC: 4), "
+                             "para lotes acima de ~250 mil linhas; use o mesmo valor no servidor")
+    args = parser.parse_args()
+    args.targets = args.targets or ['localhost:50051']
+    if args.batch_size < 1 or args.concurrency < 1:
+        parser.error("--batch-size e --concurrency devem ser >= 1")
+    return args
+
+
 def print_menu():
     """
     Exibe o menu interativo
@@ -178,12 +1899,16 @@ def run_tests(client):
 
 def main():
     """
-    Função principal - menu interativo
+    Função principal - menu interativo, ou modo bulk com --bulk
     """
+    args = parse_args()
+    if args.bulk is not None:
+        sys.exit(run_bulk_cli(args))
+    
     print("🚀 Iniciando Cliente da Calculadora Distribuída")
     
     try:
-        client = CalculatorClient()
+        client = CalculatorClient(targets=args.targets, client_id=args.client_id)
     except Exception as e:
         print(f"❌ Erro ao conectar ao servidor: {e}")
         print("💡 Certifique-se de que o servidor está rodando!")
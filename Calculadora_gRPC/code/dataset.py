@@ -0,0 +1,401 @@
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Formato dos conjuntos de dados: float64 little-endian (o mesmo de ComputeVector)
+DATASET_DTYPE = np.dtype('<f8')
+
+# Memória padrão reservada aos conjuntos de dados, em bytes
+DEFAULT_DATASET_MEMORY = 256 * 1024 * 1024
+
+# Máximo padrão de conjuntos guardados (em memória e em disco)
+DEFAULT_MAX_DATASETS = 1024
+
+# Extensão dos arquivos de conjuntos descarregados em disco
+SPILL_SUFFIX = '.f64'
+
+# Elementos por bloco ao percorrer um conjunto (download e agregados): 1 MB
+DATASET_CHUNK_SIZE = 1 << 17
+
+
+class DatasetError(RuntimeError):
+    """
+    Conjunto de dados que não cabe no armazenamento
+    """
+
+
+class UnknownDatasetError(DatasetError):
+    """
+    Handle inexistente, removido ou descartado pelo LRU
+    """
+
+
+class Dataset:
+    """
+    Conjunto de dados guardado no servidor
+    Os valores ficam em um array NumPy somente leitura, em memória ou
+    mapeado de um arquivo (np.memmap) depois de descarregado em disco
+    """
+
+    def __init__(self, handle, values):
+        self.handle = handle
+        self.values = values
+        self.path = None
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    @property
+    def spilled(self):
+        return self.path is not None
+
+    def info(self):
+        """
+        Returns:
+            Dicionário com handle, count, nbytes e spilled
+        """
+        return {
+            'handle': self.handle,
+            'count': len(self.values),
+            'nbytes': self.nbytes,
+            'spilled': self.spilled,
+        }
+
+
+class DatasetBuilder:
+    """
+    Acumula os blocos de um upload, limitando o tamanho total
+    Os blocos são concatenados uma única vez, ao final do stream
+    """
+
+    def __init__(self, max_bytes):
+        """
+        Args:
+            max_bytes: Tamanho máximo do conjunto, em bytes
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._blocks = []
+
+    def add(self, values):
+        """
+        Acrescenta um bloco de valores (array NumPy float64)
+
+        Raises:
+            DatasetError: Se o conjunto passar de max_bytes
+        """
+        self.nbytes += values.nbytes
+        if self.nbytes > self.max_bytes:
+            raise DatasetError(f"Conjunto maior que o limite de {self.max_bytes} bytes")
+        self._blocks.append(values)
+
+    def values(self):
+        """
+        Returns:
+            Array float64 com todos os blocos, na ordem de chegada
+        """
+        if not self._blocks:
+            return np.empty(0, dtype=DATASET_DTYPE)
+        return np.concatenate(self._blocks)
+
+
+class DatasetStore:
+    """
+    Armazenamento limitado de conjuntos de dados, indexado por handle
+    Os conjuntos são enviados uma vez (UploadDataset) e referenciados depois
+    pelas operações vetoriais e agregadas, sem reenviar os operandos.
+    A memória ocupada é contabilizada em bytes; ao passar de max_bytes, os
+    conjuntos usados há mais tempo (LRU) são descarregados em arquivos
+    mapeados em memória, se houver spill_dir, ou descartados. O disco também
+    é limitado (max_spill_bytes) e descarta pela mesma ordem.
+    Seguro para uso concorrente pelas threads do servidor; um handler que já
+    obteve o array continua a usá-lo mesmo que o conjunto seja descartado.
+    A escrita em disco acontece fora do lock: os conjuntos escolhidos ficam
+    em _spilling (ainda legíveis em memória) até o arquivo ser mapeado
+    """
+
+    def __init__(self, max_bytes=DEFAULT_DATASET_MEMORY, spill_dir=None, max_spill_bytes=None,
+                 max_datasets=DEFAULT_MAX_DATASETS):
+        """
+        Args:
+            max_bytes: Memória máxima ocupada pelos conjuntos, em bytes
+            spill_dir: Diretório dos arquivos mapeados em memória (None: sem disco)
+            max_spill_bytes: Espaço máximo em disco, em bytes (padrão: 4 x max_bytes)
+            max_datasets: Máximo de conjuntos guardados (em memória e em disco)
+        """
+        self.max_bytes = max_bytes
+        if not spill_dir:
+            max_spill_bytes = 0
+        elif max_spill_bytes is None:
+            max_spill_bytes = 4 * max_bytes
+        self.max_spill_bytes = max_spill_bytes
+        self.max_datasets = max_datasets
+        self.memory_bytes = 0
+        self.spilled_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spills = 0
+        # Diretório próprio do processo, removido em close
+        self.spill_dir = None
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self.spill_dir = tempfile.mkdtemp(prefix=f'datasets-{os.getpid()}-', dir=spill_dir)
+        # Ordem LRU: o primeiro item é o usado há mais tempo
+        self._memory = OrderedDict()
+        self._spilled = OrderedDict()
+        # Conjuntos sendo gravados em disco (contados em spilled_bytes)
+        self._spilling = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_dataset_bytes(self):
+        """Tamanho máximo de um único conjunto, em bytes"""
+        return max(self.max_bytes, self.max_spill_bytes)
+
+    def put(self, values):
+        """
+        Guarda um conjunto de dados
+
+        Args:
+            values: Array NumPy (ou sequência) de números; é convertido para
+                    float64 e não deve ser alterado depois
+        Returns:
+            Dicionário com handle, count, nbytes e spilled
+        Raises:
+            DatasetError: Se o conjunto for maior que o espaço disponível
+        """
+        values = np.ascontiguousarray(values, dtype=DATASET_DTYPE).ravel()
+        if values.nbytes > self.max_dataset_bytes:
+            raise DatasetError(f"Conjunto de {values.nbytes} bytes maior que o limite de "
+                               f"{self.max_dataset_bytes} bytes")
+        values.flags.writeable = False
+        dataset = Dataset(uuid.uuid4().hex, values)
+        with self._lock:
+            if values.nbytes > self.max_bytes:
+                # Grande demais para a memória: vai direto para o disco
+                self._start_spill(dataset)
+                to_spill = [dataset]
+            else:
+                self._memory[dataset.handle] = dataset
+                self.memory_bytes += dataset.nbytes
+                to_spill = []
+            to_spill, to_remove = self._enforce_limits(to_spill)
+        self._remove_files(to_remove)
+        self._write_spills(to_spill)
+        if values.nbytes > self.max_bytes and not dataset.spilled:
+            raise DatasetError(f"Não foi possível gravar o conjunto de {values.nbytes} bytes em disco")
+        return dataset.info()
+
+    def get(self, handle):
+        """
+        Valores de um conjunto (marca o conjunto como usado recentemente)
+
+        Returns:
+            Array NumPy float64 somente leitura
+        Raises:
+            UnknownDatasetError: Se o handle não existir
+        """
+        with self._lock:
+            return self._lookup(handle).values
+
+    def info(self, handle):
+        """
+        Returns:
+            Dicionário com handle, count, nbytes e spilled
+        Raises:
+            UnknownDatasetError: Se o handle não existir
+        """
+        with self._lock:
+            return self._lookup(handle).info()
+
+    def delete(self, handle):
+        """
+        Remove um conjunto
+
+        Returns:
+            Dicionário com handle, count, nbytes e spilled do conjunto removido
+        Raises:
+            UnknownDatasetError: Se o handle não existir
+        """
+        with self._lock:
+            dataset = self._memory.pop(handle, None)
+            if dataset is not None:
+                self.memory_bytes -= dataset.nbytes
+                return dataset.info()
+            dataset = self._spilling.pop(handle, None)
+            if dataset is not None:
+                # O arquivo é apagado por _write_spills ao terminar a gravação
+                self.spilled_bytes -= dataset.nbytes
+                return dataset.info()
+            dataset = self._spilled.pop(handle, None)
+            if dataset is None:
+                raise UnknownDatasetError(f"Conjunto de dados inexistente: {handle}")
+            self.spilled_bytes -= dataset.nbytes
+        self._remove_files([dataset.path])
+        return dataset.info()
+
+    def _lookup(self, handle):
+        """
+        Busca um conjunto e o move para o fim da ordem LRU (com o lock adquirido)
+        """
+        for datasets in (self._memory, self._spilled):
+            dataset = datasets.get(handle)
+            if dataset is not None:
+                datasets.move_to_end(handle)
+                self.hits += 1
+                return dataset
+        dataset = self._spilling.get(handle)
+        if dataset is not None:
+            self.hits += 1
+            return dataset
+        self.misses += 1
+        raise UnknownDatasetError(f"Conjunto de dados inexistente ou descartado: {handle}")
+
+    def _enforce_limits(self, to_spill):
+        """
+        Escolhe os conjuntos menos usados a descarregar ou descartar até
+        respeitar os limites (com o lock adquirido); a gravação e a remoção
+        dos arquivos ficam para depois de liberar o lock
+
+        Args:
+            to_spill: Conjuntos já marcados para gravação em disco
+        Returns:
+            Tupla (conjuntos a gravar em disco, arquivos a apagar)
+        """
+        to_spill = list(to_spill)
+        while self._memory and (self.memory_bytes > self.max_bytes or self._count() > self.max_datasets):
+            handle, dataset = self._memory.popitem(last=False)
+            self.memory_bytes -= dataset.nbytes
+            if self.spill_dir is not None and self._count() < self.max_datasets:
+                self._start_spill(dataset)
+                to_spill.append(dataset)
+            else:
+                self.evictions += 1
+        return to_spill, self._evict_spilled()
+
+    def _evict_spilled(self):
+        """
+        Descarta os conjuntos em disco menos usados até respeitar os limites
+        (com o lock adquirido)
+
+        Returns:
+            Arquivos a apagar
+        """
+        to_remove = []
+        while self._spilled and (self.spilled_bytes > self.max_spill_bytes or self._count() > self.max_datasets):
+            handle, dataset = self._spilled.popitem(last=False)
+            self.spilled_bytes -= dataset.nbytes
+            to_remove.append(dataset.path)
+            self.evictions += 1
+        return to_remove
+
+    def _count(self):
+        return len(self._memory) + len(self._spilled) + len(self._spilling)
+
+    def _start_spill(self, dataset):
+        """
+        Reserva o espaço em disco de um conjunto, que continua legível em
+        _spilling durante a gravação (com o lock adquirido)
+        """
+        self._spilling[dataset.handle] = dataset
+        self.spilled_bytes += dataset.nbytes
+
+    def _write_spills(self, datasets):
+        """
+        Grava os conjuntos em disco sem o lock e, com o lock, passa a lê-los por
+        arquivos mapeados em memória. O arquivo é apagado se a gravação falhar
+        ou se o conjunto tiver sido removido enquanto era gravado
+        """
+        for dataset in datasets:
+            path = os.path.join(self.spill_dir, dataset.handle + SPILL_SUFFIX)
+            try:
+                dataset.values.tofile(path)
+                values = dataset.values
+                if len(values):
+                    # Visão ndarray do mapeamento (o np.memmap segue vivo como base do array)
+                    values = np.asarray(np.memmap(path, dtype=DATASET_DTYPE, mode='r'))
+            except OSError:
+                values = None
+            with self._lock:
+                pending = self._spilling.pop(dataset.handle, None) is dataset
+                if pending and values is not None:
+                    dataset.values = values
+                    dataset.path = path
+                    self._spilled[dataset.handle] = dataset
+                    self.spills += 1
+                    to_remove = self._evict_spilled()
+                else:
+                    if pending:
+                        # Falha ao gravar: o conjunto é descartado
+                        self.spilled_bytes -= dataset.nbytes
+                        self.evictions += 1
+                    to_remove = [path]
+            self._remove_files(to_remove)
+
+    def _remove_files(self, paths):
+        """
+        Apaga arquivos de conjuntos descarregados em disco (sem o lock); handlers
+        que já mapearam um arquivo continuam a lê-lo até soltarem o array
+        """
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """
+        Returns:
+            Dicionário com datasets, memory_bytes, max_bytes, spilled,
+            spilled_bytes, max_spill_bytes, hits, misses, evictions e spills
+        """
+        with self._lock:
+            return {
+                'datasets': self._count(),
+                'memory_bytes': self.memory_bytes,
+                'max_bytes': self.max_bytes,
+                'spilled': len(self._spilled) + len(self._spilling),
+                'spilled_bytes': self.spilled_bytes,
+                'max_spill_bytes': self.max_spill_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'spills': self.spills,
+            }
+
+    def render_text(self):
+        """
+        Ocupação e contadores do armazenamento no formato texto do Prometheus
+        """
+        stats = self.stats()
+        return (
+            "# TYPE calculator_datasets gauge\n"
+            f"calculator_datasets {stats['datasets']}\n"
+            "# TYPE calculator_dataset_bytes gauge\n"
+            f'calculator_dataset_bytes{{tier="memory"}} {stats["memory_bytes"]}\n'
+            f'calculator_dataset_bytes{{tier="disk"}} {stats["spilled_bytes"]}\n'
+            "# TYPE calculator_dataset_evictions_total counter\n"
+            f"calculator_dataset_evictions_total {stats['evictions']}\n"
+            "# TYPE calculator_dataset_spills_total counter\n"
+            f"calculator_dataset_spills_total {stats['spills']}\n"
+        )
+
+    def close(self):
+        """
+        Descarta todos os conjuntos e remove os arquivos em disco
+        """
+        with self._lock:
+            self._memory.clear()
+            self._spilled.clear()
+            self._spilling.clear()
+            self.memory_bytes = self.spilled_bytes = 0
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
@@ -0,0 +1,194 @@
+import ast
+import operator
+import threading
+from collections import OrderedDict
+
+
+# Tamanho máximo aceito para uma expressão (evita recursão profunda no parser)
+MAX_EXPRESSION_LENGTH = 4096
+
+# Capacidade padrão do cache de planos compilados
+DEFAULT_PLAN_CACHE_SIZE = 1024
+
+# Operadores permitidos nas expressões
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+class ExpressionError(ValueError):
+    """
+    Erro de sintaxe ou de construção não permitida em uma expressão
+    """
+
+
+class CompiledExpression:
+    """
+    Plano de avaliação de uma expressão aritmética
+    A árvore sintática é convertida uma única vez em funções aninhadas;
+    avaliar o plano não envolve parsing nem eval
+    """
+
+    def __init__(self, text, plan, variables):
+        self.text = text
+        self.variables = variables
+        self._plan = plan
+
+    def evaluate(self, bindings):
+        """
+        Avalia o plano com os valores das variáveis
+
+        Args:
+            bindings: Mapeamento nome -> valor
+        Returns:
+            Resultado da expressão
+        Raises:
+            ExpressionError: Se alguma variável não tiver valor
+            ZeroDivisionError: Em divisão por zero
+        """
+        missing = self.variables.difference(bindings)
+        if missing:
+            raise ExpressionError(f"Variável(is) sem valor: {', '.join(sorted(missing))}")
+        return self._plan(bindings)
+
+
+def compile_expression(text):
+    """
+    Faz o parsing seguro de uma expressão e a compila em um plano de avaliação
+    Aceita números, variáveis, parênteses, + - * / e sinais unários
+
+    Args:
+        text: Expressão, ex.: "(a+b)*c/d"
+    Returns:
+        CompiledExpression
+    Raises:
+        ExpressionError: Se a expressão for inválida
+    """
+    if len(text) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"Expressão maior que {MAX_EXPRESSION_LENGTH} caracteres")
+    try:
+        tree = ast.parse(text, mode='eval')
+    except (SyntaxError, RecursionError) as e:
+        raise ExpressionError(f"Expressão inválida: {text!r}") from e
+
+    variables = set()
+    try:
+        plan, _ = _compile_node(tree.body, variables)
+    except RecursionError as e:
+        raise ExpressionError("Expressão com aninhamento excessivo") from e
+    return CompiledExpression(text, plan, frozenset(variables))
+
+
+def _compile_node(node, variables):
+    """
+    Compila um nó da árvore sintática
+
+    Returns:
+        Tupla (função bindings -> valor, valor constante ou None)
+        Subexpressões só com constantes são resolvidas em tempo de compilação
+    """
+    if isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float):
+            raise ExpressionError(f"Constante não suportada: {node.value!r}")
+        value = float(node.value)
+        return (lambda bindings: value), value
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        variables.add(name)
+        return (lambda bindings: bindings[name]), None
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        function = UNARY_OPERATORS[type(node.op)]
+        operand, constant = _compile_node(node.operand, variables)
+        if constant is not None:
+            value = function(constant)
+            return (lambda bindings: value), value
+        return (lambda bindings: function(operand(bindings))), None
+
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        function = BINARY_OPERATORS[type(node.op)]
+        left, left_constant = _compile_node(node.left, variables)
+        right, right_constant = _compile_node(node.right, variables)
+        if left_constant is not None and right_constant is not None:
+            try:
+                value = function(left_constant, right_constant)
+            except ZeroDivisionError:
+                # Mantém o erro para o momento da avaliação
+                pass
+            else:
+                return (lambda bindings: value), value
+        return (lambda bindings: function(left(bindings), right(bindings))), None
+
+    if isinstance(node, (ast.BinOp, ast.UnaryOp)):
+        raise ExpressionError(f"Operador não permitido: {type(node.op).__name__}")
+    raise ExpressionError(f"Construção não permitida: {type(node).__name__}")
+
+
+class PlanCache:
+    """
+    Cache LRU limitado de planos compilados, indexado pelo texto da expressão
+    Seguro para uso concorrente pelas threads do servidor
+    """
+
+    def __init__(self, capacity=DEFAULT_PLAN_CACHE_SIZE):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text):
+        """
+        Retorna o plano da expressão, compilando-o em caso de miss
+
+        Args:
+            text: Expressão
+        Returns:
+            Tupla (CompiledExpression, True se veio do cache)
+        Raises:
+            ExpressionError: Se a expressão for inválida (não é armazenada)
+        """
+        with self._lock:
+            plan = self._plans.get(text)
+            if plan is not None:
+                self._plans.move_to_end(text)
+                self.hits += 1
+                return plan, True
+            self.misses += 1
+
+        # Compila fora do lock para não serializar as outras threads
+        plan = compile_expression(text)
+
+        with self._lock:
+            self._plans[text] = plan
+            self._plans.move_to_end(text)
+            while len(self._plans) > self.capacity:
+                self._plans.popitem(last=False)
+                self.evictions += 1
+        return plan, False
+
+    def stats(self):
+        """
+        Retorna os contadores do cache
+
+        Returns:
+            Dicionário com hits, misses, evictions, size e capacity
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._plans),
+                'capacity': self.capacity,
+            }
@@ -0,0 +1,487 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent import futures
+
+import grpc
+
+from interceptors import replace_behavior
+from metrics import LatencyHistogram, escape_label_value
+
+
+# Metadado com a identificação do cliente (sem ele, vale o endereço do peer, sem a porta)
+CLIENT_ID_METADATA = 'x-client-id'
+
+# Cliente das chamadas sem metadado e sem peer conhecido
+ANONYMOUS_CLIENT = 'anonymous'
+
+# Custo inicial estimado de uma chamada, em segundos (ajustado pela média observada)
+DEFAULT_CALL_COST = 0.001
+
+# Peso de cada nova medição na média de custo por cliente
+COST_SMOOTHING = 0.2
+
+# Clientes mantidos; acima disso os inativos há mais tempo são descartados
+DEFAULT_MAX_CLIENTS = 10000
+
+# Mensagens enviadas ao cliente quando a chamada é rejeitada
+RATE_LIMIT_MESSAGE = "Limite de taxa do cliente {client} excedido ({rate:g} chamadas/s)"
+QUEUE_FULL_MESSAGE = "Fila do cliente {client} cheia ({limit} chamadas aguardando)"
+
+# Rejeição a aplicar pela chamada em execução na thread do FairScheduler
+_current = threading.local()
+
+
+class TokenBucket:
+    """
+    Limite de taxa (token bucket): `rate` fichas por segundo, até `burst` acumuladas
+    Não é thread-safe; o FairScheduler o usa sob o seu lock
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate: Chamadas por segundo
+            burst: Rajada máxima (padrão: 1 segundo de chamadas, no mínimo 1)
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+
+    def try_take(self, now):
+        """
+        Consome uma ficha
+
+        Returns:
+            True se a chamada está dentro do limite
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _Task:
+    """Chamada na fila de um cliente, com as marcas de tempo virtual do WFQ"""
+
+    __slots__ = ('start', 'finish', 'fn', 'args', 'kwargs', 'future', 'enqueued')
+
+    def __init__(self, start, finish, fn, args, kwargs, future, enqueued):
+        self.start = start
+        self.finish = finish
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+        self.enqueued = enqueued
+
+
+class ClientState:
+    """
+    Fila, limite de taxa e contadores de um cliente
+    """
+
+    def __init__(self, client_id, weight, bucket):
+        self.client_id = client_id
+        self.weight = weight
+        self.bucket = bucket
+        self.queue = deque()
+        self.last_finish = 0.0
+        self.cost = None
+        self.requests = 0
+        self.served = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.running = 0
+        self.last_seen = time.monotonic()
+        self.wait = LatencyHistogram()
+
+    def is_idle(self):
+        """True se o cliente não tem chamadas na fila nem em execução"""
+        return not self.queue and not self.running
+
+
+class FairScheduler:
+    """
+    Escalonador justo das chamadas do servidor síncrono entre clientes
+    Cada cliente (metadado x-client-id ou endereço do peer) tem a sua fila;
+    as threads atendem as filas por weighted fair queueing (start-time fair
+    queueing): cada chamada recebe uma marca de término virtual igual ao
+    início + custo estimado / peso do cliente, e a menor marca é atendida
+    primeiro. O custo é a média do tempo de execução das chamadas do próprio
+    cliente, de modo que um cliente com chamadas pesadas (lotes, vetores)
+    recebe a mesma fração de tempo de CPU, e não de chamadas, que os demais.
+    Limites de taxa (token bucket) e de fila por cliente rejeitam o excedente
+    com RESOURCE_EXHAUSTED antes de ocupar uma thread com o handler
+    """
+
+    def __init__(self, workers=10, weights=None, default_weight=1.0, rate_limit=None,
+                 client_rate_limits=None, burst=None, max_queue=None,
+                 max_clients=DEFAULT_MAX_CLIENTS):
+        """
+        Args:
+            workers: Threads que executam os handlers
+            weights: Dicionário cliente -> peso (ex.: {'batch': 0.5, 'web': 4})
+            default_weight: Peso dos clientes não listados
+            rate_limit: Chamadas/s de cada cliente não listado em client_rate_limits
+                        (None: sem limite)
+            client_rate_limits: Dicionário cliente -> chamadas/s
+            burst: Rajada do token bucket (padrão: 1 segundo de chamadas)
+            max_queue: Máximo de chamadas aguardando na fila de um cliente (None: sem limite)
+            max_clients: Clientes mantidos em memória (os inativos há mais tempo são descartados)
+        """
+        if workers < 1:
+            raise ValueError("workers deve ser >= 1")
+        self.workers = workers
+        self.weights = dict(weights or {})
+        self.default_weight = default_weight
+        self.rate_limit = rate_limit
+        self.client_rate_limits = dict(client_rate_limits or {})
+        self.burst = burst
+        self.max_queue = max_queue
+        self.max_clients = max_clients
+        self._clients = {}
+        # Heap de (marca de término da chamada da frente, sequência, cliente) dos clientes com fila
+        self._ready = []
+        self._rejections = deque()
+        self._virtual_time = 0.0
+        self._mean_cost = DEFAULT_CALL_COST
+        self._sequence = itertools.count()
+        self._executors = {}
+        self._peer_executor = ClientExecutor(self)
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"fair-scheduler_{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def executor_for(self, client_id):
+        """
+        Executor que encaminha as chamadas do cliente (None: identifica pelo endereço do peer)
+        """
+        if client_id is None:
+            return self._peer_executor
+        executor = self._executors.get(client_id)
+        if executor is None:
+            with self._condition:
+                if len(self._executors) >= self.max_clients:
+                    # Executores não têm estado: são recriados sob demanda
+                    self._executors.clear()
+                executor = self._executors.setdefault(client_id, ClientExecutor(self, client_id))
+        return executor
+
+    def submit(self, client_id, fn, args=(), kwargs=None):
+        """
+        Enfileira uma chamada na fila do cliente
+
+        Returns:
+            concurrent.futures.Future com o resultado de fn
+        """
+        future = futures.Future()
+        now = time.monotonic()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("FairScheduler encerrado")
+            client = self._client(client_id)
+            client.requests += 1
+            client.last_seen = now
+            rejection = None
+            if client.bucket is not None and not client.bucket.try_take(now):
+                client.throttled += 1
+                rejection = RATE_LIMIT_MESSAGE.format(client=client_id, rate=client.bucket.rate)
+            elif self.max_queue is not None and len(client.queue) >= self.max_queue:
+                client.rejected += 1
+                rejection = QUEUE_FULL_MESSAGE.format(client=client_id, limit=self.max_queue)
+
+            if rejection is not None:
+                # Rejeições são respondidas antes das filas: custam apenas o abort
+                self._rejections.append((fn, args, kwargs or {}, future, rejection))
+            else:
+                start = max(self._virtual_time, client.last_finish)
+                cost = client.cost if client.cost is not None else self._mean_cost
+                client.last_finish = start + cost / client.weight
+                client.queue.append(_Task(start, client.last_finish, fn, args, kwargs or {}, future, now))
+                if len(client.queue) == 1:
+                    heapq.heappush(self._ready, (client.last_finish, next(self._sequence), client))
+            self._condition.notify()
+        return future
+
+    def _client(self, client_id):
+        """
+        Estado do cliente (criado no primeiro uso); chamado sob o lock
+        """
+        client = self._clients.get(client_id)
+        if client is not None:
+            return client
+        if len(self._clients) >= self.max_clients:
+            self._evict_idle()
+        rate = self.client_rate_limits.get(client_id, self.rate_limit)
+        bucket = TokenBucket(rate, self.burst) if rate else None
+        client = ClientState(client_id, self.weights.get(client_id, self.default_weight), bucket)
+        self._clients[client_id] = client
+        return client
+
+    def _evict_idle(self):
+        """
+        Descarta os clientes inativos há mais tempo (10% do máximo)
+        """
+        idle = sorted((client for client in self._clients.values() if client.is_idle()),
+                      key=lambda client: client.last_seen)
+        for client in idle[:max(1, self.max_clients // 10)]:
+            del self._clients[client.client_id]
+
+    def _worker(self):
+        """
+        Thread que executa as rejeições e as chamadas com a menor marca de término
+        """
+        while True:
+            with self._condition:
+                while not self._rejections and not self._ready and not self._shutdown:
+                    self._condition.wait()
+                if self._rejections:
+                    fn, args, kwargs, future, rejection = self._rejections.popleft()
+                    task = None
+                elif self._ready:
+                    _, _, client = heapq.heappop(self._ready)
+                    task = client.queue.popleft()
+                    if client.queue:
+                        heapq.heappush(self._ready, (client.queue[0].finish, next(self._sequence), client))
+                    self._virtual_time = task.start
+                    client.running += 1
+                    client.wait.record((time.monotonic() - task.enqueued) * 1e6)
+                else:
+                    return
+
+            if task is None:
+                _current.rejection = rejection
+                try:
+                    self._run(future, fn, args, kwargs)
+                finally:
+                    _current.rejection = None
+                continue
+
+            started = time.perf_counter()
+            self._run(task.future, task.fn, task.args, task.kwargs)
+            elapsed = time.perf_counter() - started
+            with self._condition:
+                client.running -= 1
+                client.served += 1
+                if client.cost is None:
+                    client.cost = elapsed
+                else:
+                    client.cost += COST_SMOOTHING * (elapsed - client.cost)
+                self._mean_cost += COST_SMOOTHING * (elapsed - self._mean_cost)
+
+    @staticmethod
+    def _run(future, fn, args, kwargs):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def snapshot(self):
+        """
+        Returns:
+            Lista de dicionários por cliente (ordenada pelo id): client, weight,
+            rate_limit, requests, served, throttled, rejected, queued, running,
+            cost_us (custo médio estimado) e wait_p50_us/wait_p99_us (espera na fila)
+        """
+        with self._condition:
+            clients = sorted(self._clients.items())
+            return [
+                {
+                    'client': client_id,
+                    'weight': client.weight,
+                    'rate_limit': client.bucket.rate if client.bucket is not None else 0.0,
+                    'requests': client.requests,
+                    'served': client.served,
+                    'throttled': client.throttled,
+                    'rejected': client.rejected,
+                    'queued': len(client.queue),
+                    'running': client.running,
+                    'cost_us': (client.cost or 0.0) * 1e6,
+                    'wait_p50_us': client.wait.percentile(0.5),
+                    'wait_p99_us': client.wait.percentile(0.99),
+                }
+                for client_id, client in clients
+            ]
+
+    def render_text(self):
+        """
+        Contadores por cliente no formato texto do Prometheus
+        """
+        lines = [
+            "# TYPE calculator_client_requests_total counter",
+            "# TYPE calculator_client_throttled_total counter",
+            "# TYPE calculator_client_rejected_total counter",
+            "# TYPE calculator_client_queued gauge",
+            "# TYPE calculator_client_queue_wait_seconds summary",
+        ]
+        for client in self.snapshot():
+            label = f'client="{escape_label_value(client["client"])}"'
+            lines.append(f'calculator_client_requests_total{{{label}}} {client["requests"]}')
+            lines.append(f'calculator_client_throttled_total{{{label}}} {client["throttled"]}')
+            lines.append(f'calculator_client_rejected_total{{{label}}} {client["rejected"]}')
+            lines.append(f'calculator_client_queued{{{label}}} {client["queued"]}')
+            for name, quantile in (('wait_p50_us', 0.5), ('wait_p99_us', 0.99)):
+                lines.append(f'calculator_client_queue_wait_seconds{{{label},quantile="{quantile}"}} '
+                             f'{client[name] / 1e6:.6f}')
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self):
+        """
+        Encerra as threads após atender as chamadas já enfileiradas
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+
+class ClientExecutor(futures.ThreadPoolExecutor):
+    """
+    Executor de um cliente que encaminha as chamadas ao FairScheduler
+    O gRPC executa o handler no executor indicado pelo atributo
+    experimental_thread_pool do behavior, desde que seja um ThreadPoolExecutor;
+    esta classe não cria threads próprias
+    """
+
+    def __init__(self, scheduler, client_id=None):
+        """
+        Args:
+            scheduler: FairScheduler
+            client_id: Identificação do cliente (None: endereço do peer)
+        """
+        # ThreadPoolExecutor.__init__ não é chamado: as threads são as do scheduler
+        self.scheduler = scheduler
+        self.client_id = client_id
+
+    def submit(self, fn, /, *args, **kwargs):
+        client_id = self.client_id or task_peer(args) or ANONYMOUS_CLIENT
+        return self.scheduler.submit(client_id, fn, args, kwargs)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        pass
+
+
+def peer_address(peer):
+    """
+    Endereço do peer sem a porta de origem, que muda a cada conexão
+    ex.: 'ipv4:127.0.0.1:52566' -> 'ipv4:127.0.0.1',
+    'ipv6:%5B::1%5D:47168' -> 'ipv6:%5B::1%5D' ('unix:...' não muda)
+
+    Args:
+        peer: Peer da chamada, como em call.peer()
+    Returns:
+        Endereço usado como identificação do cliente
+    """
+    if peer.startswith(('ipv4:', 'ipv6:')):
+        address, separator, port = peer.rpartition(':')
+        if separator and port.isdigit():
+            return address
+    return peer
+
+
+def task_peer(args):
+    """
+    Endereço do peer da chamada a partir dos argumentos que o gRPC passa ao
+    executor (o evento da RPC, com call.peer()), ex.: 'ipv4:127.0.0.1'.
+    Vários canais (ou reconexões) do mesmo host contam como um único cliente
+
+    Returns:
+        Endereço do peer (sem a porta), ou None se não encontrado
+    """
+    for arg in args:
+        call = getattr(arg, 'call', None)
+        if call is not None and hasattr(call, 'peer'):
+            try:
+                peer = call.peer()
+            except Exception:
+                return None
+            return peer_address(peer.decode() if isinstance(peer, bytes) else peer)
+    return None
+
+
+def client_id_from_metadata(metadata):
+    """
+    Valor do metadado x-client-id, ou None
+    """
+    for key, value in metadata or ():
+        if key == CLIENT_ID_METADATA:
+            return value
+    return None
+
+
+def parse_client_values(values, option):
+    """
+    Converte opções "CLIENTE=VALOR" da linha de comando em dicionário
+
+    Args:
+        values: Lista de strings, ex.: ['batch=0.5', 'web=4']
+        option: Nome da opção, para a mensagem de erro
+    Returns:
+        Dicionário cliente -> valor (float)
+    """
+    parsed = {}
+    for value in values or []:
+        client, _, number = value.rpartition('=')
+        try:
+            number = float(number)
+        except ValueError:
+            number = 0
+        if not client or number <= 0:
+            raise ValueError(f"{option} inválido: {value!r} (use CLIENTE=N, com N > 0)")
+        parsed[client] = number
+    return parsed
+
+
+class FairSchedulingInterceptor(grpc.ServerInterceptor):
+    """
+    Encaminha cada chamada à fila do seu cliente no FairScheduler
+    O handler passa a indicar o executor do cliente (experimental_thread_pool);
+    chamadas rejeitadas pelo limite de taxa ou de fila terminam com
+    RESOURCE_EXHAUSTED sem executar o handler
+    """
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        executor = self.scheduler.executor_for(client_id_from_metadata(handler_call_details.invocation_metadata))
+
+        if handler.response_streaming:
+            def wrap(behavior):
+                def wrapper(request, context):
+                    rejection = getattr(_current, 'rejection', None)
+                    if rejection is not None:
+                        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, rejection)
+                    yield from behavior(request, context)
+                wrapper.experimental_thread_pool = executor
+                return wrapper
+        else:
+            def wrap(behavior):
+                def wrapper(request, context):
+                    rejection = getattr(_current, 'rejection', None)
+                    if rejection is not None:
+                        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, rejection)
+                    return behavior(request, context)
+                wrapper.experimental_thread_pool = executor
+                return wrapper
+
+        return replace_behavior(handler, wrap)
@@ -0,0 +1,140 @@
+import asyncio
+
+import grpc
+
+
+# Mapeia o código numérico de status para o enum grpc.StatusCode
+_STATUS_BY_VALUE = {status.value[0]: status for status in grpc.StatusCode}
+
+
+def final_status(context, error=None):
+    """
+    Determina o código de status final de uma chamada
+
+    Args:
+        context: Contexto gRPC (sync ou asyncio)
+        error: Exceção lançada pelo handler, se houver
+    Returns:
+        grpc.StatusCode
+    """
+    code = context.code()
+    if isinstance(code, int):
+        code = _STATUS_BY_VALUE.get(code, grpc.StatusCode.UNKNOWN)
+    if code is not None:
+        return code
+    if isinstance(error, (GeneratorExit, asyncio.CancelledError)):
+        return grpc.StatusCode.CANCELLED
+    return grpc.StatusCode.UNKNOWN if error is not None else grpc.StatusCode.OK
+
+
+def wrap_handler(handler, before, after):
+    """
+    Envolve a execução real de um handler (servidor síncrono)
+    Diferente de medir continuation(), cobre o processamento completo da
+    chamada, inclusive o consumo do stream de resposta
+
+    Args:
+        handler: grpc.RpcMethodHandler retornado pela continuation (ou None)
+        before: Função before(context) -> token, chamada antes do handler
+        after: Função after(token, code), chamada ao final com o status
+    Returns:
+        Novo RpcMethodHandler (ou None se o método não existir)
+    """
+    if handler is None:
+        return None
+
+    if handler.response_streaming:
+        def wrap(behavior):
+            def wrapper(request, context):
+                token = before(context)
+                error = None
+                try:
+                    yield from behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    after(token, final_status(context, error))
+            return wrapper
+    else:
+        def wrap(behavior):
+            def wrapper(request, context):
+                token = before(context)
+                error = None
+                try:
+                    return behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    after(token, final_status(context, error))
+            return wrapper
+
+    return replace_behavior(handler, wrap)
+
+
+def wrap_handler_async(handler, before, after):
+    """
+    Versão de wrap_handler para o servidor asyncio (grpc.aio)
+
+    Args:
+        handler: grpc.RpcMethodHandler retornado pela continuation (ou None)
+        before: Função before(context) -> token
+        after: Função after(token, code)
+    Returns:
+        Novo RpcMethodHandler (ou None se o método não existir)
+    """
+    if handler is None:
+        return None
+
+    if handler.response_streaming:
+        def wrap(behavior):
+            async def wrapper(request, context):
+                token = before(context)
+                error = None
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    after(token, final_status(context, error))
+            return wrapper
+    else:
+        def wrap(behavior):
+            async def wrapper(request, context):
+                token = before(context)
+                error = None
+                try:
+                    return await behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    after(token, final_status(context, error))
+            return wrapper
+
+    return replace_behavior(handler, wrap)
+
+
+def replace_behavior(handler, wrap):
+    """
+    Substitui o behavior correspondente à cardinalidade do handler
+    O executor escolhido por um interceptor interno (atributo
+    experimental_thread_pool, ver fairness.py) é mantido no novo behavior
+    """
+    def keep_pool(behavior):
+        wrapped = wrap(behavior)
+        pool = getattr(behavior, 'experimental_thread_pool', None)
+        if pool is not None:
+            wrapped.experimental_thread_pool = pool
+        return wrapped
+
+    if handler.request_streaming and handler.response_streaming:
+        return handler._replace(stream_stream=keep_pool(handler.stream_stream))
+    if handler.request_streaming:
+        return handler._replace(stream_unary=keep_pool(handler.stream_unary))
+    if handler.response_streaming:
+        return handler._replace(unary_stream=keep_pool(handler.unary_stream))
+    return handler._replace(unary_unary=keep_pool(handler.unary_unary))
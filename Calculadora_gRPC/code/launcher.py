@@ -0,0 +1,337 @@
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+
+from log_config import configure_logging
+from metrics import PERCENTILES, LatencyHistogram, MetricsRegistry
+from profiling import install_signal_handlers
+from server import (
+    AsyncLoggingInterceptor,
+    LoggingInterceptor,
+    add_server_arguments,
+    build_server,
+    check_server_args,
+    listen_addresses,
+    parse_args as parse_server_args,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Espera máxima pelo encerramento dos workers, em segundos
+SHUTDOWN_TIMEOUT = 5.0
+
+
+def worker_snapshot(worker_id, metrics, final=False):
+    """
+    Snapshot serializável das métricas de um worker
+
+    Args:
+        worker_id: Índice do worker
+        metrics: MetricsRegistry do worker
+        final: True no último snapshot, enviado ao encerrar
+    Returns:
+        Dicionário com worker, pid, uptime, final e métricas por método
+    """
+    return {
+        'worker': worker_id,
+        'pid': os.getpid(),
+        'uptime': metrics.uptime(),
+        'final': final,
+        'methods': metrics.snapshot(),
+    }
+
+
+def worker_listen(listen, worker_id):
+    """
+    Endereços de escuta (--listen) de um worker
+    Endereços TCP são compartilhados entre os workers (SO_REUSEPORT); um socket
+    Unix não pode ser dividido entre processos, então cada worker escuta no
+    caminho com o sufixo .<worker_id> (ex.: unix:/tmp/calculator.sock.0)
+    """
+    return [f"{address}.{worker_id}" if address.startswith('unix:') else address for address in listen]
+
+
+def run_worker(worker_id, port, mode, threads, stats_queue, stats_interval,
+               log_mode='sync', log_sample=1, server_args=None):
+    """
+    Ponto de entrada de cada processo worker
+    Executa o servidor na porta compartilhada (SO_REUSEPORT) ou na sua própria
+    porta e publica periodicamente suas métricas na fila de estatísticas
+
+    Args:
+        worker_id: Índice do worker
+        port: Porta do worker (compartilhada ou exclusiva)
+        mode: 'thread' ou 'aio'
+        threads: Número de threads do executor (modo thread)
+        stats_queue: Fila multiprocessing para os snapshots de estatísticas
+        stats_interval: Intervalo entre snapshots, em segundos
+        log_mode: Modo de log do worker ('sync', 'async' ou 'silent')
+        log_sample: Registra 1 a cada N requisições
+        server_args: Opções do servidor (add_server_arguments) aplicadas ao worker
+                     (padrão: as opções padrão do server.py)
+    """
+    configure_logging(log_mode, log_sample)
+    if server_args is None:
+        server_args = parse_server_args([])
+    listen = worker_listen(server_args.listen, worker_id)
+
+    # O processo pai coordena o encerramento: Ctrl+C chega a todo o grupo,
+    # então os workers ignoram SIGINT e encerram apenas com SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    metrics = MetricsRegistry()
+
+    if mode == 'aio':
+        asyncio.run(_run_aio_worker(worker_id, port, metrics, stats_queue, stats_interval,
+                                    server_args, listen))
+        return
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    server, datasets, profiler = build_server(server_args, mode, port, threads, metrics,
+                                              [LoggingInterceptor()], listen)
+    if profiler is not None:
+        install_signal_handlers(profiler)
+    server.start()
+    addresses = ', '.join(listen_addresses(port, listen))
+    logger.info(f"🚀 Worker {worker_id} (pid {os.getpid()}) atendendo em {addresses}")
+
+    try:
+        while not stop_event.wait(stats_interval):
+            stats_queue.put(worker_snapshot(worker_id, metrics))
+
+        server.stop(grace=1).wait()
+    finally:
+        datasets.close()
+    stats_queue.put(worker_snapshot(worker_id, metrics, final=True))
+
+
+async def _run_aio_worker(worker_id, port, metrics, stats_queue, stats_interval, server_args, listen):
+    """
+    Laço do worker no modo asyncio
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, stop_event.set)
+
+    server, datasets, profiler = build_server(server_args, 'aio', port, None, metrics,
+                                              [AsyncLoggingInterceptor()], listen)
+    if profiler is not None:
+        install_signal_handlers(profiler, loop)
+    await server.start()
+    addresses = ', '.join(listen_addresses(port, listen))
+    logger.info(f"🚀 Worker {worker_id} (pid {os.getpid()}, asyncio) atendendo em {addresses}")
+
+    try:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=stats_interval)
+            except asyncio.TimeoutError:
+                stats_queue.put(worker_snapshot(worker_id, metrics))
+
+        await server.stop(grace=1)
+    finally:
+        datasets.close()
+    stats_queue.put(worker_snapshot(worker_id, metrics, final=True))
+
+
+def log_rollup(snapshots, previous_total=None, elapsed=None):
+    """
+    Consolida e registra as estatísticas de todos os workers
+
+    Args:
+        snapshots: Dicionário worker -> último snapshot recebido
+        previous_total: Total de requisições do relatório anterior (para a taxa)
+        elapsed: Segundos desde o relatório anterior
+    Returns:
+        Total de requisições somando todos os workers
+    """
+    # Soma contadores e histogramas de cada método entre os workers
+    per_method = {}
+    for snapshot in snapshots.values():
+        for method_snapshot in snapshot['methods']:
+            merged = per_method.setdefault(method_snapshot['method'], {
+                'requests': 0,
+                'errors': {},
+                'histogram': LatencyHistogram(),
+            })
+            merged['requests'] += method_snapshot['requests']
+            for code, count in method_snapshot['errors'].items():
+                merged['errors'][code] = merged['errors'].get(code, 0) + count
+            merged['histogram'].merge(method_snapshot['histogram'])
+    total = sum(merged['requests'] for merged in per_method.values())
+
+    rate = ""
+    if previous_total is not None and elapsed:
+        rate = f" ({(total - previous_total) / elapsed:.1f} req/s)"
+    logger.info(f"📊 Estatísticas consolidadas: {total} requisições em {len(snapshots)} worker(s){rate}")
+
+    for method_name, merged in sorted(per_method.items()):
+        histogram = merged['histogram']
+        percentiles = " ".join(
+            f"{name}={histogram.percentile(quantile)}µs" for name, quantile in PERCENTILES
+        )
+        errors = f", erros {merged['errors']}" if merged['errors'] else ""
+        logger.info(f"   {method_name}: {merged['requests']}{errors} | {percentiles}")
+    for worker_id, snapshot in sorted(snapshots.items()):
+        worker_total = sum(method_snapshot['requests'] for method_snapshot in snapshot['methods'])
+        logger.info(f"   Worker {worker_id} (pid {snapshot['pid']}): {worker_total} requisições")
+    return total
+
+
+def drain_final_snapshots(stats_queue, processes, snapshots, timeout=SHUTDOWN_TIMEOUT):
+    """
+    Lê a fila de estatísticas até receber o snapshot final de cada worker
+
+    Args:
+        stats_queue: Fila multiprocessing dos snapshots
+        processes: Processos worker, indexados pelo índice do worker
+        snapshots: Dicionário worker -> último snapshot, atualizado no lugar
+        timeout: Espera máxima total, em segundos
+    """
+    pending = set(range(len(processes)))
+    deadline = time.monotonic() + timeout
+    while pending and time.monotonic() < deadline:
+        try:
+            snapshot = stats_queue.get(timeout=0.5)
+        except queue.Empty:
+            # Workers que terminaram sem enviar o snapshot final (ex.: falha)
+            pending = {worker_id for worker_id in pending if processes[worker_id].is_alive()}
+            continue
+        snapshots[snapshot['worker']] = snapshot
+        if snapshot['final']:
+            pending.discard(snapshot['worker'])
+
+
+def worker_port(port, worker_id, distinct_ports=False):
+    """
+    Porta de um worker: a compartilhada, ou port + worker_id com distinct_ports
+    """
+    return str(int(port) + worker_id) if distinct_ports else port
+
+
+def launch(workers=None, port='50051', mode='thread', threads=10, stats_interval=10.0,
+           log_mode='sync', log_sample=1, distinct_ports=False, server_args=None):
+    """
+    Inicia N processos worker e coordena seu ciclo de vida
+    Na mesma porta, o kernel distribui as conexões entre os processos
+    (SO_REUSEPORT), de modo que a vazão escala com o número de núcleos em vez
+    de ficar presa ao GIL. Com distinct_ports, cada worker escuta em sua
+    própria porta e o balanceamento fica a cargo do cliente (--targets)
+
+    Args:
+        workers: Número de processos (padrão: número de CPUs)
+        port: Porta compartilhada (ou a primeira porta, com distinct_ports)
+        mode: 'thread' ou 'aio'
+        threads: Threads do executor por worker (modo thread)
+        stats_interval: Intervalo entre relatórios consolidados, em segundos
+        log_mode: Modo de log dos workers (o launcher sempre registra os relatórios)
+        log_sample: Registra 1 a cada N requisições nos workers
+        distinct_ports: Se True, o worker i escuta na porta port + i
+        server_args: Opções do servidor (add_server_arguments) repassadas a cada
+                     worker: limites de admissão, tamanho de mensagem, profiling,
+                     escalonamento justo, conjuntos de dados e --listen
+    """
+    workers = workers or os.cpu_count() or 1
+
+    # spawn evita herdar o estado do gRPC do processo pai via fork
+    context = multiprocessing.get_context('spawn')
+    stats_queue = context.Queue()
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(worker_id, worker_port(port, worker_id, distinct_ports), mode, threads, stats_queue, stats_interval,
+                  log_mode, log_sample, server_args),
+            name=f"calculator-worker-{worker_id}",
+        )
+        for worker_id in range(workers)
+    ]
+
+    # SIGTERM no processo pai segue o mesmo caminho do Ctrl+C
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    for process in processes:
+        process.start()
+    if distinct_ports:
+        ports = f"nas portas {port}-{worker_port(port, workers - 1, distinct_ports)}"
+    else:
+        ports = f"na porta {port}"
+    logger.info(f"🚀 Launcher iniciou {workers} worker(s) ({mode}) {ports}")
+
+    snapshots = {}
+    last_total = 0
+    last_report = time.time()
+    try:
+        while any(process.is_alive() for process in processes):
+            try:
+                snapshot = stats_queue.get(timeout=stats_interval)
+                snapshots[snapshot['worker']] = snapshot
+            except queue.Empty:
+                pass
+
+            now = time.time()
+            if snapshots and now - last_report >= stats_interval:
+                last_total = log_rollup(snapshots, last_total, now - last_report)
+                last_report = now
+        logger.warning("⚠️  Todos os workers encerraram inesperadamente")
+    except KeyboardInterrupt:
+        logger.info("\n🛑 Encerrando workers...")
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+        # Esvazia a fila antes do join: um worker só termina depois que os dados
+        # da sua fila são escritos no pipe, e o pipe só esvazia com a leitura
+        drain_final_snapshots(stats_queue, processes, snapshots)
+        for process in processes:
+            process.join(timeout=SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                logger.warning(f"⚠️  {process.name} não encerrou a tempo, forçando")
+                process.kill()
+                process.join()
+        log_rollup(snapshots)
+        logger.info("👋 Launcher encerrado")
+
+
+def parse_args():
+    """
+    Lê as opções de linha de comando do launcher
+    """
+    parser = argparse.ArgumentParser(
+        description="Executa vários processos do servidor da Calculadora"
+    )
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Número de processos worker (padrão: número de CPUs)")
+    parser.add_argument('--port', default='50051', help="Porta compartilhada (padrão: 50051)")
+    parser.add_argument('--distinct-ports', action='store_true',
+                        help="Cada worker escuta em sua própria porta (port, port+1, ...), "
+                             "para balanceamento de carga no cliente")
+    parser.add_argument('--mode', choices=['thread', 'aio'], default='thread',
+                        help="Modo do servidor em cada worker")
+    parser.add_argument('--threads', type=int, default=10,
+                        help="Threads do executor por worker no modo thread (padrão: 10)")
+    parser.add_argument('--stats-interval', type=float, default=10.0,
+                        help="Intervalo entre relatórios de estatísticas, em segundos")
+    # Demais opções do server.py, repassadas a cada worker
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    check_server_args(parser, args)
+    if args.distinct_ports and args.listen:
+        parser.error("--listen não pode ser combinado com --distinct-ports")
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    launch(args.workers, args.port, args.mode, args.threads, args.stats_interval,
+           args.log_mode, args.log_sample, args.distinct_ports, args)
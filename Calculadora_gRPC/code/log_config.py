@@ -0,0 +1,115 @@
+import atexit
+import itertools
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+# Formato padrão das mensagens de log
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Modos de log disponíveis
+LOG_MODES = ('sync', 'async', 'silent')
+
+
+class LogSampler:
+    """
+    Decide quais requisições geram linhas de log (1 a cada N)
+    Usado nos pontos de log por requisição para tirá-los do caminho crítico
+    """
+
+    def __init__(self, every=1):
+        self.configure(every)
+
+    def configure(self, every):
+        """
+        Args:
+            every: Registra 1 a cada `every` requisições (0 desativa)
+        """
+        self.every = every
+        self._counter = itertools.count()
+
+    def should_log(self):
+        """Retorna True se a requisição atual deve ser registrada"""
+        every = self.every
+        if every == 1:
+            return True
+        if every <= 0:
+            return False
+        # next() em itertools.count é atômico sob o GIL
+        return next(self._counter) % every == 0
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler que não formata a mensagem na thread da requisição
+    A formatação fica a cargo da thread do QueueListener
+    """
+
+    def prepare(self, record):
+        return record
+
+
+# Amostragem dos logs por requisição: uma instância para os interceptors e
+# outra para as linhas das operações, para que cada ponto tenha seu contador
+request_sampler = LogSampler()
+operation_sampler = LogSampler()
+
+_listener = None
+
+
+def stop_logging():
+    """
+    Encerra a thread de escrita do modo async, descarregando a fila
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def configure_logging(mode='sync', sample_every=1, level=logging.INFO):
+    """
+    Configura o logging do processo
+
+    Args:
+        mode: 'sync' (escrita direta no stderr), 'async' (fila + thread de
+              escrita em segundo plano) ou 'silent' (nenhum log)
+        sample_every: Registra 1 a cada N requisições nos pontos de log por requisição
+        level: Nível mínimo de log
+    """
+    global _listener
+
+    if mode not in LOG_MODES:
+        raise ValueError(f"Modo de log inválido: {mode} (use {', '.join(LOG_MODES)})")
+
+    stop_logging()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    if mode == 'silent':
+        request_sampler.configure(0)
+        operation_sampler.configure(0)
+        logging.disable(logging.CRITICAL)
+        return
+    logging.disable(logging.NOTSET)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    if mode == 'async':
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, stream_handler)
+        _listener.start()
+        root.addHandler(DeferredQueueHandler(log_queue))
+    else:
+        root.addHandler(stream_handler)
+
+    root.setLevel(level)
+    request_sampler.configure(sample_every)
+    operation_sampler.configure(sample_every)
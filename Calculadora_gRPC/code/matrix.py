@@ -0,0 +1,176 @@
+import numpy as np
+
+import calculator_pb2
+
+
+# Formato dos blocos de matriz: float64 little-endian, linha a linha
+MATRIX_DTYPE = np.dtype('<f8')
+
+# Tamanho aproximado de cada bloco enviado pelo cliente, em bytes
+DEFAULT_BLOCK_BYTES = 1 << 20
+
+# Tamanho máximo padrão de B no produto (MatrixMultiply), em bytes
+DEFAULT_MAX_RIGHT_BYTES = 256 * 1024 * 1024
+
+
+class MatrixError(ValueError):
+    """
+    Bloco de matriz inválido ou incompatível com a operação
+    """
+
+
+class MatrixLimitError(MatrixError):
+    """
+    Matriz maior que o limite de memória do servidor
+    """
+
+
+def block_to_array(block):
+    """
+    Visão NumPy (sem cópia) dos dados de um MatrixBlock
+
+    Args:
+        block: MatrixBlock
+    Returns:
+        Array float64 com forma (rows, cols)
+    Raises:
+        MatrixError: Se o tamanho dos dados não corresponder à forma
+    """
+    expected = block.rows * block.cols * MATRIX_DTYPE.itemsize
+    if len(block.data) != expected:
+        raise MatrixError(f"Bloco {block.rows}x{block.cols} deve ter {expected} bytes "
+                          f"(recebido: {len(block.data)})")
+    return np.frombuffer(block.data, dtype=MATRIX_DTYPE).reshape(block.rows, block.cols)
+
+
+def array_to_block(array, row=0, col=0):
+    """
+    Converte um array 2D em MatrixBlock posicionado em (row, col)
+    """
+    rows, cols = array.shape
+    return calculator_pb2.MatrixBlock(
+        row=row, col=col, rows=rows, cols=cols,
+        data=np.asarray(array, dtype=MATRIX_DTYPE).tobytes()
+    )
+
+
+def block_rows_for(cols, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Número de linhas por bloco para que cada bloco tenha ~block_bytes
+    """
+    return max(1, block_bytes // (max(cols, 1) * MATRIX_DTYPE.itemsize))
+
+
+def iter_row_blocks(matrix, block_rows):
+    """
+    Divide uma matriz em blocos de linhas
+
+    Yields:
+        MatrixBlock de cada faixa de linhas, na ordem
+    """
+    for start in range(0, matrix.shape[0], block_rows):
+        yield array_to_block(matrix[start:start + block_rows], row=start)
+
+
+class MatrixAddStream:
+    """
+    Soma A + B processando pares de blocos de linhas
+    Cada par é somado e devolvido; nada é mantido entre blocos
+    """
+
+    def __init__(self):
+        self.cols = None
+
+    def feed(self, request):
+        """
+        Args:
+            request: MatrixAddChunk com os blocos correspondentes de A e B
+        Returns:
+            Lista de MatrixBlock do resultado
+        Raises:
+            MatrixError: Se os blocos forem inválidos, de posições ou formas diferentes
+        """
+        if (request.a.row, request.a.col) != (request.b.row, request.b.col):
+            raise MatrixError(f"Blocos de A e B em posições diferentes: "
+                              f"({request.a.row}, {request.a.col}) e ({request.b.row}, {request.b.col})")
+        a = block_to_array(request.a)
+        b = block_to_array(request.b)
+        if a.shape != b.shape:
+            raise MatrixError(f"Blocos de A e B com formas diferentes: {a.shape} e {b.shape}")
+        if self.cols is None:
+            self.cols = a.shape[1]
+        elif a.shape[1] != self.cols:
+            raise MatrixError(f"Bloco com {a.shape[1]} colunas; esperado {self.cols}")
+        return [array_to_block(a + b, request.a.row, request.a.col)]
+
+
+class MatrixMultiplyStream:
+    """
+    Produto A @ B (BLAS via NumPy)
+    Os blocos de linhas de B chegam primeiro e B é montada uma única vez;
+    depois cada bloco de linhas de A gera o bloco de linhas correspondente do
+    resultado. A memória é B mais um bloco de A e um do resultado (2 x B
+    durante a montagem), com B limitada a max_right_bytes
+    """
+
+    def __init__(self, max_right_bytes=DEFAULT_MAX_RIGHT_BYTES):
+        """
+        Args:
+            max_right_bytes: Tamanho máximo de B, em bytes
+        """
+        self.max_right_bytes = max_right_bytes
+        self._right_blocks = []
+        self._right_bytes = 0
+        self._right = None
+
+    def feed(self, request):
+        """
+        Args:
+            request: MatrixMultiplyChunk com um bloco de B (right) ou de A (left)
+        Returns:
+            Lista de MatrixBlock do resultado
+        Raises:
+            MatrixLimitError: Se B passar de max_right_bytes
+            MatrixError: Se o bloco for inválido ou incompatível
+        """
+        if request.HasField('right'):
+            if self._right is not None:
+                raise MatrixError("Blocos de B devem ser enviados antes dos blocos de A")
+            block = block_to_array(request.right)
+            if self._right_blocks and block.shape[1] != self._right_blocks[0].shape[1]:
+                raise MatrixError(f"Bloco de B com {block.shape[1]} colunas; "
+                                  f"esperado {self._right_blocks[0].shape[1]}")
+            self._right_bytes += block.nbytes
+            if self._right_bytes > self.max_right_bytes:
+                raise MatrixLimitError(f"B maior que o limite de {self.max_right_bytes} bytes")
+            self._right_blocks.append(block)
+            return []
+
+        if self._right is None:
+            if not self._right_blocks:
+                raise MatrixError("B deve ser enviada antes dos blocos de A")
+            self._right = np.vstack(self._right_blocks)
+            self._right_blocks = []
+        left = block_to_array(request.left)
+        if left.shape[1] != self._right.shape[0]:
+            raise MatrixError(f"Bloco de A com {left.shape[1]} colunas; "
+                              f"B tem {self._right.shape[0]} linhas")
+        return [array_to_block(left @ self._right, request.left.row, 0)]
+
+
+class MatrixTransposeStream:
+    """
+    Transposta de A processando blocos de linhas
+    O bloco de linhas [r0, r1) de A vira o bloco de colunas [r0, r1) do
+    resultado, devolvido com a sua posição; nada é mantido entre blocos
+    """
+
+    def feed(self, block):
+        """
+        Args:
+            block: MatrixBlock de A
+        Returns:
+            Lista de MatrixBlock do resultado
+        """
+        array = block_to_array(block)
+        return [array_to_block(array.T, row=block.col, col=block.row)]
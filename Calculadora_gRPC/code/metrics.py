@@ -0,0 +1,324 @@
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import grpc
+
+from interceptors import wrap_handler, wrap_handler_async
+
+
+# Bits de precisão do histograma: 2^(SUB_BUCKET_BITS - 1) buckets por potência
+# de 2, ou seja, erro relativo máximo de ~3% em cada percentil
+SUB_BUCKET_BITS = 6
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+# Maior valor registrado, em microssegundos (~19 horas); acima disso é saturado
+MAX_TRACKABLE_US = 1 << 36
+
+# Percentis reportados (nome, quantil)
+PERCENTILES = (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p999', 0.999))
+
+
+def bucket_index(value):
+    """
+    Índice do bucket log-linear (estilo HDR) de um valor inteiro não negativo
+    Valores abaixo de 2^SUB_BUCKET_BITS têm bucket exato; acima disso cada
+    potência de 2 é dividida em SUB_BUCKET_HALF buckets
+    """
+    bits = value.bit_length()
+    if bits <= SUB_BUCKET_BITS:
+        return value
+    shift = bits - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (value >> shift)
+
+
+def bucket_upper_bound(index):
+    """
+    Maior valor que cai no bucket informado
+    """
+    if index < 2 * SUB_BUCKET_HALF:
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    mantissa = index - shift * SUB_BUCKET_HALF
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências em microssegundos com buckets log-linear
+    Registrar um valor custa um cálculo de índice e um incremento;
+    os percentis são calculados apenas na leitura
+    """
+
+    def __init__(self):
+        self.counts = [0] * (bucket_index(MAX_TRACKABLE_US) + 1)
+        self.total = 0
+        self.sum = 0
+        self.max = 0
+
+    def record(self, value):
+        """Registra um valor em microssegundos (não é thread-safe; ver MethodMetrics)"""
+        value = min(int(value), MAX_TRACKABLE_US)
+        self.counts[bucket_index(value)] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, quantile):
+        """
+        Valor do percentil informado (ex.: 0.99)
+
+        Returns:
+            Limite superior do bucket que contém o percentil, em microssegundos
+        """
+        if self.total == 0:
+            return 0
+        target = max(1, int(quantile * self.total + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self):
+        """Média em microssegundos"""
+        return self.sum / self.total if self.total else 0.0
+
+    def to_dict(self):
+        """
+        Representação esparsa e serializável (para consolidar entre processos)
+        """
+        return {
+            'buckets': {index: count for index, count in enumerate(self.counts) if count},
+            'total': self.total,
+            'sum': self.sum,
+            'max': self.max,
+        }
+
+    def merge(self, data):
+        """
+        Soma um histograma serializado por to_dict() a este
+        """
+        for index, count in data['buckets'].items():
+            self.counts[int(index)] += count
+        self.total += data['total']
+        self.sum += data['sum']
+        self.max = max(self.max, data['max'])
+
+
+class MethodMetrics:
+    """
+    Métricas de um método: requisições, erros por código, concorrência e latência
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self.requests = 0
+        self.errors = {}
+        self.in_flight = 0
+        self.histogram = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def begin(self, context=None):
+        """
+        Marca o início de uma chamada
+
+        Returns:
+            Instante de início (token para end)
+        """
+        with self._lock:
+            self.in_flight += 1
+        return time.perf_counter_ns()
+
+    def end(self, start, code):
+        """
+        Marca o fim de uma chamada
+
+        Args:
+            start: Token retornado por begin
+            code: grpc.StatusCode final da chamada
+        """
+        elapsed_us = (time.perf_counter_ns() - start) // 1000
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            if code != grpc.StatusCode.OK:
+                self.errors[code.name] = self.errors.get(code.name, 0) + 1
+            self.histogram.record(elapsed_us)
+
+    def snapshot(self):
+        """
+        Cópia consistente das métricas do método
+
+        Returns:
+            Dicionário com requests, errors, in_flight, percentis e histograma
+        """
+        with self._lock:
+            histogram = self.histogram.to_dict()
+            summary = {
+                'method': self.method,
+                'requests': self.requests,
+                'errors': dict(self.errors),
+                'in_flight': self.in_flight,
+                'mean_us': self.histogram.mean(),
+                'max_us': self.histogram.max,
+            }
+            for name, quantile in PERCENTILES:
+                summary[f'{name}_us'] = self.histogram.percentile(quantile)
+        summary['histogram'] = histogram
+        return summary
+
+
+class MetricsRegistry:
+    """
+    Conjunto das métricas de todos os métodos do servidor
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._methods = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def method(self, method):
+        """Retorna (criando se preciso) as métricas do método"""
+        metrics = self._methods.get(method)
+        if metrics is None:
+            with self._lock:
+                metrics = self._methods.setdefault(method, MethodMetrics(method))
+        return metrics
+
+    def snapshot(self):
+        """
+        Returns:
+            Lista de snapshots por método, ordenada pelo nome
+        """
+        with self._lock:
+            methods = sorted(self._methods.items())
+        return [metrics.snapshot() for _, metrics in methods]
+
+    def uptime(self):
+        """Segundos desde a criação do registro"""
+        return time.time() - self.started_at
+
+    def add_collector(self, render):
+        """
+        Acrescenta métricas de outro componente ao formato texto
+
+        Args:
+            render: Função sem argumentos que retorna linhas no formato texto
+                    (ex.: FairScheduler.render_text)
+        """
+        self._collectors.append(render)
+
+    def render_text(self, snapshots=None):
+        """
+        Métricas no formato texto do Prometheus, para scraping
+
+        Args:
+            snapshots: Snapshots dos métodos já lidos (padrão: lê agora)
+        """
+        text = render_text(self.snapshot() if snapshots is None else snapshots)
+        return text + "".join(render() for render in self._collectors)
+
+
+def escape_label_value(value):
+    """
+    Escapa um valor de label do formato texto do Prometheus (\\, " e quebra de linha)
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_text(snapshots):
+    """
+    Converte snapshots de métodos para o formato texto do Prometheus
+
+    Args:
+        snapshots: Lista de snapshots (MethodMetrics.snapshot)
+    Returns:
+        String com as métricas
+    """
+    lines = [
+        "# TYPE calculator_requests_total counter",
+        "# TYPE calculator_errors_total counter",
+        "# TYPE calculator_in_flight gauge",
+        "# TYPE calculator_latency_seconds summary",
+    ]
+    for snapshot in snapshots:
+        method = escape_label_value(snapshot['method'])
+        lines.append(f'calculator_requests_total{{method="{method}"}} {snapshot["requests"]}')
+        for code, count in sorted(snapshot['errors'].items()):
+            lines.append(f'calculator_errors_total{{method="{method}",code="{code}"}} {count}')
+        lines.append(f'calculator_in_flight{{method="{method}"}} {snapshot["in_flight"]}')
+        for name, quantile in PERCENTILES:
+            value = snapshot[f'{name}_us'] / 1e6
+            lines.append(f'calculator_latency_seconds{{method="{method}",quantile="{quantile}"}} {value:.6f}')
+        lines.append(f'calculator_latency_seconds_sum{{method="{method}"}} {snapshot["histogram"]["sum"] / 1e6:.6f}')
+        lines.append(f'calculator_latency_seconds_count{{method="{method}"}} {snapshot["requests"]}')
+    return "\n".join(lines) + "\n"
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):
+    """
+    Interceptor que mede a execução real de cada handler
+    (não apenas a busca do handler feita pela continuation)
+    Apenas métodos registrados no servidor entram no MetricsRegistry
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            # Método inexistente: não cria métricas para nomes arbitrários
+            return None
+        metrics = self.registry.method(handler_call_details.method)
+        return wrap_handler(handler, metrics.begin, metrics.end)
+
+
+class AsyncMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Versão asyncio do MetricsInterceptor
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        metrics = self.registry.method(handler_call_details.method)
+        return wrap_handler_async(handler, metrics.begin, metrics.end)
+
+
+def start_metrics_http_server(registry, port, host='127.0.0.1'):
+    """
+    Inicia um endpoint HTTP local (thread daemon) com as métricas em texto
+
+    Args:
+        registry: MetricsRegistry
+        port: Porta HTTP
+        host: Endereço de escuta (padrão: apenas local)
+    Returns:
+        ThreadingHTTPServer em execução
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = registry.render_text().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes não geram log
+            pass
+
+    http_server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=http_server.serve_forever, name="metrics-http", daemon=True).start()
+    return http_server
@@ -0,0 +1,351 @@
+import cProfile
+import itertools
+import logging
+import os
+import pstats
+import re
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+import grpc
+
+from interceptors import replace_behavior
+
+
+logger = logging.getLogger(__name__)
+
+# Modos de profiling
+PROFILE_MODES = ('sampler', 'cprofile')
+
+# Intervalo padrão entre amostras de pilha, em segundos
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Modo cprofile: perfila 1 a cada N chamadas
+DEFAULT_SAMPLE_EVERY = 10
+
+# Funções exibidas no resumo em texto do cProfile
+TEXT_REPORT_LINES = 40
+
+# Sufixo numérico dos nomes de thread (ThreadPoolExecutor-0_3 -> ThreadPoolExecutor-0)
+_THREAD_INDEX = re.compile(r'_\d+$')
+
+
+class ProfilingError(RuntimeError):
+    """
+    Operação de profiling inválida no estado atual (ex.: iniciar duas vezes)
+    """
+
+
+def frame_label(frame):
+    """
+    Nome de um frame no formato arquivo:função (sem ';', separador das pilhas)
+    """
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}".replace(';', ':')
+
+
+def collapse_stack(frame):
+    """
+    Pilha de chamadas de um frame, da raiz até ele, separada por ';'
+    """
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class StackSampler:
+    """
+    Amostrador de pilhas por tempo de parede (wall-clock)
+    Uma thread lê a pilha de todas as outras threads a cada `interval` segundos
+    (sys._current_frames) e conta as pilhas iguais. Threads do mesmo pool
+    são agrupadas pelo nome, de modo que o flamegraph mostra o pool inteiro;
+    tempo parado (espera de fila, I/O, GIL) também aparece, o que revela
+    a troca entre a thread do gRPC e o executor
+    """
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        """
+        Args:
+            interval: Intervalo entre amostras, em segundos
+        """
+        self.interval = interval
+        self.counts = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                thread_name = _THREAD_INDEX.sub('', names.get(ident, f"thread-{ident}"))
+                self.counts[f"{thread_name};{collapse_stack(frame)}"] += 1
+            self.samples += 1
+
+    def write(self, path):
+        """
+        Grava as pilhas no formato "collapsed" (uma pilha por linha, seguida
+        da contagem), aceito por flamegraph.pl, speedscope e inferno
+        """
+        with open(path, 'w') as output:
+            for stack, count in self.counts.most_common():
+                output.write(f"{stack} {count}\n")
+
+
+class HandlerProfiler:
+    """
+    cProfile amostrado da execução dos handlers
+    1 a cada `sample_every` chamadas roda sob um cProfile.Profile próprio,
+    na thread do executor; ao final, o perfil é somado ao acumulado
+    """
+
+    def __init__(self, sample_every=DEFAULT_SAMPLE_EVERY):
+        """
+        Args:
+            sample_every: Perfila 1 a cada N chamadas
+        """
+        self.sample_every = max(1, sample_every)
+        self.profiled = 0
+        self._counter = itertools.count()
+        self._stats = None
+        self._lock = threading.Lock()
+
+    def should_profile(self):
+        """True para 1 a cada sample_every chamadas"""
+        return next(self._counter) % self.sample_every == 0
+
+    def add(self, profile):
+        """
+        Soma o perfil de uma chamada ao acumulado
+        """
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+            self.profiled += 1
+
+    def write(self, path):
+        """
+        Grava o perfil acumulado (.pstats, para snakeviz/pstats/flameprof) e um
+        resumo em texto ordenado por tempo acumulado
+
+        Returns:
+            Lista de arquivos gravados (vazia se nenhuma chamada foi perfilada)
+        """
+        with self._lock:
+            if self._stats is None:
+                return []
+            self._stats.dump_stats(f"{path}.pstats")
+            with open(f"{path}.txt", 'w') as output:
+                output.write(f"# {self.profiled} chamada(s) perfilada(s), 1 a cada {self.sample_every}\n")
+                pstats.Stats(f"{path}.pstats", stream=output).sort_stats('cumulative').print_stats(TEXT_REPORT_LINES)
+        return [f"{path}.pstats", f"{path}.txt"]
+
+
+class ProfilingController:
+    """
+    Liga e desliga o profiling de um servidor em execução
+    Acionado pela RPC Profile ou por sinais (ver install_signal_handlers);
+    os arquivos são gravados em output_dir com o modo, o pid e o instante
+    """
+
+    def __init__(self, output_dir, allow_cprofile=True):
+        """
+        Args:
+            output_dir: Diretório dos arquivos de profiling (criado se não existir)
+            allow_cprofile: Se False, apenas o modo sampler é aceito (servidor asyncio)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.allow_cprofile = allow_cprofile
+        self.mode = None
+        self.last_files = []
+        # Lido sem lock pelo ProfilingInterceptor a cada chamada
+        self.handler_profiler = None
+        self._sampler = None
+        self._started = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def start(self, mode='sampler', duration=None, interval=None, sample_every=None):
+        """
+        Inicia o profiling
+
+        Args:
+            mode: 'sampler' (pilhas de todas as threads) ou 'cprofile' (handlers)
+            duration: Para sozinho após N segundos (None: até stop)
+            interval: Intervalo entre amostras do sampler, em segundos
+            sample_every: Modo cprofile: perfila 1 a cada N chamadas
+        Raises:
+            ProfilingError: Se já houver profiling ativo ou o modo for inválido
+        """
+        if mode not in PROFILE_MODES:
+            raise ProfilingError(f"Modo inválido: {mode} (use {', '.join(PROFILE_MODES)})")
+        if mode == 'cprofile' and not self.allow_cprofile:
+            raise ProfilingError("Modo cprofile disponível apenas no servidor com pool de threads")
+        with self._lock:
+            if self.mode is not None:
+                raise ProfilingError(f"Profiling já ativo (modo {self.mode})")
+            if mode == 'sampler':
+                self._sampler = StackSampler(interval or DEFAULT_SAMPLE_INTERVAL)
+                self._sampler.start()
+            else:
+                self.handler_profiler = HandlerProfiler(sample_every or DEFAULT_SAMPLE_EVERY)
+            self.mode = mode
+            self._started = time.monotonic()
+            if duration:
+                self._timer = threading.Timer(duration, self._stop_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        logger.info(f"🔬 Profiling iniciado (modo {mode})")
+
+    def stop(self):
+        """
+        Encerra o profiling e grava os arquivos
+
+        Returns:
+            Lista de arquivos gravados
+        Raises:
+            ProfilingError: Se não houver profiling ativo
+        """
+        with self._lock:
+            if self.mode is None:
+                raise ProfilingError("Nenhum profiling ativo")
+            mode, sampler, handler_profiler = self.mode, self._sampler, self.handler_profiler
+            self.mode = self._sampler = self.handler_profiler = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(self.output_dir, f"{mode}-{os.getpid()}-{stamp}")
+        if sampler is not None:
+            sampler.stop()
+            sampler.write(f"{path}.collapsed")
+            files = [f"{path}.collapsed"]
+            detail = f"{sampler.samples} amostras"
+        else:
+            files = handler_profiler.write(path)
+            detail = f"{handler_profiler.profiled} chamadas perfiladas"
+        self.last_files = files
+        logger.info(f"🔬 Profiling encerrado ({detail}): {', '.join(files) or 'nenhum arquivo'}")
+        return files
+
+    def _stop_on_timer(self):
+        try:
+            self.stop()
+        except ProfilingError:
+            pass
+
+    def toggle(self, mode):
+        """
+        Inicia o modo informado, ou encerra o profiling ativo (usado pelos sinais)
+        """
+        try:
+            if self.mode is None:
+                self.start(mode)
+            else:
+                self.stop()
+        except ProfilingError as e:
+            logger.warning(f"⚠️  {e}")
+
+    def status(self):
+        """
+        Returns:
+            Dicionário com active, mode, elapsed (segundos) e files (últimos gravados)
+        """
+        with self._lock:
+            active = self.mode is not None
+            return {
+                'active': active,
+                'mode': self.mode or '',
+                'elapsed': time.monotonic() - self._started if active else 0.0,
+                'files': list(self.last_files),
+            }
+
+
+def install_signal_handlers(controller, loop=None):
+    """
+    SIGUSR1 liga/desliga o sampler e SIGUSR2 liga/desliga o cProfile
+
+    Args:
+        controller: ProfilingController
+        loop: Event loop do servidor asyncio (None: servidor com pool de threads)
+    """
+    if not hasattr(signal, 'SIGUSR1'):
+        return
+    handlers = {signal.SIGUSR1: 'sampler'}
+    if controller.allow_cprofile:
+        handlers[signal.SIGUSR2] = 'cprofile'
+    for signum, mode in handlers.items():
+        if loop is not None:
+            loop.add_signal_handler(signum, controller.toggle, mode)
+        else:
+            signal.signal(signum, lambda received, frame, mode=mode: controller.toggle(mode))
+
+
+class ProfilingInterceptor(grpc.ServerInterceptor):
+    """
+    Executa sob cProfile as chamadas sorteadas pelo HandlerProfiler ativo
+    Deve ser o primeiro da cadeia para que o perfil inclua os outros
+    interceptors; sem profiling ativo, o handler é devolvido sem alteração
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        profiler = self.controller.handler_profiler
+        if handler is None or profiler is None or not profiler.should_profile():
+            return handler
+
+        if handler.response_streaming:
+            def wrap(behavior):
+                def wrapper(request, context):
+                    profile = cProfile.Profile()
+                    try:
+                        profile.enable()
+                    except ValueError:
+                        # Outro profiler ativo nesta thread
+                        yield from behavior(request, context)
+                        return
+                    try:
+                        yield from behavior(request, context)
+                    finally:
+                        profile.disable()
+                        profiler.add(profile)
+                return wrapper
+        else:
+            def wrap(behavior):
+                def wrapper(request, context):
+                    profile = cProfile.Profile()
+                    try:
+                        profile.enable()
+                    except ValueError:
+                        return behavior(request, context)
+                    try:
+                        return behavior(request, context)
+                    finally:
+                        profile.disable()
+                        profiler.add(profile)
+                return wrapper
+
+        return replace_behavior(handler, wrap)
@@ -0,0 +1,208 @@
+import random
+import threading
+import time
+
+import grpc
+
+from metrics import LatencyHistogram
+
+
+# Códigos reenviados por padrão: o servidor não executou a chamada ou a rejeitou por carga
+DEFAULT_RETRYABLE_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+})
+
+
+class RetryBudget:
+    """
+    Orçamento de reenvios (token bucket)
+    Cada requisição original deposita `ratio` fichas e cada reenvio (ou cópia)
+    gasta uma; há também uma reposição mínima por segundo. Durante uma falha
+    geral os reenvios ficam limitados a ~ratio x o tráfego normal, em vez de
+    multiplicar a carga sobre servidores que já estão com problemas
+    """
+
+    def __init__(self, ratio=0.1, min_per_second=5.0, max_tokens=10.0):
+        """
+        Args:
+            ratio: Reenvios permitidos por requisição original (ex.: 0.1 = 10%)
+            min_per_second: Reenvios por segundo permitidos mesmo com pouco tráfego
+            max_tokens: Máximo de fichas acumuladas (rajada de reenvios)
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.spent = 0
+        self.exhausted = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def record_request(self):
+        """Registra uma requisição original (deposita `ratio` fichas)"""
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self):
+        """
+        Reserva uma ficha para um reenvio
+
+        Returns:
+            True se o reenvio cabe no orçamento
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens < 1:
+                self.exhausted += 1
+                return False
+            self.tokens -= 1
+            self.spent += 1
+            return True
+
+    def snapshot(self):
+        """
+        Returns:
+            Dicionário com tokens, spent e exhausted (reenvios negados)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return {'tokens': self.tokens, 'spent': self.spent, 'exhausted': self.exhausted}
+
+
+class RetryPolicy:
+    """
+    Reenvio de chamadas unárias com backoff exponencial e jitter
+    Só reenvia códigos que indicam que a operação pode ser repetida e enquanto
+    houver orçamento e prazo; as operações da calculadora não têm efeitos
+    colaterais, então repetir é seguro
+    """
+
+    def __init__(self, max_attempts=3, initial_backoff=0.05, max_backoff=1.0, multiplier=2.0,
+                 retryable_codes=DEFAULT_RETRYABLE_CODES, budget=None):
+        """
+        Args:
+            max_attempts: Total de tentativas, incluindo a primeira
+            initial_backoff: Espera máxima antes do primeiro reenvio, em segundos
+            max_backoff: Teto da espera entre tentativas, em segundos
+            multiplier: Fator de crescimento da espera a cada tentativa
+            retryable_codes: Códigos de status que podem ser reenviados
+            budget: RetryBudget compartilhado (padrão: um novo RetryBudget)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts deve ser >= 1")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.retryable_codes = frozenset(retryable_codes)
+        self.budget = budget or RetryBudget()
+
+    def backoff(self, attempt):
+        """
+        Espera antes da tentativa attempt + 1 ("full jitter": uniforme entre 0 e o teto)
+        """
+        ceiling = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def should_retry(self, code, attempt):
+        """
+        Decide se a chamada que falhou na tentativa `attempt` deve ser reenviada
+        (consome uma ficha do orçamento quando a resposta é sim)
+        """
+        return (code in self.retryable_codes and attempt < self.max_attempts
+                and self.budget.try_spend())
+
+
+class HedgingPolicy:
+    """
+    Requisições com cópia (hedging)
+    Se a resposta não chega dentro do atraso de cópia, uma segunda chamada
+    idêntica é enviada a outro servidor/canal e vale a primeira resposta.
+    O atraso é o percentil `percentile` (p95) da latência recente de cada
+    método, de modo que apenas ~5% das chamadas geram cópia; as cópias também
+    consomem o orçamento de reenvios
+    """
+
+    def __init__(self, percentile=0.95, delay=None, min_samples=20, min_delay=0.001,
+                 window=10000, budget=None):
+        """
+        Args:
+            percentile: Percentil da latência usado como atraso de cópia
+            delay: Atraso fixo em segundos (ignora o percentil)
+            min_samples: Chamadas observadas antes de começar a enviar cópias
+            min_delay: Menor atraso permitido, em segundos
+            window: Amostras por janela de latência (a janela anterior é descartada)
+            budget: RetryBudget das cópias (padrão: um novo RetryBudget)
+        """
+        self.percentile = percentile
+        self.delay = delay
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.window = window
+        self.budget = budget or RetryBudget()
+        self.hedges = 0
+        self.hedge_wins = 0
+        # método -> (janela atual, janela anterior)
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, method_name, latency):
+        """
+        Registra a latência (segundos) de uma chamada concluída com sucesso
+        """
+        with self._lock:
+            current, previous = self._histograms.get(method_name, (None, None))
+            if current is None:
+                current = LatencyHistogram()
+            elif current.total >= self.window:
+                current, previous = LatencyHistogram(), current
+            current.record(latency * 1e6)
+            self._histograms[method_name] = (current, previous)
+
+    def hedge_delay(self, method_name):
+        """
+        Atraso de cópia do método, em segundos, ou None sem amostras suficientes
+        """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            current, previous = self._histograms.get(method_name, (None, None))
+            histogram = current if current is not None and current.total >= self.min_samples else previous
+            if histogram is None or histogram.total < self.min_samples:
+                return None
+            return max(self.min_delay, histogram.percentile(self.percentile) / 1e6)
+
+    def try_hedge(self):
+        """
+        Reserva a cópia no orçamento
+
+        Returns:
+            True se a cópia pode ser enviada
+        """
+        if not self.budget.try_spend():
+            return False
+        with self._lock:
+            self.hedges += 1
+        return True
+
+    def record_win(self):
+        """Registra que a cópia respondeu antes da chamada original"""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def snapshot(self):
+        """
+        Returns:
+            Dicionário com hedges, hedge_wins, o atraso atual por método e o orçamento
+        """
+        with self._lock:
+            methods = list(self._histograms)
+            counters = {'hedges': self.hedges, 'hedge_wins': self.hedge_wins}
+        counters['delays'] = {method: self.hedge_delay(method) for method in methods}
+        counters['budget'] = self.budget.snapshot()
+        return counters
@@ -0,0 +1,294 @@
+import argparse
+import queue
+import statistics
+import time
+from collections import deque
+
+import grpc
+import numpy as np
+
+import calculator_pb2
+from balancer import BACKEND_FAILURE_CODES
+from client import OPERATION_CODES, VECTOR_DTYPE, VECTOR_INDEX_DTYPE, CalculatorClient
+
+
+# Elementos por shard (cada shard é uma chamada ComputeVector)
+DEFAULT_SHARD_SIZE = 1 << 16
+
+# Tentativas por shard (primeira chamada + reenvios e cópias)
+DEFAULT_MAX_ATTEMPTS = 4
+
+# Um shard pendente há mais que HEDGE_FACTOR x a latência mediana ganha uma cópia
+DEFAULT_HEDGE_FACTOR = 3.0
+
+# Latências observadas antes de ativar as cópias, e janela usada na mediana
+MIN_HEDGE_SAMPLES = 5
+HEDGE_WINDOW = 100
+
+
+class ScatterGatherError(RuntimeError):
+    """
+    Shard sem resultado após todas as tentativas, ou erro da própria requisição
+    """
+
+
+class ScatterGather:
+    """
+    Coordenador scatter-gather de operações vetoriais sobre um CalculatorClient
+    O vetor é dividido em shards enviados em paralelo (ComputeVector) aos
+    servidores do cliente (targets); os resultados são copiados para a sua
+    posição no array de saída, independentemente da ordem de chegada.
+    Shards que falham com erro de servidor (UNAVAILABLE, DEADLINE_EXCEEDED,
+    RESOURCE_EXHAUSTED) são reenviados a outro servidor; shards lentos ganham
+    uma cópia em outro servidor e vale a primeira resposta. Com
+    lb_policy='least_outstanding', os servidores mais rápidos recebem mais shards
+    """
+
+    def __init__(self, client, shard_size=DEFAULT_SHARD_SIZE, concurrency=None,
+                 shard_timeout=None, max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 hedge_factor=DEFAULT_HEDGE_FACTOR):
+        """
+        Args:
+            client: CalculatorClient (normalmente com vários targets)
+            shard_size: Elementos por shard
+            concurrency: Máximo de shards em andamento (padrão: 2 por canal do cliente)
+            shard_timeout: Prazo de cada tentativa, em segundos (None: sem prazo)
+            max_attempts: Tentativas por shard antes de desistir
+            hedge_factor: Multiplicador da latência mediana para enviar a cópia
+                          de um shard lento (None desativa as cópias)
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size deve ser >= 1")
+        self.client = client
+        self.shard_size = shard_size
+        self.concurrency = concurrency or 2 * len(client.balancer.backends)
+        self.shard_timeout = shard_timeout
+        self.max_attempts = max_attempts
+        self.hedge_factor = hedge_factor
+        self.stats = {}
+
+    def compute(self, operation, nums1, nums2):
+        """
+        Executa a operação elemento a elemento distribuindo os shards
+
+        Args:
+            operation: 'add', 'sub', 'mul' ou 'div'
+            nums1: Array (ou sequência) com os primeiros operandos
+            nums2: Array (ou sequência) com os segundos operandos
+        Returns:
+            Tupla (array de resultados, array ordenado de índices com erro)
+        Raises:
+            ValueError: Se os vetores tiverem formas diferentes
+            ScatterGatherError: Se um shard falhar em todas as tentativas, ou
+                                com um erro que não é do servidor
+        """
+        nums1 = np.ascontiguousarray(nums1, dtype=VECTOR_DTYPE)
+        nums2 = np.ascontiguousarray(nums2, dtype=VECTOR_DTYPE)
+        if nums1.shape != nums2.shape or nums1.ndim != 1:
+            raise ValueError(f"Vetores devem ter uma dimensão e o mesmo tamanho "
+                             f"({nums1.shape} e {nums2.shape})")
+
+        size = len(nums1)
+        shards = [(start, min(start + self.shard_size, size)) for start in range(0, size, self.shard_size)]
+        results = np.empty(size, dtype=VECTOR_DTYPE)
+        error_indices = []
+        pending = deque(range(len(shards)))
+        attempts = [0] * len(shards)
+        hedged = set()
+        # shard -> targets onde o shard falhou ou está em andamento
+        avoid = {}
+        # shard -> lista de (future, instante de envio) das tentativas em andamento
+        in_flight = {}
+        completions = queue.Queue()
+        latencies = deque(maxlen=HEDGE_WINDOW)
+        remaining = len(shards)
+        retries = 0
+        started = time.perf_counter()
+
+        def send(index):
+            start, stop = shards[index]
+            request = calculator_pb2.VectorRequest(
+                operation=OPERATION_CODES[operation],
+                num1=nums1[start:stop].tobytes(),
+                num2=nums2[start:stop].tobytes()
+            )
+            attempts[index] += 1
+            targets = avoid.setdefault(index, set())
+            backend = self.client.balancer.acquire(exclude=targets)
+            targets.add(backend.target)
+            sent = time.perf_counter()
+            future = self.client._submit_to(backend, 'ComputeVector', request, self.shard_timeout)
+            in_flight.setdefault(index, []).append((future, sent))
+            future.add_done_callback(lambda call: completions.put((index, call, sent)))
+
+        try:
+            while remaining:
+                while pending and len(in_flight) < self.concurrency:
+                    send(pending.popleft())
+
+                hedge_delay = self._hedge_delay(latencies)
+                try:
+                    index, future, sent = completions.get(
+                        timeout=self._next_hedge(in_flight, hedged, attempts, hedge_delay))
+                except queue.Empty:
+                    now = time.perf_counter()
+                    for index, calls in list(in_flight.items()):
+                        if self._should_hedge(index, calls, hedged, attempts, hedge_delay, now):
+                            hedged.add(index)
+                            send(index)
+                    continue
+
+                calls = in_flight.get(index)
+                if calls is None:
+                    # Resposta tardia (ou cancelada) de um shard já resolvido
+                    continue
+                calls.remove((future, sent))
+                try:
+                    response = future.result()
+                except grpc.FutureCancelledError:
+                    continue
+                except grpc.RpcError as e:
+                    if e.code() not in BACKEND_FAILURE_CODES:
+                        raise ScatterGatherError(f"Shard {index}: {e.code().name} - {e.details()}") from e
+                    if calls:
+                        # Outra tentativa do mesmo shard ainda está em andamento
+                        continue
+                    del in_flight[index]
+                    if attempts[index] >= self.max_attempts:
+                        raise ScatterGatherError(f"Shard {index} falhou em {attempts[index]} tentativa(s): "
+                                                 f"{e.code().name} - {e.details()}") from e
+                    retries += 1
+                    pending.appendleft(index)
+                    continue
+
+                del in_flight[index]
+                for other, _ in calls:
+                    other.cancel()
+                start, stop = shards[index]
+                results[start:stop] = np.frombuffer(response.results, dtype=VECTOR_DTYPE)
+                if response.error_indices:
+                    error_indices.append(np.frombuffer(response.error_indices, dtype=VECTOR_INDEX_DTYPE) + start)
+                latencies.append(time.perf_counter() - sent)
+                remaining -= 1
+        finally:
+            for calls in in_flight.values():
+                for future, _ in calls:
+                    future.cancel()
+            self.stats = {
+                'size': size,
+                'shards': len(shards),
+                'attempts': sum(attempts),
+                'retries': retries,
+                'hedges': len(hedged),
+                'elapsed': time.perf_counter() - started,
+            }
+
+        errors = np.sort(np.concatenate(error_indices)) if error_indices else np.empty(0, dtype=np.int64)
+        return results, errors
+
+    def _hedge_delay(self, latencies):
+        """
+        Tempo de espera antes da cópia de um shard, ou None se desativado
+        """
+        if self.hedge_factor is None or len(latencies) < MIN_HEDGE_SAMPLES:
+            return None
+        return self.hedge_factor * statistics.median(latencies)
+
+    def _should_hedge(self, index, calls, hedged, attempts, hedge_delay, now):
+        """
+        True se o shard tem uma única tentativa e ela passou do prazo de cópia
+        """
+        return (hedge_delay is not None and index not in hedged and len(calls) == 1
+                and attempts[index] < self.max_attempts and now - calls[0][1] >= hedge_delay)
+
+    def _next_hedge(self, in_flight, hedged, attempts, hedge_delay):
+        """
+        Segundos até a próxima cópia possível (None: esperar a próxima resposta)
+        """
+        if hedge_delay is None:
+            return None
+        deadlines = [calls[0][1] + hedge_delay for index, calls in in_flight.items()
+                     if index not in hedged and len(calls) == 1 and attempts[index] < self.max_attempts]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.perf_counter())
+
+
+def expected_results(operation, nums1, nums2):
+    """
+    Resultados de referência calculados localmente (divisão por zero vira 0)
+
+    Returns:
+        Tupla (resultados, índices com erro)
+    """
+    if operation == 'add':
+        return nums1 + nums2, np.empty(0, dtype=np.int64)
+    if operation == 'sub':
+        return nums1 - nums2, np.empty(0, dtype=np.int64)
+    if operation == 'mul':
+        return nums1 * nums2, np.empty(0, dtype=np.int64)
+    zero = nums2 == 0
+    return np.divide(nums1, nums2, out=np.zeros_like(nums1), where=~zero), np.flatnonzero(zero)
+
+
+def parse_args():
+    """
+    Lê as opções de linha de comando
+    """
+    parser = argparse.ArgumentParser(
+        description="Executa uma operação vetorial distribuída entre vários servidores e confere o resultado"
+    )
+    parser.add_argument('--target', action='append', dest='targets',
+                        help="Servidor (host:porta ou unix:caminho); repita para vários (padrão: localhost:50051)")
+    parser.add_argument('--operation', choices=sorted(OPERATION_CODES), default='div',
+                        help="Operação (padrão: div)")
+    parser.add_argument('--size', type=int, default=2_000_000, help="Elementos do vetor (padrão: 2000000)")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE,
+                        help=f"Elementos por shard (padrão: {DEFAULT_SHARD_SIZE})")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Shards em andamento (padrão: 2 por servidor)")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Prazo de cada tentativa, em segundos")
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f"Tentativas por shard (padrão: {DEFAULT_MAX_ATTEMPTS})")
+    parser.add_argument('--hedge-factor', type=float, default=DEFAULT_HEDGE_FACTOR,
+                        help="Cópia de um shard pendente há mais que N x a latência mediana; 0 desativa")
+    parser.add_argument('--repeat', type=int, default=1, help="Número de execuções")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    targets = args.targets or ['localhost:50051']
+    client = CalculatorClient(targets=targets, lb_policy='least_outstanding',
+                              max_message_length=64 * 1024 * 1024)
+    coordinator = ScatterGather(client, args.shard_size, args.concurrency, args.timeout,
+                                args.max_attempts, args.hedge_factor or None)
+
+    rng = np.random.default_rng()
+    nums1 = rng.uniform(-1000, 1000, args.size)
+    nums2 = rng.integers(-5, 5, args.size).astype(VECTOR_DTYPE)
+    expected, expected_errors = expected_results(args.operation, nums1, nums2)
+
+    try:
+        for run in range(1, args.repeat + 1):
+            try:
+                results, errors = coordinator.compute(args.operation, nums1, nums2)
+            except ScatterGatherError as e:
+                print(f"❌ Execução {run}: {e}")
+                continue
+            stats = coordinator.stats
+            correct = np.allclose(results, expected) and np.array_equal(errors, expected_errors)
+            print(f"{'✅' if correct else '❌'} Execução {run}: {stats['size']} operações em "
+                  f"{stats['elapsed'] * 1000:.1f} ms ({stats['size'] / stats['elapsed']:,.0f} ops/s) | "
+                  f"{stats['shards']} shards, {stats['retries']} reenvio(s), {stats['hedges']} cópia(s)")
+        for backend in client.backend_stats():
+            ejected = f", ejetado por {backend['ejected']:.1f}s" if backend['ejected'] else ""
+            print(f"   {backend['target']}: {backend['requests']} chamadas, "
+                  f"{backend['failures']} falha(s){ejected}")
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+from google import protobuf
+from google.protobuf.internal import api_implementation
+
+import calculator_pb2
+
+
+# Backends do protobuf em Python (escolhidos pela variável de ambiente antes da importação)
+PROTOBUF_BACKENDS = ('upb', 'python', 'cpp')
+BACKEND_ENV = 'PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'
+
+# Elementos por payload na comparação escalar x repeated packed x bytes
+DEFAULT_SIZES = (1, 128, 4096)
+
+# Tempo mínimo de cada medição, em segundos (o número de chamadas é ajustado)
+DEFAULT_MIN_TIME = 0.2
+
+# Medições por caso; vale a mais rápida (menos ruído do sistema)
+DEFAULT_REPEAT = 5
+
+
+def measure(function, min_time=DEFAULT_MIN_TIME, repeat=DEFAULT_REPEAT):
+    """
+    Tempo por chamada de function(), em nanossegundos
+    O número de chamadas por medição cresce até a medição durar min_time;
+    das `repeat` medições, vale a mais rápida
+
+    Returns:
+        Tupla (nanossegundos por chamada, chamadas por medição)
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / number * 1e9, number
+
+
+def unary_cases():
+    """
+    Casos das mensagens unárias (OperationRequest e OperationResponse)
+    "fresh" constrói a mensagem a cada chamada, como os handlers do
+    CalculatorService; "reuse" altera e serializa sempre a mesma instância
+
+    Returns:
+        Lista de (mensagem, variante, operação, função, bytes serializados)
+    """
+    request = calculator_pb2.OperationRequest(num1=7.25, num2=3.5)
+    request_data = request.SerializeToString()
+    reused_request = calculator_pb2.OperationRequest()
+
+    def encode_request_fresh():
+        return calculator_pb2.OperationRequest(num1=7.25, num2=3.5).SerializeToString()
+
+    def encode_request_reuse():
+        reused_request.num1 = 7.25
+        reused_request.num2 = 3.5
+        return reused_request.SerializeToString()
+
+    def decode_request_fresh():
+        return calculator_pb2.OperationRequest.FromString(request_data)
+
+    def decode_request_reuse():
+        reused_request.ParseFromString(request_data)
+        return reused_request
+
+    response = calculator_pb2.OperationResponse(result=2.0714285714285716, success=True, error="")
+    response_data = response.SerializeToString()
+    error_response = calculator_pb2.OperationResponse(
+        result=0, success=False, error="Erro: Divisão por zero não permitida")
+    error_data = error_response.SerializeToString()
+    reused_response = calculator_pb2.OperationResponse()
+
+    def encode_response_fresh():
+        return calculator_pb2.OperationResponse(
+            result=2.0714285714285716, success=True, error="").SerializeToString()
+
+    def encode_response_reuse():
+        reused_response.result = 2.0714285714285716
+        reused_response.success = True
+        reused_response.error = ""
+        return reused_response.SerializeToString()
+
+    def decode_response_fresh():
+        return calculator_pb2.OperationResponse.FromString(response_data)
+
+    def decode_response_reuse():
+        reused_response.ParseFromString(response_data)
+        return reused_response
+
+    def decode_error_response():
+        return calculator_pb2.OperationResponse.FromString(error_data)
+
+    return [
+        ('OperationRequest', 'fresh', 'encode', encode_request_fresh, len(request_data)),
+        ('OperationRequest', 'reuse', 'encode', encode_request_reuse, len(request_data)),
+        ('OperationRequest', 'fresh', 'decode', decode_request_fresh, len(request_data)),
+        ('OperationRequest', 'reuse', 'decode', decode_request_reuse, len(request_data)),
+        ('OperationResponse', 'fresh', 'encode', encode_response_fresh, len(response_data)),
+        ('OperationResponse', 'reuse', 'encode', encode_response_reuse, len(response_data)),
+        ('OperationResponse', 'fresh', 'decode', decode_response_fresh, len(response_data)),
+        ('OperationResponse', 'reuse', 'decode', decode_response_reuse, len(response_data)),
+        ('OperationResponse', 'error', 'decode', decode_error_response, len(error_data)),
+    ]
+
+
+def payload_cases(size, rng):
+    """
+    Casos de um payload de `size` pares de operandos em três formatos:
+    scalar (uma OperationRequest por par, como nas chamadas unárias),
+    packed (BatchRequest, repeated double) e bytes (VectorRequest, float64
+    little-endian convertido com numpy)
+
+    Returns:
+        Lista de (mensagem, variante, operação, função, bytes serializados)
+    """
+    nums1 = rng.uniform(-1000, 1000, size)
+    nums2 = rng.uniform(1, 1000, size)
+    list1 = nums1.tolist()
+    list2 = nums2.tolist()
+
+    scalar_data = [calculator_pb2.OperationRequest(num1=a, num2=b).SerializeToString()
+                   for a, b in zip(list1, list2)]
+
+    def encode_scalar():
+        return [calculator_pb2.OperationRequest(num1=a, num2=b).SerializeToString()
+                for a, b in zip(list1, list2)]
+
+    def decode_scalar():
+        return [calculator_pb2.OperationRequest.FromString(data) for data in scalar_data]
+
+    packed_data = calculator_pb2.BatchRequest(num1=list1, num2=list2).SerializeToString()
+
+    def encode_packed():
+        return calculator_pb2.BatchRequest(num1=list1, num2=list2).SerializeToString()
+
+    def decode_packed():
+        # Como em CalculatorService._run_batch: repeated double -> array NumPy
+        request = calculator_pb2.BatchRequest.FromString(packed_data)
+        return (np.fromiter(request.num1, dtype=np.float64, count=size),
+                np.fromiter(request.num2, dtype=np.float64, count=size))
+
+    bytes_data = calculator_pb2.VectorRequest(
+        operation=calculator_pb2.DIV, num1=nums1.tobytes(), num2=nums2.tobytes()).SerializeToString()
+
+    def encode_bytes():
+        return calculator_pb2.VectorRequest(
+            operation=calculator_pb2.DIV, num1=nums1.tobytes(), num2=nums2.tobytes()).SerializeToString()
+
+    def decode_bytes():
+        request = calculator_pb2.VectorRequest.FromString(bytes_data)
+        return np.frombuffer(request.num1, dtype='<f8'), np.frombuffer(request.num2, dtype='<f8')
+
+    return [
+        ('OperationRequest', 'scalar', 'encode', encode_scalar, sum(map(len, scalar_data))),
+        ('OperationRequest', 'scalar', 'decode', decode_scalar, sum(map(len, scalar_data))),
+        ('BatchRequest', 'packed', 'encode', encode_packed, len(packed_data)),
+        ('BatchRequest', 'packed', 'decode', decode_packed, len(packed_data)),
+        ('VectorRequest', 'bytes', 'encode', encode_bytes, len(bytes_data)),
+        ('VectorRequest', 'bytes', 'decode', decode_bytes, len(bytes_data)),
+    ]
+
+
+def run_cases(sizes, min_time, repeat, seed):
+    """
+    Mede todos os casos no backend do processo atual
+
+    Returns:
+        Lista de dicionários, um por caso
+    """
+    backend = api_implementation.Type()
+    rng = np.random.default_rng(seed)
+    cases = [('unary', 1, case) for case in unary_cases()]
+    for size in sizes:
+        cases.extend(('payload', size, case) for case in payload_cases(size, rng))
+
+    rows = []
+    for suite, size, (message, variant, operation, function, size_bytes) in cases:
+        ns_per_call, number = measure(function, min_time, repeat)
+        rows.append({
+            'backend': backend,
+            'protobuf': protobuf.__version__,
+            'suite': suite,
+            'message': message,
+            'variant': variant,
+            'operation': operation,
+            'elements': size,
+            'bytes': size_bytes,
+            'calls': number,
+            'ns_per_call': round(ns_per_call, 1),
+            'ns_per_element': round(ns_per_call / size, 1),
+            'mb_per_s': round(size_bytes / ns_per_call * 1e3, 1),
+        })
+    return rows
+
+
+def run_backend(backend, args):
+    """
+    Executa os casos em um processo filho com o backend escolhido
+    (o backend é fixado na primeira importação do protobuf)
+
+    Returns:
+        Lista de dicionários, ou None se o backend não está disponível
+    """
+    command = [sys.executable, os.path.abspath(__file__), '--child',
+               '--min-time', str(args.min_time), '--repeat', str(args.repeat), '--seed', str(args.seed),
+               '--sizes', *map(str, args.sizes)]
+    env = dict(os.environ, **{BACKEND_ENV: backend})
+    completed = subprocess.run(command, env=env, capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    if completed.returncode != 0:
+        return None
+    rows = [json.loads(line) for line in completed.stdout.splitlines() if line.strip()]
+    # O protobuf pode ignorar a variável (ex.: cpp ausente nesta versão)
+    if not rows or rows[0]['backend'] != backend:
+        return None
+    return rows
+
+
+def write_rows(rows, output_format, output=None):
+    """
+    Escreve as linhas em JSON (uma por linha) ou CSV
+    Em CSV, o cabeçalho só é escrito se o arquivo de saída for novo
+
+    Args:
+        rows: Lista de dicionários com os mesmos campos
+        output_format: 'json' ou 'csv'
+        output: Caminho do arquivo (acrescenta ao final); None para stdout
+    """
+    is_new = output is None or not os.path.exists(output) or os.path.getsize(output) == 0
+    stream = open(output, 'a', newline='') if output else sys.stdout
+    try:
+        if output_format == 'json':
+            for row in rows:
+                stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+        elif rows:
+            writer = csv.DictWriter(stream, fieldnames=list(rows[0]))
+            if is_new:
+                writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if output:
+            stream.close()
+
+
+def print_table(rows):
+    """
+    Imprime uma tabela legível dos resultados e o custo de serialização de
+    uma chamada unária no servidor (decode da requisição + encode da resposta)
+    """
+    print(f"\n{'backend':<8} {'mensagem':<18} {'variante':<8} {'op':<7} {'elem':>6} "
+          f"{'bytes':>8} {'ns/chamada':>12} {'ns/elem':>9} {'MB/s':>8}", file=sys.stderr)
+    for row in rows:
+        print(f"{row['backend']:<8} {row['message']:<18} {row['variant']:<8} {row['operation']:<7} "
+              f"{row['elements']:>6} {row['bytes']:>8} {row['ns_per_call']:>12,.1f} "
+              f"{row['ns_per_element']:>9,.1f} {row['mb_per_s']:>8,.1f}", file=sys.stderr)
+
+    for backend in dict.fromkeys(row['backend'] for row in rows):
+        cost = {(row['message'], row['variant'], row['operation']): row['ns_per_call']
+                for row in rows if row['backend'] == backend and row['suite'] == 'unary'}
+        server = cost[('OperationRequest', 'fresh', 'decode')] + cost[('OperationResponse', 'fresh', 'encode')]
+        print(f"\n📦 {backend}: serialização de uma chamada unária no servidor ≈ {server / 1000:.2f} µs "
+              f"(decode OperationRequest + encode OperationResponse)", file=sys.stderr)
+
+
+def parse_args(argv=None):
+    """
+    Lê as opções de linha de comando
+    """
+    parser = argparse.ArgumentParser(
+        description="Microbenchmark de serialização das mensagens do calculator.proto"
+    )
+    parser.add_argument('--backend', action='append', choices=PROTOBUF_BACKENDS, dest='backends',
+                        help="Backend do protobuf; repita para vários (padrão: todos os disponíveis)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help=f"Elementos por payload (padrão: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help=f"Duração mínima de cada medição, em segundos (padrão: {DEFAULT_MIN_TIME})")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"Medições por caso; vale a mais rápida (padrão: {DEFAULT_REPEAT})")
+    parser.add_argument('--seed', type=int, default=42, help="Semente dos operandos aleatórios")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help="Formato do relatório")
+    parser.add_argument('--output', default=None, help="Arquivo onde o relatório é acrescentado (padrão: stdout)")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main():
+    """
+    Função principal - mede cada backend em um processo próprio e escreve o relatório
+    """
+    args = parse_args()
+    if args.child:
+        write_rows(run_cases(args.sizes, args.min_time, args.repeat, args.seed), 'json')
+        return
+
+    rows = []
+    for backend in args.backends or PROTOBUF_BACKENDS:
+        print(f"⏱️  Medindo backend {backend}...", file=sys.stderr)
+        backend_rows = run_backend(backend, args)
+        if backend_rows is None:
+            print(f"⚠️  Backend {backend} indisponível nesta instalação do protobuf", file=sys.stderr)
+            continue
+        rows.extend(backend_rows)
+
+    if not rows:
+        print("❌ Nenhum backend disponível", file=sys.stderr)
+        sys.exit(1)
+    print_table(rows)
+    write_rows(rows, args.format, args.output)
+
+
+if __name__ == '__main__':
+    main()
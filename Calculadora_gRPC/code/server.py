@@ -1,46 +1,212 @@
 import grpc
 from concurrent import futures
+import argparse
+import asyncio
 import time
 import logging
+import operator
 from datetime import datetime
 
+import numpy as np
+
 import calculator_pb2
 import calculator_pb2_grpc
+from admission import (
+    AdmissionController,
+    AdmissionInterceptor,
+    AsyncAdmissionInterceptor,
+    parse_method_limits,
+)
+from aggregate import RunningStats
+from dataset import (
+    DATASET_CHUNK_SIZE,
+    DEFAULT_DATASET_MEMORY,
+    DEFAULT_MAX_DATASETS,
+    DatasetBuilder,
+    DatasetError,
+    DatasetStore,
+    UnknownDatasetError,
+)
+from expression import DEFAULT_PLAN_CACHE_SIZE, ExpressionError, PlanCache
+from fairness import FairScheduler, FairSchedulingInterceptor, parse_client_values
+from interceptors import wrap_handler, wrap_handler_async
+from log_config import LOG_MODES, configure_logging, operation_sampler, request_sampler
+from matrix import (
+    DEFAULT_MAX_RIGHT_BYTES,
+    MatrixAddStream,
+    MatrixError,
+    MatrixLimitError,
+    MatrixMultiplyStream,
+    MatrixTransposeStream,
+)
+from metrics import (
+    AsyncMetricsInterceptor,
+    MetricsInterceptor,
+    MetricsRegistry,
+    PERCENTILES,
+    start_metrics_http_server,
+)
+from profiling import (
+    ProfilingController,
+    ProfilingError,
+    ProfilingInterceptor,
+    install_signal_handlers,
+)
 
 
-# Configuração de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Configuração de logging (padrão síncrono; ajustável por --log-mode/--log-sample)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
 class LoggingInterceptor(grpc.ServerInterceptor):
     """
-    Interceptor para logging de todas as requisições
+    Interceptor para logging de todas as requisições (ou de uma amostra)
     Extra opcional
     """
     
     def intercept_service(self, continuation, handler_call_details):
+        if not request_sampler.should_log():
+            return continuation(handler_call_details)
+        
         method_name = handler_call_details.method
-        logger.info(f"📞 Requisição recebida: {method_name}")
-        logger.info(f"   Cliente: {handler_call_details.invocation_metadata}")
+        logger.info("📞 Requisição recebida: %s", method_name)
+        logger.info("   Cliente: %s", handler_call_details.invocation_metadata)
         
-        start_time = time.time()
-        response = continuation(handler_call_details)
-        elapsed_time = time.time() - start_time
+        # Mede a execução do handler, não apenas a busca feita pela continuation
+        def log_done(start_time, code):
+            elapsed_time = time.perf_counter() - start_time
+            logger.info("✅ Requisição processada: %s em %.4fs (%s)", method_name, elapsed_time, code.name)
         
-        logger.info(f"✅ Requisição processada: {method_name} em {elapsed_time:.4f}s")
-        return response
+        return wrap_handler(
+            continuation(handler_call_details),
+            lambda context: time.perf_counter(),
+            log_done
+        )
+
+
+class AsyncLoggingInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Interceptor de log equivalente ao LoggingInterceptor para o servidor asyncio
+    """
+    
+    async def intercept_service(self, continuation, handler_call_details):
+        if not request_sampler.should_log():
+            return await continuation(handler_call_details)
+        
+        method_name = handler_call_details.method
+        logger.info("📞 Requisição recebida: %s", method_name)
+        logger.info("   Cliente: %s", handler_call_details.invocation_metadata)
+        
+        def log_done(start_time, code):
+            elapsed_time = time.perf_counter() - start_time
+            logger.info("✅ Requisição processada: %s em %.4fs (%s)", method_name, elapsed_time, code.name)
+        
+        return wrap_handler_async(
+            await continuation(handler_call_details),
+            lambda context: time.perf_counter(),
+            log_done
+        )
+
+
+# Mensagem padrão para divisão por zero
+DIVISION_BY_ZERO_ERROR = "Erro: Divisão por zero não permitida"
+
+# Funções escalares indexadas pelo enum Operation (usadas pelo stream Compute)
+SCALAR_OPERATIONS = {
+    calculator_pb2.ADD: operator.add,
+    calculator_pb2.SUB: operator.sub,
+    calculator_pb2.MUL: operator.mul,
+    calculator_pb2.DIV: operator.truediv,
+}
+
+
+def evaluate_scalar(operation, num1, num2):
+    """
+    Avalia uma operação escalar identificada pelo enum Operation
+
+    Args:
+        operation: Valor do enum Operation
+        num1: Primeiro operando
+        num2: Segundo operando
+    Returns:
+        Tupla (resultado, mensagem de erro vazia se sucesso)
+    """
+    function = SCALAR_OPERATIONS.get(operation)
+    if function is None:
+        return 0, f"Erro: Operação desconhecida ({operation})"
+    if operation == calculator_pb2.DIV and num2 == 0:
+        return 0, DIVISION_BY_ZERO_ERROR
+    return function(num1, num2), ""
+
+
+# Funções vetoriais usadas pelas operações em lote
+BATCH_OPERATIONS = {
+    'ADD': np.add,
+    'SUB': np.subtract,
+    'MUL': np.multiply,
+}
+
+
+def evaluate_batch(operation, num1, num2):
+    """
+    Avalia uma operação elemento a elemento sobre dois arrays NumPy
+
+    Args:
+        operation: Nome da operação ('ADD', 'SUB', 'MUL' ou 'DIV')
+        num1: Array float64 com os primeiros operandos
+        num2: Array float64 com os segundos operandos
+    Returns:
+        Tupla (resultados, índices com divisão por zero)
+    """
+    # Overflow e NaN resultam em inf/nan, como nas operações unárias, sem
+    # RuntimeWarning no stderr do servidor
+    with np.errstate(over='ignore', invalid='ignore'):
+        if operation != 'DIV':
+            return BATCH_OPERATIONS[operation](num1, num2), np.empty(0, dtype=np.intp)
+
+        # Divisão por zero é marcada por elemento e o resultado fica 0
+        zero_mask = num2 == 0
+        results = np.zeros_like(num1)
+        np.divide(num1, num2, out=results, where=~zero_mask)
+        return results, np.flatnonzero(zero_mask)
+
+
+# Formato dos buffers de ComputeVector: float64 e uint32 little-endian
+VECTOR_DTYPE = np.dtype('<f8')
+VECTOR_INDEX_DTYPE = np.dtype('<u4')
+VECTOR_ITEMSIZE = VECTOR_DTYPE.itemsize
 
 
 class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
     """
     Implementação do serviço Calculator (stateless)
-    Todas as operações são chamadas unárias
+    Todas as operações são chamadas unárias, com variantes em lote
+    e um stream bidirecional (Compute)
+    O estado mantido é o cache de expressões compiladas (Evaluate), os
+    conjuntos de dados enviados por UploadDataset e as métricas de
+    observabilidade (Stats, Profile)
     """
     
+    def __init__(self, plan_cache_size=DEFAULT_PLAN_CACHE_SIZE, metrics=None, profiler=None,
+                 fair_scheduler=None, datasets=None, max_matrix_bytes=DEFAULT_MAX_RIGHT_BYTES):
+        """
+        Args:
+            plan_cache_size: Capacidade do cache LRU de expressões compiladas
+            metrics: MetricsRegistry alimentado pelo MetricsInterceptor
+            profiler: ProfilingController da RPC Profile (None: profiling desativado)
+            fair_scheduler: FairScheduler cujos contadores por cliente vão no Stats (opcional)
+            datasets: DatasetStore dos conjuntos de dados (padrão: um novo armazenamento,
+                      só em memória)
+            max_matrix_bytes: Tamanho máximo de B em cada MatrixMultiply, em bytes
+        """
+        self.plan_cache = PlanCache(plan_cache_size)
+        self.metrics = metrics or MetricsRegistry()
+        self.profiler = profiler
+        self.fair_scheduler = fair_scheduler
+        self.datasets = datasets if datasets is not None else DatasetStore()
+        self.max_matrix_bytes = max_matrix_bytes
+    
     def Add(self, request, context):
         """
         Operação de Adição
@@ -52,7 +218,8 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
         """
         try:
             result = request.num1 + request.num2
-            logger.info(f"➕ ADD: {request.num1} + {request.num2} = {result}")
+            if operation_sampler.should_log():
+                logger.info("➕ ADD: %s + %s = %s", request.num1, request.num2, result)
             
             return calculator_pb2.OperationResponse(
                 result=result,
@@ -60,7 +227,7 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
                 error=""
             )
         except Exception as e:
-            logger.error(f"❌ Erro na adição: {str(e)}")
+            logger.error("❌ Erro na adição: %s", e)
             return calculator_pb2.OperationResponse(
                 result=0,
                 success=False,
@@ -78,7 +245,8 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
         """
         try:
             result = request.num1 - request.num2
-            logger.info(f"➖ SUB: {request.num1} - {request.num2} = {result}")
+            if operation_sampler.should_log():
+                logger.info("➖ SUB: %s - %s = %s", request.num1, request.num2, result)
             
             return calculator_pb2.OperationResponse(
                 result=result,
@@ -86,7 +254,7 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
                 error=""
             )
         except Exception as e:
-            logger.error(f"❌ Erro na subtração: {str(e)}")
+            logger.error("❌ Erro na subtração: %s", e)
             return calculator_pb2.OperationResponse(
                 result=0,
                 success=False,
@@ -104,7 +272,8 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
         """
         try:
             result = request.num1 * request.num2
-            logger.info(f"✖️  MUL: {request.num1} * {request.num2} = {result}")
+            if operation_sampler.should_log():
+                logger.info("✖️  MUL: %s * %s = %s", request.num1, request.num2, result)
             
             return calculator_pb2.OperationResponse(
                 result=result,
@@ -112,7 +281,7 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
                 error=""
             )
         except Exception as e:
-            logger.error(f"❌ Erro na multiplicação: {str(e)}")
+            logger.error("❌ Erro na multiplicação: %s", e)
             return calculator_pb2.OperationResponse(
                 result=0,
                 success=False,
@@ -133,8 +302,9 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
         try:
             # Validação de entrada - divisão por zero
             if request.num2 == 0:
-                error_msg = "Erro: Divisão por zero não permitida"
-                logger.warning(f"⚠️  DIV: Tentativa de divisão por zero - {request.num1} / {request.num2}")
+                error_msg = DIVISION_BY_ZERO_ERROR
+                if operation_sampler.should_log():
+                    logger.warning("⚠️  DIV: Tentativa de divisão por zero - %s / %s", request.num1, request.num2)
                 
                 # Define código de erro gRPC
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
@@ -147,7 +317,8 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
                 )
             
             result = request.num1 / request.num2
-            logger.info(f"➗ DIV: {request.num1} / {request.num2} = {result}")
+            if operation_sampler.should_log():
+                logger.info("➗ DIV: %s / %s = %s", request.num1, request.num2, result)
             
             return calculator_pb2.OperationResponse(
                 result=result,
@@ -155,37 +326,960 @@ class CalculatorService(calculator_pb2_grpc.CalculatorServicer):
                 error=""
             )
         except Exception as e:
-            logger.error(f"❌ Erro na divisão: {str(e)}")
+            logger.error("❌ Erro na divisão: %s", e)
             return calculator_pb2.OperationResponse(
                 result=0,
                 success=False,
                 error=str(e)
             )
+    
+    def AddBatch(self, request, context):
+        """
+        Adição vetorial em lote
+        Args:
+            request: BatchRequest com arrays num1 e num2
+            context: Contexto gRPC
+        Returns:
+            BatchResponse com os resultados
+        """
+        return self._run_batch('ADD', request, context)
+    
+    def SubBatch(self, request, context):
+        """
+        Subtração vetorial em lote
+        Args:
+            request: BatchRequest com arrays num1 e num2
+            context: Contexto gRPC
+        Returns:
+            BatchResponse com os resultados
+        """
+        return self._run_batch('SUB', request, context)
+    
+    def MulBatch(self, request, context):
+        """
+        Multiplicação vetorial em lote
+        Args:
+            request: BatchRequest com arrays num1 e num2
+            context: Contexto gRPC
+        Returns:
+            BatchResponse com os resultados
+        """
+        return self._run_batch('MUL', request, context)
+    
+    def DivBatch(self, request, context):
+        """
+        Divisão vetorial em lote
+        Divisões por zero não derrubam o lote: são devolvidas em error_indices
+        
+        Args:
+            request: BatchRequest com arrays num1 e num2
+            context: Contexto gRPC
+        Returns:
+            BatchResponse com os resultados e os índices com erro
+        """
+        return self._run_batch('DIV', request, context)
+    
+    def ComputeVector(self, request, context):
+        """
+        Operação vetorial sobre operandos brutos (float64 little-endian)
+        Os bytes recebidos são vistos como arrays com np.frombuffer, sem cópia
+        e sem um objeto Python por elemento; o resultado volta como bytes
+        Cada operando pode ser um conjunto de dados do servidor (num1_handle,
+        num2_handle), recortado por offset e limit; com keep_result, o
+        resultado fica no servidor e volta apenas o seu handle
+        
+        Args:
+            request: VectorRequest com a operação e os buffers ou handles dos operandos
+            context: Contexto gRPC
+        Returns:
+            VectorResponse com os resultados (ou result_handle) e os índices com erro
+        """
+        operation = f"OP {request.operation}"
+        try:
+            # proto3 preserva valores desconhecidos do enum
+            if request.operation not in SCALAR_OPERATIONS:
+                raise ValueError(f"Erro: Operação desconhecida ({request.operation})")
+            operation = calculator_pb2.Operation.Name(request.operation)
+            num1, num2 = self._vector_operands(request)
+        except UnknownDatasetError as e:
+            return self._vector_error(operation, grpc.StatusCode.NOT_FOUND, f"Erro: {e}", context)
+        except ValueError as e:
+            return self._vector_error(operation, grpc.StatusCode.INVALID_ARGUMENT, str(e), context)
+        results, error_indices = evaluate_batch(operation, num1, num2)
+        
+        error_msg = ""
+        if len(error_indices):
+            error_msg = f"Erro: Divisão por zero em {len(error_indices)} elemento(s)"
+        if operation_sampler.should_log():
+            logger.info("🧱 %s VECTOR: %d operações, %d com erro", operation, len(num1), len(error_indices))
+        
+        response = calculator_pb2.VectorResponse(
+            error_indices=error_indices.astype(VECTOR_INDEX_DTYPE).tobytes(),
+            count=len(num1),
+            success=True,
+            error=error_msg
+        )
+        if request.keep_result:
+            try:
+                response.result_handle = self.datasets.put(results)['handle']
+            except DatasetError as e:
+                return self._vector_error(operation, grpc.StatusCode.RESOURCE_EXHAUSTED, f"Erro: {e}", context)
+        else:
+            response.results = results.astype(VECTOR_DTYPE, copy=False).tobytes()
+        return response
+    
+    def _vector_operands(self, request):
+        """
+        Operandos de ComputeVector: os buffers da requisição ou os conjuntos
+        de dados indicados, recortados por offset e limit (sem cópia)
+        
+        Returns:
+            Tupla (num1, num2) de arrays float64
+        Raises:
+            UnknownDatasetError: Se um handle não existir
+            ValueError: Se os operandos tiverem tamanhos diferentes ou inválidos
+        """
+        operands = []
+        sizes = []
+        for buffer, handle in ((request.num1, request.num1_handle), (request.num2, request.num2_handle)):
+            if handle:
+                values = self.datasets.get(handle)
+                stop = request.offset + request.limit if request.limit else None
+                operands.append(values[request.offset:stop])
+                sizes.append(operands[-1].nbytes)
+            elif len(buffer) % VECTOR_ITEMSIZE:
+                operands.append(None)
+                sizes.append(len(buffer))
+            else:
+                operands.append(np.frombuffer(buffer, dtype=VECTOR_DTYPE))
+                sizes.append(len(buffer))
+        num1, num2 = operands
+        if num1 is None or num2 is None or len(num1) != len(num2):
+            raise ValueError(f"Erro: num1 e num2 devem ter o mesmo tamanho, múltiplo de "
+                             f"{VECTOR_ITEMSIZE} bytes ({sizes[0]} e {sizes[1]} bytes)")
+        return num1, num2
+    
+    def _vector_error(self, operation, code, error_msg, context):
+        """
+        Registra e responde um erro de ComputeVector
+        """
+        logger.warning("⚠️  %s VECTOR: %s", operation, error_msg)
+        context.set_code(code)
+        context.set_details(error_msg)
+        return calculator_pb2.VectorResponse(success=False, error=error_msg)
+    
+    def Aggregate(self, request_iterator, context):
+        """
+        Agregados de um stream de blocos de números (stream do cliente)
+        Cada bloco é processado e descartado; a memória usada não depende
+        do tamanho do stream
+        
+        Args:
+            request_iterator: Stream de AggregateChunk
+            context: Contexto gRPC
+        Returns:
+            AggregateResponse com os agregados
+        """
+        stats = RunningStats()
+        for chunk in request_iterator:
+            error = self._aggregate_chunk(stats, chunk)
+            if error:
+                return self._aggregate_error(*error, context)
+        return self._aggregate_response(stats)
+    
+    def _aggregate_chunk(self, stats, chunk):
+        """
+        Acrescenta um AggregateChunk aos agregados
+        Um conjunto de dados (handle) é percorrido em blocos, sem cópia inteira
+        
+        Returns:
+            Tupla (código de status, mensagem de erro), ou None se o bloco for válido
+        """
+        try:
+            for values in self._chunk_values(chunk):
+                stats.update(values)
+            if chunk.handle:
+                values = self.datasets.get(chunk.handle)
+                for start in range(0, len(values), DATASET_CHUNK_SIZE):
+                    stats.update(values[start:start + DATASET_CHUNK_SIZE])
+        except UnknownDatasetError as e:
+            return grpc.StatusCode.NOT_FOUND, f"Erro: {e}"
+        except ValueError as e:
+            return grpc.StatusCode.INVALID_ARGUMENT, str(e)
+        return None
+    
+    def _aggregate_error(self, code, error_msg, context):
+        """
+        Registra e responde um erro de Aggregate
+        """
+        logger.warning("⚠️  AGGREGATE: %s", error_msg)
+        context.set_code(code)
+        context.set_details(error_msg)
+        return calculator_pb2.AggregateResponse(success=False, error=error_msg)
+    
+    def _chunk_values(self, chunk):
+        """
+        Valores de um AggregateChunk ou DatasetChunk (campos values e raw)
+        
+        Returns:
+            Lista de arrays float64 (raw é visto com np.frombuffer, sem cópia)
+        Raises:
+            ValueError: Se raw não tiver tamanho múltiplo de 8 bytes
+        """
+        if len(chunk.raw) % VECTOR_ITEMSIZE:
+            raise ValueError(f"Erro: raw deve ter tamanho múltiplo de {VECTOR_ITEMSIZE} bytes "
+                             f"({len(chunk.raw)} bytes)")
+        blocks = []
+        if chunk.values:
+            blocks.append(np.fromiter(chunk.values, dtype=np.float64, count=len(chunk.values)))
+        if chunk.raw:
+            blocks.append(np.frombuffer(chunk.raw, dtype=VECTOR_DTYPE))
+        return blocks
+    
+    def _aggregate_response(self, stats):
+        """
+        Monta a AggregateResponse a partir dos agregados
+        """
+        if operation_sampler.should_log():
+            logger.info("📊 AGGREGATE: %d valores", stats.count)
+        return calculator_pb2.AggregateResponse(success=True, **stats.to_dict())
+    
+    def MatrixAdd(self, request_iterator, context):
+        """
+        Soma de matrizes em blocos de linhas (stream bidirecional)
+        
+        Args:
+            request_iterator: Stream de MatrixAddChunk (blocos de A e B)
+            context: Contexto gRPC
+        Yields:
+            MatrixBlock do resultado
+        """
+        yield from self._run_matrix_stream('MATRIX ADD', MatrixAddStream(), request_iterator, context)
+    
+    def MatrixMultiply(self, request_iterator, context):
+        """
+        Produto de matrizes: B inteira primeiro, depois A em blocos de linhas
+        B fica em memória durante o stream; acima de max_matrix_bytes o
+        stream é encerrado com RESOURCE_EXHAUSTED
+        
+        Args:
+            request_iterator: Stream de MatrixMultiplyChunk
+            context: Contexto gRPC
+        Yields:
+            MatrixBlock do resultado, um por bloco de A
+        """
+        yield from self._run_matrix_stream('MATRIX MUL', MatrixMultiplyStream(self.max_matrix_bytes),
+                                           request_iterator, context)
+    
+    def MatrixTranspose(self, request_iterator, context):
+        """
+        Transposta de uma matriz enviada em blocos de linhas
+        
+        Args:
+            request_iterator: Stream de MatrixBlock de A
+            context: Contexto gRPC
+        Yields:
+            MatrixBlock do resultado (blocos de colunas)
+        """
+        yield from self._run_matrix_stream('MATRIX T', MatrixTransposeStream(), request_iterator, context)
+    
+    def _run_matrix_stream(self, name, stream, request_iterator, context):
+        """
+        Processa um stream de blocos de matriz, devolvendo cada bloco do
+        resultado assim que calculado
+        Bloco inválido encerra o stream com INVALID_ARGUMENT; matriz acima do
+        limite de memória, com RESOURCE_EXHAUSTED
+        """
+        blocks = 0
+        for request in request_iterator:
+            try:
+                results = stream.feed(request)
+            except MatrixError as e:
+                self._matrix_error(name, e, context)
+                return
+            blocks += 1
+            yield from results
+        if operation_sampler.should_log():
+            logger.info("🔢 %s: %d bloco(s)", name, blocks)
+    
+    def _matrix_error(self, name, error, context):
+        """
+        Registra um bloco inválido e define INVALID_ARGUMENT (ou RESOURCE_EXHAUSTED
+        para matriz acima do limite de memória)
+        """
+        error_msg = f"Erro: {error}"
+        logger.warning("⚠️  %s: %s", name, error_msg)
+        if isinstance(error, MatrixLimitError):
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        else:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+        context.set_details(error_msg)
+    
+    def Compute(self, request_iterator, context):
+        """
+        Stream bidirecional de operações identificadas por tag
+        Cada resposta leva a tag da requisição correspondente; erros
+        (ex.: divisão por zero) são reportados por operação sem encerrar o stream
+        
+        Args:
+            request_iterator: Iterador de ComputeRequest
+            context: Contexto gRPC
+        Yields:
+            ComputeResponse com a tag e o resultado de cada operação
+        """
+        count = 0
+        errors = 0
+        for request in request_iterator:
+            result, error_msg = evaluate_scalar(request.operation, request.num1, request.num2)
+            count += 1
+            if error_msg:
+                errors += 1
+            yield calculator_pb2.ComputeResponse(
+                tag=request.tag,
+                result=result,
+                success=not error_msg,
+                error=error_msg
+            )
+        if operation_sampler.should_log():
+            logger.info("🔁 COMPUTE: stream encerrado com %d operações, %d com erro", count, errors)
+    
+    def Evaluate(self, request, context):
+        """
+        Avaliação de expressão aritmética com variáveis
+        O plano compilado é buscado no cache LRU; o parsing só ocorre em miss
+        
+        Args:
+            request: EvaluateRequest com a expressão e as variáveis
+            context: Contexto gRPC
+        Returns:
+            EvaluateResponse com resultado ou erro
+        """
+        cache_hit = False
+        try:
+            plan, cache_hit = self.plan_cache.get(request.expression)
+            result = plan.evaluate(request.variables)
+            if operation_sampler.should_log():
+                logger.info("🧩 EVAL: %s = %s (cache %s)", request.expression, result,
+                            'hit' if cache_hit else 'miss')
+            
+            return calculator_pb2.EvaluateResponse(
+                result=result,
+                success=True,
+                error="",
+                cache_hit=cache_hit
+            )
+        except (ExpressionError, ZeroDivisionError) as e:
+            error_msg = DIVISION_BY_ZERO_ERROR if isinstance(e, ZeroDivisionError) else f"Erro: {e}"
+            if operation_sampler.should_log():
+                logger.warning("⚠️  EVAL: %s - %s", request.expression, error_msg)
+            
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error_msg)
+            
+            return calculator_pb2.EvaluateResponse(
+                result=0,
+                success=False,
+                error=error_msg,
+                cache_hit=cache_hit
+            )
+        except Exception as e:
+            logger.error("❌ Erro na avaliação: %s", e)
+            return calculator_pb2.EvaluateResponse(
+                result=0,
+                success=False,
+                error=str(e),
+                cache_hit=cache_hit
+            )
+    
+    def UploadDataset(self, request_iterator, context):
+        """
+        Recebe um conjunto de dados em blocos (stream do cliente) e o guarda
+        no servidor; o handle devolvido substitui os operandos em ComputeVector
+        e Aggregate, que deixam de reenviar os mesmos valores
+        
+        Args:
+            request_iterator: Stream de DatasetChunk
+            context: Contexto gRPC
+        Returns:
+            DatasetInfo com o handle e o tamanho do conjunto
+        """
+        builder = DatasetBuilder(self.datasets.max_dataset_bytes)
+        for chunk in request_iterator:
+            error = self._upload_chunk(builder, chunk)
+            if error:
+                return self._dataset_error('UPLOAD', *error, context)
+        return self._store_upload(builder, context)
+    
+    def _upload_chunk(self, builder, chunk):
+        """
+        Acrescenta um DatasetChunk ao conjunto em construção
+        
+        Returns:
+            Tupla (código de status, mensagem de erro), ou None se o bloco for válido
+        """
+        try:
+            for values in self._chunk_values(chunk):
+                builder.add(values)
+        except DatasetError as e:
+            return grpc.StatusCode.RESOURCE_EXHAUSTED, f"Erro: {e}"
+        except ValueError as e:
+            return grpc.StatusCode.INVALID_ARGUMENT, str(e)
+        return None
+    
+    def _store_upload(self, builder, context):
+        """
+        Guarda o conjunto recebido por UploadDataset
+        """
+        try:
+            info = self.datasets.put(builder.values())
+        except DatasetError as e:
+            return self._dataset_error('UPLOAD', grpc.StatusCode.RESOURCE_EXHAUSTED, f"Erro: {e}", context)
+        if operation_sampler.should_log():
+            logger.info("🗄️  UPLOAD: conjunto %s com %d valores%s", info['handle'], info['count'],
+                        " (em disco)" if info['spilled'] else "")
+        return calculator_pb2.DatasetInfo(success=True, **info)
+    
+    def DownloadDataset(self, request, context):
+        """
+        Devolve os valores de um conjunto de dados em blocos de 1 MB (stream do servidor)
+        Args:
+            request: DatasetRequest com o handle
+            context: Contexto gRPC
+        Yields:
+            DatasetChunk com os valores em bytes (float64 little-endian)
+        """
+        try:
+            values = self.datasets.get(request.handle)
+        except UnknownDatasetError as e:
+            self._dataset_error('DOWNLOAD', grpc.StatusCode.NOT_FOUND, f"Erro: {e}", context)
+            return
+        for start in range(0, len(values), DATASET_CHUNK_SIZE):
+            yield calculator_pb2.DatasetChunk(raw=values[start:start + DATASET_CHUNK_SIZE].tobytes())
+    
+    def GetDataset(self, request, context):
+        """
+        Descrição de um conjunto de dados
+        Args:
+            request: DatasetRequest com o handle
+            context: Contexto gRPC
+        Returns:
+            DatasetInfo com o número de elementos, o tamanho e se está em disco
+        """
+        return self._dataset_call('GET', self.datasets.info, request, context)
+    
+    def DeleteDataset(self, request, context):
+        """
+        Remove um conjunto de dados e libera o espaço (memória ou disco)
+        Args:
+            request: DatasetRequest com o handle
+            context: Contexto gRPC
+        Returns:
+            DatasetInfo do conjunto removido
+        """
+        return self._dataset_call('DELETE', self.datasets.delete, request, context)
+    
+    def _dataset_call(self, name, function, request, context):
+        """
+        Executa uma chamada do armazenamento sobre o handle da requisição
+        """
+        try:
+            info = function(request.handle)
+        except UnknownDatasetError as e:
+            return self._dataset_error(name, grpc.StatusCode.NOT_FOUND, f"Erro: {e}", context)
+        return calculator_pb2.DatasetInfo(success=True, **info)
+    
+    def _dataset_error(self, name, code, error_msg, context):
+        """
+        Registra e responde um erro das chamadas de conjuntos de dados
+        """
+        logger.warning("⚠️  DATASET %s: %s", name, error_msg)
+        context.set_code(code)
+        context.set_details(error_msg)
+        return calculator_pb2.DatasetInfo(success=False, error=error_msg)
+    
+    def GetDatasetStoreStats(self, request, context):
+        """
+        Ocupação e contadores do armazenamento de conjuntos de dados
+        Args:
+            request: DatasetStoreStatsRequest (sem campos)
+            context: Contexto gRPC
+        Returns:
+            DatasetStoreStatsResponse com bytes em memória e em disco, limites e contadores
+        """
+        return calculator_pb2.DatasetStoreStatsResponse(**self.datasets.stats())
+    
+    def GetPlanCacheStats(self, request, context):
+        """
+        Contadores do cache de expressões compiladas
+        Args:
+            request: PlanCacheStatsRequest (sem campos)
+            context: Contexto gRPC
+        Returns:
+            PlanCacheStatsResponse com hits, misses, evictions, tamanho e capacidade
+        """
+        return calculator_pb2.PlanCacheStatsResponse(**self.plan_cache.stats())
+    
+    def Stats(self, request, context):
+        """
+        Métricas do servidor por método
+        Args:
+            request: StatsRequest (include_text para o formato Prometheus)
+            context: Contexto gRPC
+        Returns:
+            StatsResponse com contagens, erros, concorrência e percentis de latência,
+            e os contadores por cliente do escalonamento justo (se ativo)
+        """
+        snapshots = self.metrics.snapshot()
+        response = calculator_pb2.StatsResponse(uptime_seconds=self.metrics.uptime())
+        for snapshot in snapshots:
+            method_stats = response.methods.add(
+                method=snapshot['method'],
+                requests=snapshot['requests'],
+                errors=snapshot['errors'],
+                in_flight=snapshot['in_flight'],
+                mean_us=snapshot['mean_us'],
+                max_us=snapshot['max_us'],
+            )
+            for name, _ in PERCENTILES:
+                setattr(method_stats, f'{name}_us', snapshot[f'{name}_us'])
+        if self.fair_scheduler is not None:
+            for client in self.fair_scheduler.snapshot():
+                response.clients.add(**client)
+        if request.include_text:
+            response.text = self.metrics.render_text(snapshots)
+        return response
+    
+    def Profile(self, request, context):
+        """
+        Liga, desliga ou consulta o profiling do servidor em execução
+        Args:
+            request: ProfileRequest com a ação, o modo e os parâmetros de amostragem
+            context: Contexto gRPC
+        Returns:
+            ProfileResponse com o estado e os arquivos gravados
+        """
+        if self.profiler is None:
+            error_msg = "Erro: profiling desativado (inicie o servidor com --profile-dir)"
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(error_msg)
+            return calculator_pb2.ProfileResponse(success=False, error=error_msg)
+        
+        try:
+            if request.action == calculator_pb2.PROFILE_START:
+                mode = 'cprofile' if request.mode == calculator_pb2.PROFILE_CPROFILE else 'sampler'
+                self.profiler.start(mode, request.duration_seconds or None,
+                                    request.interval_ms / 1000 or None, request.sample_every or None)
+            elif request.action == calculator_pb2.PROFILE_STOP:
+                self.profiler.stop()
+        except ProfilingError as e:
+            error_msg = f"Erro: {e}"
+            logger.warning("⚠️  PROFILE: %s", error_msg)
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(error_msg)
+            return calculator_pb2.ProfileResponse(success=False, error=error_msg)
+        
+        status = self.profiler.status()
+        return calculator_pb2.ProfileResponse(
+            active=status['active'],
+            mode=status['mode'],
+            elapsed_seconds=status['elapsed'],
+            files=status['files'],
+            success=True
+        )
+    
+    def _run_batch(self, operation, request, context):
+        """
+        Executa uma operação em lote com NumPy em uma única chamada
+        
+        Args:
+            operation: Nome da operação ('ADD', 'SUB', 'MUL' ou 'DIV')
+            request: BatchRequest com arrays num1 e num2
+            context: Contexto gRPC
+        Returns:
+            BatchResponse com resultados e índices com erro
+        """
+        size = len(request.num1)
+        if size != len(request.num2):
+            error_msg = (f"Erro: num1 e num2 devem ter o mesmo tamanho "
+                         f"({size} != {len(request.num2)})")
+            logger.warning("⚠️  %s BATCH: %s", operation, error_msg)
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error_msg)
+            return calculator_pb2.BatchResponse(success=False, error=error_msg)
+        
+        try:
+            num1 = np.fromiter(request.num1, dtype=np.float64, count=size)
+            num2 = np.fromiter(request.num2, dtype=np.float64, count=size)
+            results, error_indices = evaluate_batch(operation, num1, num2)
+            
+            error_msg = ""
+            if len(error_indices):
+                error_msg = f"Erro: Divisão por zero em {len(error_indices)} elemento(s)"
+            if operation_sampler.should_log():
+                logger.info("📦 %s BATCH: %d operações, %d com erro", operation, size, len(error_indices))
+            
+            return calculator_pb2.BatchResponse(
+                results=results.tolist(),
+                error_indices=error_indices.tolist(),
+                success=True,
+                error=error_msg
+            )
+        except Exception as e:
+            logger.error("❌ Erro na operação em lote %s: %s", operation, e)
+            return calculator_pb2.BatchResponse(
+                success=False,
+                error=str(e)
+            )
+
+
+class AsyncCalculatorService(CalculatorService):
+    """
+    Implementação asyncio (grpc.aio) do serviço Calculator
+    Mesma semântica do CalculatorService, inclusive INVALID_ARGUMENT
+    na divisão por zero, sem o limite de threads do executor.
+    Apenas as operações escalares e as consultas rodam no event loop; o
+    trabalho com NumPy (lotes, vetores, expressões, agregados, conjuntos de
+    dados e matrizes) vai para o executor padrão (asyncio.to_thread), para que
+    uma chamada grande não atrase as demais
+    """
+    
+    async def Add(self, request, context):
+        return super().Add(request, context)
+    
+    async def Sub(self, request, context):
+        return super().Sub(request, context)
+    
+    async def Mul(self, request, context):
+        return super().Mul(request, context)
+    
+    async def Div(self, request, context):
+        return super().Div(request, context)
+    
+    async def AddBatch(self, request, context):
+        return await asyncio.to_thread(super().AddBatch, request, context)
+    
+    async def SubBatch(self, request, context):
+        return await asyncio.to_thread(super().SubBatch, request, context)
+    
+    async def MulBatch(self, request, context):
+        return await asyncio.to_thread(super().MulBatch, request, context)
+    
+    async def DivBatch(self, request, context):
+        return await asyncio.to_thread(super().DivBatch, request, context)
+    
+    async def ComputeVector(self, request, context):
+        return await asyncio.to_thread(super().ComputeVector, request, context)
+    
+    async def Evaluate(self, request, context):
+        return await asyncio.to_thread(super().Evaluate, request, context)
+    
+    async def GetPlanCacheStats(self, request, context):
+        return super().GetPlanCacheStats(request, context)
+    
+    async def GetDataset(self, request, context):
+        return super().GetDataset(request, context)
+    
+    async def DeleteDataset(self, request, context):
+        return super().DeleteDataset(request, context)
+    
+    async def GetDatasetStoreStats(self, request, context):
+        return super().GetDatasetStoreStats(request, context)
+    
+    async def Stats(self, request, context):
+        return super().Stats(request, context)
+    
+    async def Profile(self, request, context):
+        return super().Profile(request, context)
+    
+    async def Aggregate(self, request_iterator, context):
+        """
+        Agregados de um stream de blocos de números (versão asyncio)
+        
+        Args:
+            request_iterator: Iterador assíncrono de AggregateChunk
+            context: Contexto gRPC asyncio
+        Returns:
+            AggregateResponse com os agregados
+        """
+        stats = RunningStats()
+        async for chunk in request_iterator:
+            error = await asyncio.to_thread(self._aggregate_chunk, stats, chunk)
+            if error:
+                return self._aggregate_error(*error, context)
+        return self._aggregate_response(stats)
+    
+    async def UploadDataset(self, request_iterator, context):
+        """
+        Recebe um conjunto de dados em blocos (versão asyncio)
+        """
+        builder = DatasetBuilder(self.datasets.max_dataset_bytes)
+        async for chunk in request_iterator:
+            error = await asyncio.to_thread(self._upload_chunk, builder, chunk)
+            if error:
+                return self._dataset_error('UPLOAD', *error, context)
+        return await asyncio.to_thread(self._store_upload, builder, context)
+    
+    async def DownloadDataset(self, request, context):
+        # Cada bloco é copiado (e lido do disco, se descarregado) fora do event loop
+        chunks = super().DownloadDataset(request, context)
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    
+    async def MatrixAdd(self, request_iterator, context):
+        async for block in self._run_matrix_stream_async('MATRIX ADD', MatrixAddStream(), request_iterator, context):
+            yield block
+    
+    async def MatrixMultiply(self, request_iterator, context):
+        async for block in self._run_matrix_stream_async('MATRIX MUL', MatrixMultiplyStream(self.max_matrix_bytes),
+                                                      request_iterator, context):
+            yield block
+    
+    async def MatrixTranspose(self, request_iterator, context):
+        async for block in self._run_matrix_stream_async('MATRIX T', MatrixTransposeStream(), request_iterator, context):
+            yield block
+    
+    async def _run_matrix_stream_async(self, name, stream, request_iterator, context):
+        """
+        Versão asyncio de _run_matrix_stream
+        """
+        blocks = 0
+        async for request in request_iterator:
+            try:
+                results = await asyncio.to_thread(stream.feed, request)
+            except MatrixError as e:
+                self._matrix_error(name, e, context)
+                return
+            blocks += 1
+            for result in results:
+                yield result
+        if operation_sampler.should_log():
+            logger.info("🔢 %s: %d bloco(s)", name, blocks)
+    
+    async def Compute(self, request_iterator, context):
+        """
+        Stream bidirecional de operações identificadas por tag (versão asyncio)
+        
+        Args:
+            request_iterator: Iterador assíncrono de ComputeRequest
+            context: Contexto gRPC asyncio
+        Yields:
+            ComputeResponse com a tag e o resultado de cada operação
+        """
+        count = 0
+        errors = 0
+        async for request in request_iterator:
+            result, error_msg = evaluate_scalar(request.operation, request.num1, request.num2)
+            count += 1
+            if error_msg:
+                errors += 1
+            yield calculator_pb2.ComputeResponse(
+                tag=request.tag,
+                result=result,
+                success=not error_msg,
+                error=error_msg
+            )
+        if operation_sampler.should_log():
+            logger.info("🔁 COMPUTE: stream encerrado com %d operações, %d com erro", count, errors)
+
+
+# Opções de transporte do servidor
+# SO_REUSEPORT permite que vários processos escutem na mesma porta (ver launcher.py)
+SERVER_OPTIONS = [
+    ('grpc.so_reuseport', 1),
+]
+
+
+def server_options(max_message_length=None):
+    """
+    Opções do servidor, com o tamanho máximo de mensagem opcional
+    
+    Args:
+        max_message_length: Tamanho máximo das mensagens, em bytes
+                            (None: padrão do gRPC, 4 MB na recepção)
+    Returns:
+        Lista de tuplas (opção, valor)
+    """
+    options = list(SERVER_OPTIONS)
+    if max_message_length is not None:
+        options.append(('grpc.max_receive_message_length', max_message_length))
+        options.append(('grpc.max_send_message_length', max_message_length))
+    return options
 
 
-def serve():
+def listen_addresses(port='50051', listen=None):
     """
-    Inicializa e executa o servidor gRPC
+    Endereços em que o servidor escuta
+    
+    Args:
+        port: Porta TCP usada quando listen não é informado
+        listen: Lista de endereços, ex.: ['[::]:50051', 'unix:/tmp/calculator.sock']
+    Returns:
+        Lista de endereços (padrão: [::]:port)
+    """
+    return list(listen) if listen else [f'[::]:{port}']
+
+
+def create_server(port='50051', max_workers=10, interceptors=None,
+                  plan_cache_size=DEFAULT_PLAN_CACHE_SIZE, metrics=None,
+                  maximum_concurrent_rpcs=None, admission=None, max_message_length=None,
+                  listen=None, profiler=None, fair_scheduler=None, datasets=None,
+                  max_matrix_bytes=DEFAULT_MAX_RIGHT_BYTES):
+    """
+    Cria o servidor gRPC (modo thread pool) com o serviço registrado, sem iniciá-lo
+    O interceptor de métricas é o primeiro da cadeia (precedido apenas pelo de
+    profiling, se houver), seguido do escalonamento justo e do controle de
+    admissão (se houver)
+    
+    Args:
+        port: Porta do servidor
+        max_workers: Número de threads do executor
+        interceptors: Lista de interceptors (padrão: apenas o de log)
+        plan_cache_size: Capacidade do cache de expressões compiladas
+        metrics: MetricsRegistry a alimentar (padrão: um novo registro)
+        maximum_concurrent_rpcs: Máximo de chamadas no servidor (em execução ou
+                                 na fila do executor); acima disso o gRPC
+                                 responde RESOURCE_EXHAUSTED na chegada
+        admission: AdmissionController com os limites por método (opcional)
+        max_message_length: Tamanho máximo das mensagens, em bytes (opcional)
+        listen: Endereços de escuta, inclusive sockets unix: (padrão: [::]:port)
+        profiler: ProfilingController da RPC Profile e do cProfile dos handlers (opcional)
+        fair_scheduler: FairScheduler que executa os handlers com filas por cliente
+                        no lugar do executor (opcional)
+        datasets: DatasetStore dos conjuntos de dados (padrão: um novo armazenamento)
+        max_matrix_bytes: Tamanho máximo de B em cada MatrixMultiply, em bytes
+    Returns:
+        grpc.Server pronto para start()
     """
-    # Criação do servidor com interceptor de log
-    interceptors = [LoggingInterceptor()]
+    if interceptors is None:
+        interceptors = [LoggingInterceptor()]
+    if metrics is None:
+        metrics = MetricsRegistry()
+    if datasets is None:
+        datasets = DatasetStore()
+    metrics.add_collector(datasets.render_text)
+    chain = [MetricsInterceptor(metrics)]
+    if profiler is not None:
+        chain.insert(0, ProfilingInterceptor(profiler))
+    if fair_scheduler is not None:
+        chain.append(FairSchedulingInterceptor(fair_scheduler))
+        metrics.add_collector(fair_scheduler.render_text)
+    if admission is not None:
+        chain.append(AdmissionInterceptor(admission))
     server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10),
-        interceptors=interceptors
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        interceptors=chain + list(interceptors),
+        options=server_options(max_message_length),
+        maximum_concurrent_rpcs=maximum_concurrent_rpcs
     )
     
     # Registra o serviço
     calculator_pb2_grpc.add_CalculatorServicer_to_server(
-        CalculatorService(), server
+        CalculatorService(plan_cache_size, metrics, profiler, fair_scheduler, datasets, max_matrix_bytes), server
     )
     
-    # Define porta
-    port = '50051'
-    server.add_insecure_port(f'[::]:{port}')
+    # Define os endereços de escuta (TCP e/ou socket Unix)
+    for address in listen_addresses(port, listen):
+        server.add_insecure_port(address)
+    return server
+
+
+def create_aio_server(port='50051', interceptors=None,
+                      plan_cache_size=DEFAULT_PLAN_CACHE_SIZE, metrics=None,
+                      maximum_concurrent_rpcs=None, admission=None, max_message_length=None,
+                      listen=None, profiler=None, datasets=None, max_matrix_bytes=DEFAULT_MAX_RIGHT_BYTES):
+    """
+    Cria o servidor gRPC asyncio (grpc.aio) com o serviço registrado, sem iniciá-lo
+    O interceptor de métricas é sempre o primeiro da cadeia
+    
+    Args:
+        port: Porta do servidor
+        interceptors: Lista de interceptors asyncio (padrão: apenas o de log)
+        plan_cache_size: Capacidade do cache de expressões compiladas
+        metrics: MetricsRegistry a alimentar (padrão: um novo registro)
+        maximum_concurrent_rpcs: Máximo de chamadas simultâneas no servidor
+        admission: AdmissionController com os limites por método (opcional)
+        max_message_length: Tamanho máximo das mensagens, em bytes (opcional)
+        listen: Endereços de escuta, inclusive sockets unix: (padrão: [::]:port)
+        profiler: ProfilingController da RPC Profile (apenas o modo sampler)
+        datasets: DatasetStore dos conjuntos de dados (padrão: um novo armazenamento)
+        max_matrix_bytes: Tamanho máximo de B em cada MatrixMultiply, em bytes
+    Returns:
+        grpc.aio.Server pronto para start()
+    """
+    if interceptors is None:
+        interceptors = [AsyncLoggingInterceptor()]
+    if metrics is None:
+        metrics = MetricsRegistry()
+    if datasets is None:
+        datasets = DatasetStore()
+    metrics.add_collector(datasets.render_text)
+    chain = [AsyncMetricsInterceptor(metrics)]
+    if admission is not None:
+        chain.append(AsyncAdmissionInterceptor(admission))
+    server = grpc.aio.server(
+        interceptors=chain + list(interceptors),
+        options=server_options(max_message_length),
+        maximum_concurrent_rpcs=maximum_concurrent_rpcs
+    )
+    
+    # Registra o serviço
+    calculator_pb2_grpc.add_CalculatorServicer_to_server(
+        AsyncCalculatorService(plan_cache_size, metrics, profiler, datasets=datasets,
+                               max_matrix_bytes=max_matrix_bytes), server
+    )
+    for address in listen_addresses(port, listen):
+        server.add_insecure_port(address)
+    return server
+
+
+def serve(port='50051', max_workers=10, plan_cache_size=DEFAULT_PLAN_CACHE_SIZE,
+          metrics_port=None, maximum_concurrent_rpcs=None, admission=None,
+          max_message_length=None, listen=None, profile_dir=None, fair_scheduler=None,
+          datasets=None, max_matrix_bytes=DEFAULT_MAX_RIGHT_BYTES):
+    """
+    Inicializa e executa o servidor gRPC (modo thread pool)
+    
+    Args:
+        port: Porta do servidor
+        max_workers: Número de threads do executor
+        plan_cache_size: Capacidade do cache de expressões compiladas
+        metrics_port: Porta HTTP local para as métricas em texto (opcional)
+        maximum_concurrent_rpcs: Máximo de chamadas no servidor (opcional)
+        admission: AdmissionController com os limites por método (opcional)
+        max_message_length: Tamanho máximo das mensagens, em bytes (opcional)
+        listen: Endereços de escuta, inclusive sockets unix: (padrão: [::]:port)
+        profile_dir: Diretório dos arquivos de profiling; ativa a RPC Profile e os
+                     sinais SIGUSR1 (sampler) e SIGUSR2 (cProfile) (opcional)
+        fair_scheduler: FairScheduler com filas, pesos e limites de taxa por cliente (opcional)
+        datasets: DatasetStore dos conjuntos de dados (padrão: 256 MB em memória, sem disco)
+        max_matrix_bytes: Tamanho máximo de B em cada MatrixMultiply, em bytes
+    """
+    metrics = MetricsRegistry()
+    if datasets is None:
+        datasets = DatasetStore()
+    profiler = ProfilingController(profile_dir) if profile_dir else None
+    server = create_server(port, max_workers, plan_cache_size=plan_cache_size, metrics=metrics,
+                           maximum_concurrent_rpcs=maximum_concurrent_rpcs, admission=admission,
+                           max_message_length=max_message_length, listen=listen, profiler=profiler,
+                           fair_scheduler=fair_scheduler, datasets=datasets,
+                           max_matrix_bytes=max_matrix_bytes)
+    if fair_scheduler is not None:
+        logger.info(f"⚖️  Escalonamento justo por cliente ({fair_scheduler.workers} threads)")
+    if datasets.spill_dir is not None:
+        logger.info(f"🗄️  Conjuntos de dados descarregados em {datasets.spill_dir}")
+    if profiler is not None:
+        install_signal_handlers(profiler)
+        logger.info(f"🔬 Profiling sob demanda em {profile_dir} (SIGUSR1: sampler, SIGUSR2: cProfile)")
+    if metrics_port:
+        start_metrics_http_server(metrics, metrics_port)
+        logger.info(f"📈 Métricas em http://127.0.0.1:{metrics_port}/metrics")
     
     # Inicia servidor
     server.start()
-    logger.info(f"🚀 Servidor gRPC iniciado na porta {port}")
+    logger.info(f"🚀 Servidor gRPC iniciado em {', '.join(listen_addresses(port, listen))}")
     logger.info(f"📡 Aguardando requisições...")
     
     try:
@@ -193,7 +1287,250 @@ def serve():
     except KeyboardInterrupt:
         logger.info("\n🛑 Servidor encerrado pelo usuário")
         server.stop(0)
+    finally:
+        datasets.close()
+
+
+async def serve_aio(port='50051', plan_cache_size=DEFAULT_PLAN_CACHE_SIZE, metrics_port=None,
+                    maximum_concurrent_rpcs=None, admission=None, max_message_length=None,
+                    listen=None, profile_dir=None, datasets=None, max_matrix_bytes=DEFAULT_MAX_RIGHT_BYTES):
+    """
+    Inicializa e executa o servidor gRPC no modo asyncio (grpc.aio)
+    Um único event loop atende milhares de chamadas e streams concorrentes
+    
+    Args:
+        port: Porta do servidor
+        plan_cache_size: Capacidade do cache de expressões compiladas
+        metrics_port: Porta HTTP local para as métricas em texto (opcional)
+        maximum_concurrent_rpcs: Máximo de chamadas simultâneas no servidor (opcional)
+        admission: AdmissionController com os limites por método (opcional)
+        max_message_length: Tamanho máximo das mensagens, em bytes (opcional)
+        listen: Endereços de escuta, inclusive sockets unix: (padrão: [::]:port)
+        profile_dir: Diretório dos arquivos de profiling; ativa a RPC Profile e o
+                     sinal SIGUSR1 (sampler) (opcional)
+        datasets: DatasetStore dos conjuntos de dados (padrão: 256 MB em memória, sem disco)
+        max_matrix_bytes: Tamanho máximo de B em cada MatrixMultiply, em bytes
+    """
+    metrics = MetricsRegistry()
+    if datasets is None:
+        datasets = DatasetStore()
+    profiler = ProfilingController(profile_dir, allow_cprofile=False) if profile_dir else None
+    server = create_aio_server(port, plan_cache_size=plan_cache_size, metrics=metrics,
+                               maximum_concurrent_rpcs=maximum_concurrent_rpcs, admission=admission,
+                               max_message_length=max_message_length, listen=listen, profiler=profiler,
+                               datasets=datasets, max_matrix_bytes=max_matrix_bytes)
+    if datasets.spill_dir is not None:
+        logger.info(f"🗄️  Conjuntos de dados descarregados em {datasets.spill_dir}")
+    if profiler is not None:
+        install_signal_handlers(profiler, asyncio.get_running_loop())
+        logger.info(f"🔬 Profiling sob demanda em {profile_dir} (SIGUSR1: sampler)")
+    if metrics_port:
+        start_metrics_http_server(metrics, metrics_port)
+        logger.info(f"📈 Métricas em http://127.0.0.1:{metrics_port}/metrics")
+    
+    # Inicia servidor
+    await server.start()
+    logger.info(f"🚀 Servidor gRPC (asyncio) iniciado em {', '.join(listen_addresses(port, listen))}")
+    logger.info(f"📡 Aguardando requisições...")
+    
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(0)
+        datasets.close()
+
+
+def add_server_arguments(parser):
+    """
+    Opções do servidor compartilhadas com o launcher.py: escuta, log, limites,
+    mensagens, profiling, escalonamento justo e conjuntos de dados
+    
+    Args:
+        parser: argparse.ArgumentParser a completar
+    """
+    parser.add_argument('--listen', action='append', default=[], metavar='ENDERECO',
+                        help="Endereço de escuta (repetível), ex.: [::]:50051 ou unix:/tmp/calculator.sock; "
+                             "substitui --port")
+    parser.add_argument('--plan-cache-size', type=int, default=DEFAULT_PLAN_CACHE_SIZE,
+                        help=f"Capacidade do cache de expressões compiladas (padrão: {DEFAULT_PLAN_CACHE_SIZE})")
+    parser.add_argument('--log-mode', choices=LOG_MODES, default='sync',
+                        help="sync: escrita direta; async: fila com thread de escrita; silent: sem logs")
+    parser.add_argument('--log-sample', type=int, default=1,
+                        help="Registra 1 a cada N requisições (padrão: 1, todas)")
+    parser.add_argument('--max-concurrent-rpcs', type=int, default=None,
+                        help="Máximo de chamadas no servidor; o excedente recebe RESOURCE_EXHAUSTED")
+    parser.add_argument('--method-limit', action='append', default=[], metavar='METODO=N',
+                        help="Limite de chamadas simultâneas de um método (repetível), ex.: Evaluate=4")
+    parser.add_argument('--default-method-limit', type=int, default=None,
+                        help="Limite de chamadas simultâneas dos métodos sem --method-limit")
+    parser.add_argument('--adaptive-limit', action='store_true',
+                        help="Ajusta os limites por método conforme a latência observada")
+    parser.add_argument('--max-queue-ms', type=float, default=None,
+                        help="Rejeita chamadas que esperaram mais que N ms antes de executar")
+    parser.add_argument('--max-message-mb', type=int, default=None,
+                        help="Tamanho máximo das mensagens em MB (padrão do gRPC: 4), ex.: para ComputeVector")
+    parser.add_argument('--profile-dir', default=None, metavar='DIRETORIO',
+                        help="Ativa o profiling sob demanda (RPC Profile, SIGUSR1/SIGUSR2) gravando neste diretório")
+    parser.add_argument('--fair-scheduling', action='store_true',
+                        help="Modo thread: filas por cliente (x-client-id ou endereço do peer) atendidas por weighted fair queueing")
+    parser.add_argument('--client-weight', action='append', default=[], metavar='CLIENTE=PESO',
+                        help="Peso de um cliente no escalonamento justo (repetível, padrão: 1)")
+    parser.add_argument('--client-rate-limit', type=float, default=None,
+                        help="Limite de chamadas/s de cada cliente (token bucket)")
+    parser.add_argument('--client-rate', action='append', default=[], metavar='CLIENTE=N',
+                        help="Limite de chamadas/s de um cliente específico (repetível)")
+    parser.add_argument('--client-burst', type=float, default=None,
+                        help="Rajada do limite de taxa por cliente (padrão: 1 segundo de chamadas)")
+    parser.add_argument('--client-max-queue', type=int, default=None,
+                        help="Máximo de chamadas aguardando na fila de cada cliente")
+    parser.add_argument('--dataset-memory-mb', type=int, default=DEFAULT_DATASET_MEMORY // (1024 * 1024),
+                        help=f"Memória dos conjuntos de dados (UploadDataset), em MB "
+                             f"(padrão: {DEFAULT_DATASET_MEMORY // (1024 * 1024)})")
+    parser.add_argument('--dataset-spill-dir', default=None, metavar='DIRETORIO',
+                        help="Descarrega os conjuntos menos usados em arquivos mapeados em memória neste diretório")
+    parser.add_argument('--dataset-spill-mb', type=int, default=None,
+                        help="Espaço em disco dos conjuntos descarregados, em MB (padrão: 4 x --dataset-memory-mb)")
+    parser.add_argument('--max-datasets', type=int, default=DEFAULT_MAX_DATASETS,
+                        help=f"Máximo de conjuntos de dados guardados (padrão: {DEFAULT_MAX_DATASETS})")
+    parser.add_argument('--matrix-memory-mb', type=int, default=DEFAULT_MAX_RIGHT_BYTES // (1024 * 1024),
+                        help=f"Tamanho máximo de B em cada MatrixMultiply, em MB "
+                             f"(padrão: {DEFAULT_MAX_RIGHT_BYTES // (1024 * 1024)})")
+
+
+def check_server_args(parser, args):
+    """
+    Valida as opções de add_server_arguments (as opções por cliente ativam
+    --fair-scheduling); erros encerram o programa via parser.error
+    """
+    fair_options = (args.client_weight or args.client_rate or args.client_rate_limit is not None
+                    or args.client_max_queue is not None)
+    if fair_options:
+        args.fair_scheduling = True
+    if args.fair_scheduling and args.mode == 'aio':
+        parser.error("o escalonamento justo por cliente está disponível apenas no modo thread")
+
+
+def parse_args(argv=None):
+    """
+    Lê as opções de linha de comando do servidor
+    
+    Args:
+        argv: Lista de argumentos (padrão: sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Servidor da Calculadora Distribuída gRPC")
+    parser.add_argument('--port', default='50051', help="Porta do servidor (padrão: 50051)")
+    parser.add_argument('--mode', choices=['thread', 'aio'], default='thread',
+                        help="thread: executor com pool de threads; aio: grpc.aio (asyncio)")
+    parser.add_argument('--workers', type=int, default=10,
+                        help="Número de threads do executor no modo thread (padrão: 10)")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Porta HTTP local com as métricas em texto (Prometheus)")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+    check_server_args(parser, args)
+    return args
+
+
+def build_admission(args):
+    """
+    Monta o AdmissionController a partir das opções de linha de comando
+    
+    Returns:
+        AdmissionController, ou None se nenhum limite foi configurado
+    """
+    method_limits = parse_method_limits(args.method_limit)
+    if not method_limits and args.default_method_limit is None and args.max_queue_ms is None:
+        return None
+    max_queue_time = args.max_queue_ms / 1000 if args.max_queue_ms is not None else None
+    return AdmissionController(method_limits, args.default_method_limit,
+                               args.adaptive_limit, max_queue_time)
+
+
+def build_fair_scheduler(args, workers=None):
+    """
+    Monta o FairScheduler a partir das opções de linha de comando
+    
+    Args:
+        args: Opções de linha de comando
+        workers: Threads do escalonador (padrão: --workers)
+    Returns:
+        FairScheduler, ou None se o escalonamento justo não foi ativado
+    """
+    if not args.fair_scheduling:
+        return None
+    return FairScheduler(workers or args.workers,
+                         weights=parse_client_values(args.client_weight, '--client-weight'),
+                         rate_limit=args.client_rate_limit,
+                         client_rate_limits=parse_client_values(args.client_rate, '--client-rate'),
+                         burst=args.client_burst, max_queue=args.client_max_queue)
+
+
+def build_datasets(args):
+    """
+    Monta o DatasetStore a partir das opções de linha de comando
+    """
+    max_spill_bytes = args.dataset_spill_mb * 1024 * 1024 if args.dataset_spill_mb is not None else None
+    return DatasetStore(args.dataset_memory_mb * 1024 * 1024, args.dataset_spill_dir,
+                        max_spill_bytes, args.max_datasets)
+
+
+def build_max_message_length(args):
+    """
+    Tamanho máximo das mensagens, em bytes, ou None para o padrão do gRPC
+    """
+    return args.max_message_mb * 1024 * 1024 if args.max_message_mb else None
+
+
+def build_server(args, mode, port, threads, metrics, interceptors=None, listen=None):
+    """
+    Monta o servidor a partir das opções de add_server_arguments, sem iniciá-lo
+    Usado pelos workers do launcher.py, que recebem as mesmas opções do server.py
+    
+    Args:
+        args: Opções de linha de comando
+        mode: 'thread' ou 'aio'
+        port: Porta do servidor
+        threads: Threads do executor (e do escalonamento justo) no modo thread
+        metrics: MetricsRegistry a alimentar
+        interceptors: Lista de interceptors (padrão: apenas o de log)
+        listen: Endereços de escuta (padrão: --listen)
+    Returns:
+        Tupla (servidor, DatasetStore, ProfilingController ou None)
+    """
+    datasets = build_datasets(args)
+    if listen is None:
+        listen = args.listen
+    if mode == 'aio':
+        profiler = ProfilingController(args.profile_dir, allow_cprofile=False) if args.profile_dir else None
+        server = create_aio_server(port, interceptors, args.plan_cache_size, metrics,
+                                   args.max_concurrent_rpcs, build_admission(args),
+                                   build_max_message_length(args), listen, profiler, datasets,
+                                   args.matrix_memory_mb * 1024 * 1024)
+    else:
+        profiler = ProfilingController(args.profile_dir) if args.profile_dir else None
+        server = create_server(port, threads, interceptors, args.plan_cache_size, metrics,
+                               args.max_concurrent_rpcs, build_admission(args),
+                               build_max_message_length(args), listen, profiler,
+                               build_fair_scheduler(args, threads), datasets,
+                               args.matrix_memory_mb * 1024 * 1024)
+    return server, datasets, profiler
 
 
 if __name__ == '__main__':
-    serve()
\ No newline at end of file
+    args = parse_args()
+    configure_logging(args.log_mode, args.log_sample)
+    admission = build_admission(args)
+    max_message_length = build_max_message_length(args)
+    if args.mode == 'aio':
+        try:
+            asyncio.run(serve_aio(args.port, args.plan_cache_size, args.metrics_port,
+                                  args.max_concurrent_rpcs, admission, max_message_length,
+                                  args.listen, args.profile_dir, build_datasets(args),
+                                  args.matrix_memory_mb * 1024 * 1024))
+        except KeyboardInterrupt:
+            logger.info("\n🛑 Servidor encerrado pelo usuário")
+    else:
+        serve(args.port, args.workers, args.plan_cache_size, args.metrics_port,
+              args.max_concurrent_rpcs, admission, max_message_length, args.listen,
+              args.profile_dir, build_fair_scheduler(args), build_datasets(args),
+              args.matrix_memory_mb * 1024 * 1024)
\ No newline at end of file
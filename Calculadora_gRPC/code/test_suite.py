@@ -1,18 +1,106 @@
 import grpc
+import argparse
+import multiprocessing
+import operator
+import random
+import sys
+import threading
 import calculator_pb2
 import calculator_pb2_grpc
 import time
+from concurrent import futures
 from datetime import datetime
 
+import numpy as np
+
+from client import CalculatorClient
+from metrics import PERCENTILES, LatencyHistogram
+from resilience import HedgingPolicy, RetryBudget
+from scatter import ScatterGather, ScatterGatherError, expected_results
+
+
+# Prazo de cada chamada dos testes, em segundos
+DEFAULT_TEST_TIMEOUT = 5.0
+
+# Bateria de testes unários: (nome, método, num1, num2, resultado esperado[, deve falhar])
+UNARY_CASES = [
+    # Testes básicos
+    ("Adição básica (10 + 5)", 'Add', 10, 5, 15),
+    ("Subtração básica (10 - 5)", 'Sub', 10, 5, 5),
+    ("Multiplicação básica (10 * 5)", 'Mul', 10, 5, 50),
+    ("Divisão básica (10 / 5)", 'Div', 10, 5, 2.0),
+
+    # Testes com negativos
+    ("Adição com negativos (-10 + 5)", 'Add', -10, 5, -5),
+    ("Subtração com negativos (-10 - -5)", 'Sub', -10, -5, -5),
+    ("Multiplicação com negativos (-10 * 5)", 'Mul', -10, 5, -50),
+    ("Divisão com negativos (-10 / 5)", 'Div', -10, 5, -2.0),
+
+    # Testes com zero
+    ("Multiplicação por zero (10 * 0)", 'Mul', 10, 0, 0),
+    ("Adição com zero (10 + 0)", 'Add', 10, 0, 10),
+
+    # Teste de divisão por zero (deve falhar)
+    ("Divisão por zero - DEVE FALHAR (10 / 0)", 'Div', 10, 0, None, True),
+
+    # Testes com decimais
+    ("Divisão com decimais (7 / 3)", 'Div', 7, 3, 7/3),
+    ("Divisão exata (15 / 3)", 'Div', 15, 3, 5.0),
+
+    # Testes com números grandes
+    ("Números grandes (999999 * 999999)", 'Mul', 999999, 999999, 999998000001),
+    ("Números grandes na divisão (1000000 / 1000)", 'Div', 1000000, 1000, 1000.0),
+
+    # Testes edge cases
+    ("Subtração resultando em zero (5 - 5)", 'Sub', 5, 5, 0),
+    ("Multiplicação de decimais (2.5 * 4.5)", 'Mul', 2.5, 4.5, 11.25),
+    ("Divisão com resultado decimal (1 / 3)", 'Div', 1, 3, 1/3),
+]
+
+# Resultado de referência de cada método unário (mesma aritmética double do servidor)
+UNARY_OPERATIONS = {
+    'Add': operator.add,
+    'Sub': operator.sub,
+    'Mul': operator.mul,
+    'Div': operator.truediv,
+}
+
+# Modo stress: fração das operações sorteadas de UNARY_CASES (o resto são pares aleatórios)
+STRESS_CASE_RATIO = 0.2
+
+# Modo stress: fração dos pares aleatórios com num2 = 0 (divisão deve falhar)
+STRESS_ZERO_RATIO = 0.05
+
+# Modo stress: chamadas pendentes por thread com taxa alvo
+STRESS_MAX_OUTSTANDING = 1000
+
+# Modo stress: divergências guardadas como exemplo por processo
+STRESS_MAX_EXAMPLES = 10
+
+
+class StalledServicer(calculator_pb2_grpc.CalculatorServicer):
+    """
+    Servidor travado: Add nunca responde, apenas espera o prazo ou o
+    cancelamento da chamada
+    """
+    
+    def Add(self, request, context):
+        finished = threading.Event()
+        context.add_callback(finished.set)
+        finished.wait()
+        return calculator_pb2.OperationResponse()
+
 
 class TestRunner:
     """
     Executor de testes automatizados
     """
     
-    def __init__(self, host='localhost', port='50051'):
-        """Inicializa conexão com servidor"""
-        self.channel = grpc.insecure_channel(f'{host}:{port}')
+    def __init__(self, host='localhost', port='50051', timeout=DEFAULT_TEST_TIMEOUT):
+        """Inicializa conexão com servidor (timeout: prazo de cada chamada, em segundos)"""
+        self.timeout = timeout
+        self.target = f'{host}:{port}'
+        self.channel = grpc.insecure_channel(self.target)
         self.stub = calculator_pb2_grpc.CalculatorStub(self.channel)
         self.results = []
     
@@ -36,7 +124,7 @@ class TestRunner:
         try:
             request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
             start_time = time.time()
-            response = operation(request)
+            response = operation(request, timeout=self.timeout)
             elapsed_time = time.time() - start_time
             
             success = response.success
@@ -83,6 +171,612 @@ class TestRunner:
                 'result': f"RPC Error: {e.details()}"
             })
     
+    def run_batch_test(self, name, operation, nums1, nums2, expected_results, expected_errors=()):
+        """
+        Executa um teste de operação em lote
+        
+        Args:
+            name: Nome do teste
+            operation: Função de operação em lote (AddBatch, SubBatch, MulBatch, DivBatch)
+            nums1: Lista com os primeiros operandos
+            nums2: Lista com os segundos operandos
+            expected_results: Resultados esperados, elemento a elemento
+            expected_errors: Índices que devem retornar erro (divisão por zero)
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: num1={nums1}, num2={nums2}")
+        
+        try:
+            request = calculator_pb2.BatchRequest(num1=nums1, num2=nums2)
+            start_time = time.time()
+            response = operation(request, timeout=self.timeout)
+            elapsed_time = time.time() - start_time
+            
+            results = list(response.results)
+            error_indices = list(response.error_indices)
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Resultados: {results}")
+            print(f"Índices com erro: {error_indices}")
+            
+            test_passed = (
+                response.success
+                and error_indices == list(expected_errors)
+                and len(results) == len(expected_results)
+                and all(abs(r - e) < 0.0001 for r, e in zip(results, expected_results))
+            )
+            print(f"Resultado esperado: {expected_results}")
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': results
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_vector_test(self, name, operation, nums1, nums2, expected_results, expected_errors=()):
+        """
+        Executa um teste de ComputeVector (operandos em bytes float64 little-endian)
+        
+        Args:
+            name: Nome do teste
+            operation: Operação do enum (calculator_pb2.ADD, ...)
+            nums1: Lista com os primeiros operandos
+            nums2: Lista com os segundos operandos
+            expected_results: Resultados esperados, elemento a elemento
+            expected_errors: Índices que devem retornar erro (divisão por zero)
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: num1={nums1}, num2={nums2}")
+        
+        try:
+            request = calculator_pb2.VectorRequest(
+                operation=operation,
+                num1=np.asarray(nums1, dtype='<f8').tobytes(),
+                num2=np.asarray(nums2, dtype='<f8').tobytes()
+            )
+            start_time = time.time()
+            response = self.stub.ComputeVector(request, timeout=self.timeout)
+            elapsed_time = time.time() - start_time
+            
+            results = np.frombuffer(response.results, dtype='<f8').tolist()
+            error_indices = np.frombuffer(response.error_indices, dtype='<u4').tolist()
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Resultados: {results}")
+            print(f"Índices com erro: {error_indices}")
+            
+            test_passed = (
+                response.success
+                and response.count == len(expected_results)
+                and error_indices == list(expected_errors)
+                and len(results) == len(expected_results)
+                and all(abs(r - e) < 0.0001 for r, e in zip(results, expected_results))
+            )
+            print(f"Resultado esperado: {expected_results}")
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': results
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_deadline_test(self, name, operation, num1, num2, timeout):
+        """
+        Executa uma chamada com prazo curto demais; o teste passa se ela
+        terminar com DEADLINE_EXCEEDED
+        
+        Args:
+            name: Nome do teste
+            operation: Função de operação (Add, Sub, Mul, Div)
+            num1: Primeiro número
+            num2: Segundo número
+            timeout: Prazo da chamada, em segundos
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: num1={num1}, num2={num2}, prazo={timeout}s")
+        
+        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+        start_time = time.time()
+        try:
+            response = operation(request, timeout=timeout)
+            code = grpc.StatusCode.OK
+            result = response.result
+        except grpc.RpcError as e:
+            code = e.code()
+            result = f"RPC Error: {e.details()}"
+        elapsed_time = time.time() - start_time
+        
+        test_passed = code == grpc.StatusCode.DEADLINE_EXCEEDED
+        print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+        print(f"Status: {code.name}")
+        print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+        
+        self.results.append({
+            'name': name,
+            'passed': test_passed,
+            'time': elapsed_time,
+            'result': result
+        })
+    
+    def run_vector_status_test(self, name, operation, nums1, nums2, expected_code):
+        """
+        Executa um ComputeVector inválido; o teste passa se a chamada terminar
+        com o código de status esperado
+        
+        Args:
+            name: Nome do teste
+            operation: Valor do enum Operation (inclusive valores desconhecidos)
+            nums1: Lista com os primeiros operandos
+            nums2: Lista com os segundos operandos
+            expected_code: grpc.StatusCode esperado
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: operation={operation}, num1={nums1}, num2={nums2}")
+        
+        request = calculator_pb2.VectorRequest(
+            operation=operation,
+            num1=np.asarray(nums1, dtype='<f8').tobytes(),
+            num2=np.asarray(nums2, dtype='<f8').tobytes()
+        )
+        start_time = time.time()
+        try:
+            self.stub.ComputeVector(request, timeout=self.timeout)
+            code = grpc.StatusCode.OK
+            result = "Sem erro"
+        except grpc.RpcError as e:
+            code = e.code()
+            result = f"RPC Error: {e.details()}"
+        elapsed_time = time.time() - start_time
+        
+        test_passed = code == expected_code
+        print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+        print(f"Status: {code.name} (esperado: {expected_code.name})")
+        print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+        
+        self.results.append({
+            'name': name,
+            'passed': test_passed,
+            'time': elapsed_time,
+            'result': result
+        })
+    
+    def run_hedging_ejection_test(self, name, calls=30, timeout=0.3, hedge_delay=0.02):
+        """
+        Balanceia chamadas Add entre o servidor testado e um servidor travado,
+        com hedging cujo orçamento cobre só parte das chamadas; o teste passa
+        se o servidor travado for ejetado. As cópias que perdem são canceladas
+        e não podem zerar a sequência de falhas do servidor travado
+        
+        Args:
+            name: Nome do teste
+            calls: Máximo de chamadas até a ejeção
+            timeout: Prazo de cada chamada, em segundos
+            hedge_delay: Atraso fixo de cópia, em segundos
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        
+        stalled = grpc.server(futures.ThreadPoolExecutor(max_workers=calls))
+        calculator_pb2_grpc.add_CalculatorServicer_to_server(StalledServicer(), stalled)
+        stalled_target = f"localhost:{stalled.add_insecure_port('localhost:0')}"
+        stalled.start()
+        # Orçamento de 1 cópia a cada 4 chamadas (sem reposição por tempo)
+        hedging = HedgingPolicy(delay=hedge_delay, budget=RetryBudget(ratio=0.25, min_per_second=0, max_tokens=1))
+        client = CalculatorClient(targets=[stalled_target, self.target], default_timeout=timeout,
+                                  hedging_policy=hedging)
+        print(f"Entrada: {calls} chamadas, prazo={timeout}s, servidor travado em {stalled_target}")
+        
+        start_time = time.time()
+        sent = 0
+        ejected = False
+        try:
+            while sent < calls and not ejected:
+                client.add(1, 2)
+                sent += 1
+                ejected = any(backend['ejected'] > 0 for backend in client.backend_stats()
+                              if backend['target'] == stalled_target)
+        finally:
+            client.close()
+            stalled.stop(None)
+        elapsed_time = time.time() - start_time
+        
+        print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+        print(f"Chamadas até a ejeção: {sent}, cópias enviadas: {hedging.hedges}")
+        print(f"\n{'✅ PASS' if ejected else '❌ FAIL'}")
+        
+        self.results.append({
+            'name': name,
+            'passed': ejected,
+            'time': elapsed_time,
+            'result': f"Ejetado após {sent} chamadas" if ejected else "Servidor travado não foi ejetado"
+        })
+    
+    def run_scatter_test(self, name, operation, nums1, nums2, shard_size):
+        """
+        Executa um teste do coordenador scatter-gather (vários shards ComputeVector)
+        O resultado é comparado com o cálculo local feito com NumPy
+        
+        Args:
+            name: Nome do teste
+            operation: 'add', 'sub', 'mul' ou 'div'
+            nums1: Array com os primeiros operandos
+            nums2: Array com os segundos operandos
+            shard_size: Elementos por shard
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: {len(nums1)} elementos em shards de {shard_size}")
+        
+        client = CalculatorClient(target=self.target, default_timeout=self.timeout)
+        try:
+            coordinator = ScatterGather(client, shard_size=shard_size)
+            start_time = time.time()
+            results, errors = coordinator.compute(operation, nums1, nums2)
+            elapsed_time = time.time() - start_time
+            
+            expected, expected_errors = expected_results(operation, np.asarray(nums1, dtype='<f8'),
+                                                         np.asarray(nums2, dtype='<f8'))
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Shards: {coordinator.stats['shards']}, tentativas: {coordinator.stats['attempts']}")
+            print(f"Índices com erro: {len(errors)} (esperado: {len(expected_errors)})")
+            
+            test_passed = bool(np.allclose(results, expected) and np.array_equal(errors, expected_errors))
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': f"{len(results)} resultados"
+            })
+            
+        except ScatterGatherError as e:
+            print(f"❌ Erro no scatter-gather: {e}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"Scatter-gather Error: {e}"
+            })
+        finally:
+            client.close()
+    
+    def run_stream_test(self, name, operations):
+        """
+        Executa um teste do stream bidirecional Compute
+        
+        Args:
+            name: Nome do teste
+            operations: Lista de tuplas (operação, num1, num2, resultado esperado),
+                        com resultado esperado None quando a operação deve falhar
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Operações enviadas: {len(operations)}")
+        
+        try:
+            requests = [
+                calculator_pb2.ComputeRequest(tag=tag, operation=operation, num1=num1, num2=num2)
+                for tag, (operation, num1, num2, _) in enumerate(operations)
+            ]
+            start_time = time.time()
+            responses = {response.tag: response for response in self.stub.Compute(iter(requests), timeout=self.timeout)}
+            elapsed_time = time.time() - start_time
+            
+            test_passed = len(responses) == len(operations)
+            for tag, (_, _, _, expected) in enumerate(operations):
+                response = responses.get(tag)
+                if response is None:
+                    test_passed = False
+                elif expected is None:
+                    test_passed = test_passed and not response.success
+                else:
+                    test_passed = test_passed and response.success and abs(response.result - expected) < 0.0001
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Respostas recebidas: {len(responses)}")
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': [responses[tag].result for tag in sorted(responses)]
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_evaluate_test(self, name, expression, variables, expected_result=None, should_fail=False):
+        """
+        Executa um teste de avaliação de expressão
+        
+        Args:
+            name: Nome do teste
+            expression: Expressão aritmética
+            variables: Dicionário com os valores das variáveis
+            expected_result: Resultado esperado (opcional)
+            should_fail: Se o teste deve falhar (expressão inválida ou divisão por zero)
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: {expression} com {variables}")
+        
+        try:
+            request = calculator_pb2.EvaluateRequest(expression=expression, variables=variables)
+            start_time = time.time()
+            response = self.stub.Evaluate(request, timeout=self.timeout)
+            elapsed_time = time.time() - start_time
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Resultado: {response.result} (cache {'hit' if response.cache_hit else 'miss'})")
+            
+            if should_fail:
+                test_passed = not response.success
+            else:
+                test_passed = response.success and abs(response.result - expected_result) < 0.0001
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': response.result if response.success else response.error
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': should_fail and e.code() == grpc.StatusCode.INVALID_ARGUMENT,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_aggregate_test(self, name, chunks, expected):
+        """
+        Executa um teste do stream de agregados (Aggregate)
+        
+        Args:
+            name: Nome do teste
+            chunks: Lista de blocos (listas de números) enviados pelo stream
+            expected: Dicionário com os agregados esperados (count, mean, ...)
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: {len(chunks)} bloco(s), {sum(len(chunk) for chunk in chunks)} valores")
+        
+        try:
+            requests = (calculator_pb2.AggregateChunk(values=chunk) for chunk in chunks)
+            start_time = time.time()
+            response = self.stub.Aggregate(requests, timeout=self.timeout)
+            elapsed_time = time.time() - start_time
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Agregados: count={response.count}, sum={response.sum}, mean={response.mean}, "
+                  f"min={response.min}, max={response.max}, variance={response.variance}")
+            
+            test_passed = response.success and all(
+                abs(getattr(response, field) - value) < 0.0001 for field, value in expected.items()
+            )
+            print(f"Resultado esperado: {expected}")
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': response.mean
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_dataset_test(self, name, chunks, nums2, expected_sum):
+        """
+        Executa um teste dos conjuntos de dados guardados no servidor: envia
+        o conjunto em blocos (UploadDataset), multiplica-o por nums2 guardando
+        o resultado (ComputeVector com handle e keep_result), agrega o resultado
+        pelo handle (Aggregate) e confere que o handle removido deixa de existir
+        
+        Args:
+            name: Nome do teste
+            chunks: Lista de blocos (listas de números) do conjunto
+            nums2: Segundos operandos da multiplicação (enviados em bytes)
+            expected_sum: Soma esperada dos produtos
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: {len(chunks)} bloco(s), num2={nums2}")
+        
+        try:
+            start_time = time.time()
+            info = self.stub.UploadDataset(
+                (calculator_pb2.DatasetChunk(raw=np.asarray(chunk, dtype='<f8').tobytes()) for chunk in chunks),
+                timeout=self.timeout
+            )
+            vector = self.stub.ComputeVector(calculator_pb2.VectorRequest(
+                operation=calculator_pb2.MUL,
+                num1_handle=info.handle,
+                num2=np.asarray(nums2, dtype='<f8').tobytes(),
+                keep_result=True
+            ), timeout=self.timeout)
+            aggregate = self.stub.Aggregate(iter([calculator_pb2.AggregateChunk(handle=vector.result_handle)]),
+                                            timeout=self.timeout)
+            for handle in (info.handle, vector.result_handle):
+                self.stub.DeleteDataset(calculator_pb2.DatasetRequest(handle=handle), timeout=self.timeout)
+            elapsed_time = time.time() - start_time
+            
+            try:
+                self.stub.GetDataset(calculator_pb2.DatasetRequest(handle=info.handle), timeout=self.timeout)
+                deleted_code = grpc.StatusCode.OK
+            except grpc.RpcError as e:
+                deleted_code = e.code()
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Handle: {info.handle} ({info.count} valores), resultado: {vector.result_handle}")
+            print(f"Soma do resultado: {aggregate.sum}, handle removido: {deleted_code.name}")
+            
+            test_passed = (
+                info.count == len(nums2)
+                and vector.success and vector.result_handle and not vector.results
+                and aggregate.count == len(nums2)
+                and abs(aggregate.sum - expected_sum) < 0.0001
+                and deleted_code == grpc.StatusCode.NOT_FOUND
+            )
+            print(f"Resultado esperado: {expected_sum}")
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': aggregate.sum
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_matrix_test(self, name, method, requests, expected):
+        """
+        Executa um teste de operação com matrizes em streaming
+        
+        Args:
+            name: Nome do teste
+            method: Método do stub (MatrixAdd, MatrixMultiply ou MatrixTranspose)
+            requests: Lista de mensagens do stream
+            expected: Matriz esperada (lista de listas)
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: {len(requests)} bloco(s)")
+        
+        try:
+            expected = np.asarray(expected, dtype='<f8')
+            result = np.full(expected.shape, np.nan)
+            start_time = time.time()
+            for block in method(iter(requests), timeout=self.timeout):
+                data = np.frombuffer(block.data, dtype='<f8').reshape(block.rows, block.cols)
+                result[block.row:block.row + block.rows, block.col:block.col + block.cols] = data
+            elapsed_time = time.time() - start_time
+            
+            print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+            print(f"Resultado: {result.tolist()}")
+            
+            test_passed = np.allclose(result, expected)
+            print(f"Resultado esperado: {expected.tolist()}")
+            print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+            
+            self.results.append({
+                'name': name,
+                'passed': test_passed,
+                'time': elapsed_time,
+                'result': result.tolist()
+            })
+            
+        except grpc.RpcError as e:
+            print(f"❌ Erro RPC: {e.code()} - {e.details()}")
+            self.results.append({
+                'name': name,
+                'passed': False,
+                'time': 0,
+                'result': f"RPC Error: {e.details()}"
+            })
+    
+    def run_matrix_status_test(self, name, method, requests, expected_code):
+        """
+        Executa um stream de matrizes inválido; o teste passa se a chamada
+        terminar com o código de status esperado
+        
+        Args:
+            name: Nome do teste
+            method: Método do stub (MatrixAdd, MatrixMultiply ou MatrixTranspose)
+            requests: Lista de mensagens do stream
+            expected_code: grpc.StatusCode esperado
+        """
+        print(f"\n{'='*60}")
+        print(f"📋 Teste: {name}")
+        print(f"{'='*60}")
+        print(f"Entrada: {len(requests)} bloco(s)")
+        
+        start_time = time.time()
+        try:
+            for _ in method(iter(requests), timeout=self.timeout):
+                pass
+            code = grpc.StatusCode.OK
+            result = "Sem erro"
+        except grpc.RpcError as e:
+            code = e.code()
+            result = f"RPC Error: {e.details()}"
+        elapsed_time = time.time() - start_time
+        
+        test_passed = code == expected_code
+        print(f"Tempo de resposta: {elapsed_time*1000:.2f}ms")
+        print(f"Status: {code.name} (esperado: {expected_code.name})")
+        print(f"\n{'✅ PASS' if test_passed else '❌ FAIL'}")
+        
+        self.results.append({
+            'name': name,
+            'passed': test_passed,
+            'time': elapsed_time,
+            'result': result
+        })
+    
     def print_summary(self):
         """
         Imprime resumo dos testes
@@ -117,10 +811,310 @@ class TestRunner:
         self.channel.close()
 
 
+def random_operand(rng):
+    """Operando aleatório: inteiro ou decimal, em várias ordens de grandeza"""
+    magnitude = 10.0 ** rng.randint(-3, 9)
+    if rng.random() < 0.5:
+        return float(rng.randint(-int(magnitude) - 1, int(magnitude) + 1))
+    return rng.uniform(-magnitude, magnitude)
+
+
+def stress_operation(rng):
+    """
+    Sorteia uma operação do modo stress com resposta conhecida
+
+    Returns:
+        Tupla (nome, método, num1, num2, resultado esperado); resultado
+        None indica divisão por zero (deve falhar com INVALID_ARGUMENT)
+    """
+    if rng.random() < STRESS_CASE_RATIO:
+        name, method, num1, num2, expected, *should_fail = rng.choice(UNARY_CASES)
+        return name, method, num1, num2, None if should_fail and should_fail[0] else expected
+    method = rng.choice(list(UNARY_OPERATIONS))
+    num1 = random_operand(rng)
+    num2 = 0.0 if rng.random() < STRESS_ZERO_RATIO else random_operand(rng)
+    if method == 'Div' and num2 == 0:
+        expected = None
+    else:
+        expected = UNARY_OPERATIONS[method](num1, num2)
+    return f"{method}({num1!r}, {num2!r})", method, num1, num2, expected
+
+
+class StressTally:
+    """
+    Confere as respostas do modo stress e acumula contagens e latências (thread-safe)
+    Uma resposta está correta se o resultado é exatamente o esperado, ou se
+    a divisão por zero falhou com INVALID_ARGUMENT; outros códigos de erro
+    (DEADLINE_EXCEEDED, UNAVAILABLE...) são contados à parte
+    """
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.correct = 0
+        self.mismatches = 0
+        self.codes = {}
+        self.examples = []
+        self._lock = threading.Lock()
+
+    def check(self, name, expected, start, response=None, error=None):
+        """
+        Confere uma resposta
+
+        Args:
+            name: Nome da operação (para os exemplos de divergência)
+            expected: Resultado esperado (None: deve falhar com INVALID_ARGUMENT)
+            start: Instante (perf_counter) em que a chamada foi iniciada ou agendada
+            response: OperationResponse recebida
+            error: grpc.RpcError recebido no lugar da resposta
+        """
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        if error is not None:
+            code = error.code()
+            if code == grpc.StatusCode.INVALID_ARGUMENT:
+                mismatch = None if expected is None else f"esperado {expected!r}, recebido INVALID_ARGUMENT"
+            else:
+                # Falha de transporte ou de prazo: não é uma resposta errada
+                mismatch = None
+        else:
+            code = grpc.StatusCode.OK
+            if expected is None:
+                mismatch = f"esperado INVALID_ARGUMENT, recebido OK ({response.result!r})"
+            elif not response.success or response.result != expected:
+                mismatch = f"esperado {expected!r}, recebido {response.result!r} (success={response.success})"
+            else:
+                mismatch = None
+        with self._lock:
+            self.requests += 1
+            self.histogram.record(elapsed_us)
+            self.codes[code.name] = self.codes.get(code.name, 0) + 1
+            if mismatch is not None:
+                self.mismatches += 1
+                if len(self.examples) < STRESS_MAX_EXAMPLES:
+                    self.examples.append(f"{name}: {mismatch}")
+            elif code in (grpc.StatusCode.OK, grpc.StatusCode.INVALID_ARGUMENT):
+                self.correct += 1
+
+    def to_dict(self):
+        """
+        Representação serializável (para consolidar entre processos)
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'correct': self.correct,
+                'mismatches': self.mismatches,
+                'codes': dict(self.codes),
+                'examples': list(self.examples),
+                'histogram': self.histogram.to_dict(),
+            }
+
+
+def stress_worker(stub, tally, deadline, seed, rate, timeout):
+    """
+    Thread do modo stress
+    Com rate None, uma chamada por vez (vazão máxima); com rate, as chamadas
+    são enviadas na taxa fixa sem esperar as respostas e a latência conta a
+    partir do instante agendado
+    """
+    rng = random.Random(seed)
+    if rate is None:
+        while time.perf_counter() < deadline:
+            name, method, num1, num2, expected = stress_operation(rng)
+            request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+            start = time.perf_counter()
+            try:
+                response = getattr(stub, method)(request, timeout=timeout)
+            except grpc.RpcError as e:
+                tally.check(name, expected, start, error=e)
+            else:
+                tally.check(name, expected, start, response=response)
+        return
+
+    outstanding = threading.Semaphore(STRESS_MAX_OUTSTANDING)
+
+    def on_done(future, name, expected, scheduled):
+        try:
+            tally.check(name, expected, scheduled, response=future.result())
+        except grpc.RpcError as e:
+            tally.check(name, expected, scheduled, error=e)
+        finally:
+            outstanding.release()
+
+    interval = 1.0 / rate
+    scheduled = time.perf_counter()
+    while scheduled < deadline:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        if not outstanding.acquire(timeout=max(0.0, deadline - time.perf_counter())):
+            break
+        name, method, num1, num2, expected = stress_operation(rng)
+        request = calculator_pb2.OperationRequest(num1=num1, num2=num2)
+        future = getattr(stub, method).future(request, timeout=timeout)
+        future.add_done_callback(
+            lambda f, name=name, expected=expected, scheduled=scheduled: on_done(f, name, expected, scheduled))
+        scheduled += interval
+
+    # Aguarda as chamadas pendentes
+    for _ in range(STRESS_MAX_OUTSTANDING):
+        outstanding.acquire()
+
+
+def stress_process(process_id, targets, threads, rate, duration, timeout, seed, results):
+    """
+    Processo do modo stress: `threads` threads, cada uma com seu canal,
+    distribuídas entre os targets; o resultado vai para a fila `results`
+    """
+    tally = StressTally()
+    channels = []
+    workers = []
+    result = {'error': f"processo {process_id}: encerrado sem resultado"}
+    try:
+        for thread_id in range(threads):
+            worker_id = process_id * threads + thread_id
+            # Sem o pool local, canais com os mesmos argumentos compartilham a conexão
+            channel = grpc.insecure_channel(targets[worker_id % len(targets)],
+                                            options=[('grpc.use_local_subchannel_pool', 1)])
+            grpc.channel_ready_future(channel).result(timeout=10)
+            channels.append(channel)
+            stub = calculator_pb2_grpc.CalculatorStub(channel)
+            workers.append((stub, seed + worker_id))
+
+        deadline = time.perf_counter() + duration
+        thread_list = [
+            threading.Thread(target=stress_worker, args=(stub, tally, deadline, worker_seed, rate, timeout),
+                             name=f"stress-{process_id}-{index}", daemon=True)
+            for index, (stub, worker_seed) in enumerate(workers)
+        ]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        result = tally.to_dict()
+    except grpc.FutureTimeoutError:
+        result = {'error': f"processo {process_id}: servidor indisponível"}
+    finally:
+        for channel in channels:
+            channel.close()
+        results.put(result)
+
+
+def run_stress(targets, processes, threads, qps, duration, timeout, seed):
+    """
+    Modo stress: repete a bateria de testes unários e pares aleatórios com
+    resposta conhecida a partir de vários processos e threads ao mesmo tempo,
+    conferindo cada resposta
+
+    Args:
+        targets: Lista de servidores (as threads são distribuídas entre eles)
+        processes: Número de processos
+        threads: Threads por processo (cada uma com seu canal)
+        qps: Taxa total alvo em chamadas/s (0: vazão máxima, uma chamada por thread)
+        duration: Duração, em segundos
+        timeout: Prazo de cada chamada, em segundos
+        seed: Semente dos operandos aleatórios
+    Returns:
+        True se não houve divergências nem erros inesperados
+    """
+    workers = processes * threads
+    rate = qps / workers if qps > 0 else None
+    print("="*60)
+    print("🔥 MODO STRESS")
+    print("="*60)
+    print(f"Servidores: {', '.join(targets)}")
+    print(f"{processes} processo(s) x {threads} thread(s), "
+          f"{'taxa alvo de ' + format(qps, ',.0f') + ' chamadas/s' if rate else 'vazão máxima'}, {duration}s")
+
+    # spawn evita herdar o estado do gRPC do processo pai via fork
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process_list = [
+        context.Process(target=stress_process,
+                        args=(process_id, targets, threads, rate, duration, timeout, seed, results),
+                        name=f"stress-{process_id}")
+        for process_id in range(processes)
+    ]
+    started = time.perf_counter()
+    for process in process_list:
+        process.start()
+    reports = [results.get() for _ in process_list]
+    for process in process_list:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    histogram = LatencyHistogram()
+    totals = {'requests': 0, 'correct': 0, 'mismatches': 0}
+    codes = {}
+    examples = []
+    failed_processes = [report['error'] for report in reports if 'error' in report]
+    for report in reports:
+        if 'error' in report:
+            continue
+        for key in totals:
+            totals[key] += report[key]
+        for code, count in report['codes'].items():
+            codes[code] = codes.get(code, 0) + count
+        examples.extend(report['examples'])
+        histogram.merge(report['histogram'])
+
+    unexpected = totals['requests'] - totals['correct'] - totals['mismatches']
+    print(f"\n{'='*60}")
+    print("📊 RESUMO DO STRESS")
+    print(f"{'='*60}")
+    for error in failed_processes:
+        print(f"❌ Erro: {error}")
+    target_rate = f", alvo {qps:,.0f}" if rate else ""
+    print(f"\n📨 Chamadas: {totals['requests']} em {duration}s "
+          f"({totals['requests'] / duration:,.0f} chamadas/s{target_rate}; tempo total {elapsed:.1f}s)")
+    print(f"✅ Corretas: {totals['correct']}")
+    print(f"❌ Divergências: {totals['mismatches']}")
+    print(f"⚠️  Erros inesperados: {unexpected}")
+    print("🔢 Códigos: " + ", ".join(f"{code}={count}" for code, count in sorted(codes.items())))
+    percentiles = " ".join(f"{name}={histogram.percentile(quantile) / 1000:.2f}"
+                           for name, quantile in PERCENTILES)
+    print(f"⏱️  Latência (ms): média={histogram.mean() / 1000:.2f} {percentiles} máx={histogram.max / 1000:.2f}")
+    if examples:
+        print("\nExemplos de divergências:")
+        for example in examples:
+            print(f"   - {example}")
+
+    passed = not failed_processes and totals['requests'] > 0 and totals['mismatches'] == 0 and unexpected == 0
+    print(f"\n{'✅ STRESS APROVADO' if passed else '❌ STRESS REPROVADO'}")
+    return passed
+
+
+def parse_args():
+    """
+    Lê as opções de linha de comando (sem opções: executa a suite de testes)
+    """
+    parser = argparse.ArgumentParser(description="Suite de testes da Calculadora Distribuída gRPC")
+    parser.add_argument('--stress', action='store_true',
+                        help="Modo stress: repete os testes unários e pares aleatórios em paralelo, conferindo cada resposta")
+    parser.add_argument('--target', action='append', dest='targets',
+                        help="Modo stress: servidor (host:porta ou unix:caminho); repita para vários "
+                             "(padrão: localhost:50051)")
+    parser.add_argument('--processes', type=int, default=2, help="Modo stress: número de processos (padrão: 2)")
+    parser.add_argument('--threads', type=int, default=8, help="Modo stress: threads por processo (padrão: 8)")
+    parser.add_argument('--qps', type=float, default=0,
+                        help="Modo stress: taxa total alvo em chamadas/s (padrão: 0, vazão máxima)")
+    parser.add_argument('--duration', type=float, default=10.0, help="Modo stress: duração, em segundos (padrão: 10)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TEST_TIMEOUT,
+                        help=f"Modo stress: prazo de cada chamada, em segundos (padrão: {DEFAULT_TEST_TIMEOUT})")
+    parser.add_argument('--seed', type=int, default=42, help="Modo stress: semente dos operandos aleatórios")
+    return parser.parse_args()
+
+
 def main():
     """
     Função principal - executa suite de testes
     """
+    args = parse_args()
+    if args.stress:
+        passed = run_stress(args.targets or ['localhost:50051'], args.processes, args.threads,
+                            args.qps, args.duration, args.timeout, args.seed)
+        sys.exit(0 if passed else 1)
+    
     print("="*60)
     print("🧪 SUITE DE TESTES AUTOMATIZADOS")
     print("Calculadora Distribuída gRPC")
@@ -139,44 +1133,100 @@ def main():
     print("\n🚀 Iniciando testes...\n")
     time.sleep(1)
     
-    # Bateria de testes
-    tests = [
-        # Testes básicos
-        ("Adição básica (10 + 5)", runner.stub.Add, 10, 5, 15),
-        ("Subtração básica (10 - 5)", runner.stub.Sub, 10, 5, 5),
-        ("Multiplicação básica (10 * 5)", runner.stub.Mul, 10, 5, 50),
-        ("Divisão básica (10 / 5)", runner.stub.Div, 10, 5, 2.0),
-        
-        # Testes com negativos
-        ("Adição com negativos (-10 + 5)", runner.stub.Add, -10, 5, -5),
-        ("Subtração com negativos (-10 - -5)", runner.stub.Sub, -10, -5, -5),
-        ("Multiplicação com negativos (-10 * 5)", runner.stub.Mul, -10, 5, -50),
-        ("Divisão com negativos (-10 / 5)", runner.stub.Div, -10, 5, -2.0),
-        
-        # Testes com zero
-        ("Multiplicação por zero (10 * 0)", runner.stub.Mul, 10, 0, 0),
-        ("Adição com zero (10 + 0)", runner.stub.Add, 10, 0, 10),
-        
-        # Teste de divisão por zero (deve falhar)
-        ("Divisão por zero - DEVE FALHAR (10 / 0)", runner.stub.Div, 10, 0, None, True),
-        
-        # Testes com decimais
-        ("Divisão com decimais (7 / 3)", runner.stub.Div, 7, 3, 7/3),
-        ("Divisão exata (15 / 3)", runner.stub.Div, 15, 3, 5.0),
-        
-        # Testes com números grandes
-        ("Números grandes (999999 * 999999)", runner.stub.Mul, 999999, 999999, 999998000001),
-        ("Números grandes na divisão (1000000 / 1000)", runner.stub.Div, 1000000, 1000, 1000.0),
-        
-        # Testes edge cases
-        ("Subtração resultando em zero (5 - 5)", runner.stub.Sub, 5, 5, 0),
-        ("Multiplicação de decimais (2.5 * 4.5)", runner.stub.Mul, 2.5, 4.5, 11.25),
-        ("Divisão com resultado decimal (1 / 3)", runner.stub.Div, 1, 3, 1/3),
+    # Executa todos os testes
+    for name, method, *params in UNARY_CASES:
+        runner.run_test(name, getattr(runner.stub, method), *params)
+        time.sleep(0.5)  # Pausa entre testes
+    
+    # Prazo expirado antes da resposta
+    runner.run_deadline_test("Prazo expirado - DEVE FALHAR (Add com prazo de 1µs)", runner.stub.Add, 10, 5, 1e-6)
+    time.sleep(0.5)
+    
+    # Hedging não pode esconder um servidor travado do balanceador
+    runner.run_hedging_ejection_test("Ejeção de servidor travado com hedging")
+    time.sleep(0.5)
+    
+    # Bateria de testes em lote
+    batch_tests = [
+        ("Adição em lote", runner.stub.AddBatch, [1, 2, 3], [10, 20, 30], [11, 22, 33]),
+        ("Subtração em lote", runner.stub.SubBatch, [10, -10], [5, -5], [5, -5]),
+        ("Multiplicação em lote", runner.stub.MulBatch, [2.5, 999999], [4.5, 999999], [11.25, 999998000001]),
+        ("Divisão em lote com zero no meio", runner.stub.DivBatch, [10, 10, 7], [5, 0, 2], [2.0, 0, 3.5], [1]),
     ]
     
-    # Executa todos os testes
-    for test_params in tests:
-        runner.run_test(*test_params)
+    for test_params in batch_tests:
+        runner.run_batch_test(*test_params)
+        time.sleep(0.5)  # Pausa entre testes
+    
+    # Operação vetorial com operandos em bytes
+    runner.run_vector_test("Divisão vetorial (bytes) com zero no meio", calculator_pb2.DIV,
+                           [10, 10, 7], [5, 0, 2], [2.0, 0, 3.5], [1])
+    time.sleep(0.5)
+    runner.run_vector_status_test("Operação vetorial desconhecida - DEVE FALHAR (enum 99)", 99,
+                                  [1, 2], [3, 4], grpc.StatusCode.INVALID_ARGUMENT)
+    time.sleep(0.5)
+    
+    # Scatter-gather: shards de tamanhos iguais e um último shard menor
+    divisors = np.arange(10000) % 7
+    runner.run_scatter_test("Divisão scatter-gather (10000 elementos, shards de 1500)", 'div',
+                            np.arange(10000, dtype='<f8'), divisors, 1500)
+    time.sleep(0.5)
+    
+    # Teste do stream bidirecional (divisão por zero não encerra o stream)
+    runner.run_stream_test("Stream Compute com operações mistas", [
+        (calculator_pb2.ADD, 10, 5, 15),
+        (calculator_pb2.SUB, -10, -5, -5),
+        (calculator_pb2.MUL, 2.5, 4.5, 11.25),
+        (calculator_pb2.DIV, 10, 0, None),
+        (calculator_pb2.DIV, 7, 3, 7/3),
+    ])
+    time.sleep(0.5)
+    
+    # Stream de agregados: 1..100 dividido em blocos de tamanhos diferentes
+    runner.run_aggregate_test("Agregados de 1 a 100 em 3 blocos",
+                              [list(range(1, 11)), list(range(11, 61)), list(range(61, 101))],
+                              {'count': 100, 'sum': 5050, 'mean': 50.5, 'min': 1, 'max': 100,
+                               'variance': 833.25, 'sample_variance': 841.6666667})
+    time.sleep(0.5)
+    
+    # Conjunto de dados enviado uma vez e referenciado por handle
+    runner.run_dataset_test("Conjunto de dados por handle (upload, produto e agregados)",
+                            [[1, 2, 3], [4, 5]], [2, 2, 2, 2, -1], 15)
+    time.sleep(0.5)
+    
+    # Operações com matrizes em blocos de linhas
+    def block(rows, row=0):
+        data = np.asarray(rows, dtype='<f8')
+        return calculator_pb2.MatrixBlock(row=row, rows=data.shape[0], cols=data.shape[1], data=data.tobytes())
+    
+    runner.run_matrix_test("Produto de matrizes em 2 blocos (3x2 @ 2x2)", runner.stub.MatrixMultiply, [
+        calculator_pb2.MatrixMultiplyChunk(right=block([[1, 2], [3, 4]])),
+        calculator_pb2.MatrixMultiplyChunk(left=block([[1, 0], [0, 1]], row=0)),
+        calculator_pb2.MatrixMultiplyChunk(left=block([[2, 2]], row=2)),
+    ], [[1, 2], [3, 4], [8, 12]])
+    time.sleep(0.5)
+    runner.run_matrix_test("Transposta em 2 blocos (3x2)", runner.stub.MatrixTranspose, [
+        block([[1, 2], [3, 4]], row=0),
+        block([[5, 6]], row=2),
+    ], [[1, 3, 5], [2, 4, 6]])
+    time.sleep(0.5)
+    runner.run_matrix_status_test("Soma com blocos de A e B em linhas diferentes - DEVE FALHAR",
+                                  runner.stub.MatrixAdd, [
+        calculator_pb2.MatrixAddChunk(a=block([[1, 2]], row=0), b=block([[3, 4]], row=512)),
+    ], grpc.StatusCode.INVALID_ARGUMENT)
+    time.sleep(0.5)
+    
+    # Testes de avaliação de expressões
+    evaluate_tests = [
+        ("Expressão com variáveis ((a+b)*c/d)", "(a+b)*c/d", {'a': 1, 'b': 2, 'c': 10, 'd': 4}, 7.5),
+        ("Mesma expressão (plano em cache)", "(a+b)*c/d", {'a': 2, 'b': 2, 'c': 3, 'd': -4}, -3.0),
+        ("Expressão com sinal unário (-x*2 + 1.5)", "-x*2 + 1.5", {'x': 3}, -4.5),
+        ("Expressão com divisão por zero - DEVE FALHAR", "a/(b-b)", {'a': 1, 'b': 2}, None, True),
+        ("Expressão com chamada de função - DEVE FALHAR", "__import__('os')", {}, None, True),
+    ]
+    
+    for test_params in evaluate_tests:
+        runner.run_evaluate_test(*test_params)
         time.sleep(0.5)  # Pausa entre testes
     
     # Imprime resumo